@@ -0,0 +1,73 @@
+"""
+Load test for AsyncGameService.
+
+Starts N concurrent games and, for every round, has both players of each game
+submit their moves at the same time. Reports make_move latency percentiles
+for the in-memory and the SQLite-backed asynchronous repositories.
+
+Usage:
+    python -m benchmarks.bench_async_game_service --games 10000 --rounds 3
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from typing import List
+
+from src.application.services.async_game_service import AsyncGameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from src.infrastructure.repositories.async_sqlite_game_repository import AsyncSQLiteGameRepository
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def load(service: AsyncGameService, games: int, rounds: int) -> List[float]:
+    moves = list(Move)
+    latencies: List[float] = []
+
+    async def move(game_id: str, player_id: str) -> None:
+        start = time.perf_counter()
+        await service.make_move(game_id, player_id, random.choice(moves))
+        latencies.append(time.perf_counter() - start)
+
+    async def play(index: int) -> None:
+        game = await service.start_game(f"Alice{index}", f"Bob{index}")
+        for _ in range(rounds):
+            await asyncio.gather(move(game.id, game.player1.id), move(game.id, game.player2.id))
+
+    await asyncio.gather(*(play(index) for index in range(games)))
+    return latencies
+
+
+async def run(label: str, repository, games: int, rounds: int) -> None:
+    start = time.perf_counter()
+    latencies = await load(AsyncGameService(repository), games, rounds)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<22} {games:,} games: {len(latencies) / elapsed:>10,.0f} moves/s"
+        f"  p50 {percentile(latencies, 0.50) * 1e3:8.2f} ms"
+        f"  p99 {percentile(latencies, 0.99) * 1e3:8.2f} ms"
+    )
+
+
+async def main(games: int, rounds: int) -> None:
+    await run("in-memory", AsyncInMemoryGameRepository(), games, rounds)
+    with tempfile.TemporaryDirectory() as directory:
+        repository = AsyncSQLiteGameRepository(os.path.join(directory, "bench.db"), write_behind=True)
+        await run("sqlite (write-behind)", repository, games, rounds)
+        await repository.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.games, args.rounds))
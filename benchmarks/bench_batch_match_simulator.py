@@ -0,0 +1,50 @@
+"""
+Compare rounds per second of the vectorized BatchMatchSimulator against the
+scalar path of looping Game.make_move for computer-vs-computer play.
+
+Usage:
+    python -m benchmarks.bench_batch_match_simulator --games 100000 --rounds 100
+"""
+
+import argparse
+import random
+import time
+
+from src.application.services.batch_match_simulator import BatchMatchSimulator
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+
+
+def scalar_rounds_per_second(games: int, rounds: int) -> float:
+    matches = [Game(Player("Bot"), Player("Computer", is_computer=True)) for _ in range(games)]
+    start = time.perf_counter()
+    for game in matches:
+        player_id = game.player1.id
+        for _ in range(rounds):
+            game.make_move(player_id, random.choice(list(Move)))
+    return games * rounds / (time.perf_counter() - start)
+
+
+def batch_rounds_per_second(games: int, rounds: int) -> float:
+    simulator = BatchMatchSimulator(seed=0)
+    start = time.perf_counter()
+    simulator.simulate(games, rounds)
+    return games * rounds / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--scalar-games", type=int, default=2000, help="games for the (slow) scalar baseline")
+    args = parser.parse_args()
+
+    scalar = scalar_rounds_per_second(args.scalar_games, args.rounds)
+    batch = batch_rounds_per_second(args.games, args.rounds)
+    print(f"scalar Game.make_move : {scalar:>14,.0f} rounds/s")
+    print(f"BatchMatchSimulator   : {batch:>14,.0f} rounds/s ({batch / scalar:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
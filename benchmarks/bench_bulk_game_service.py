@@ -0,0 +1,79 @@
+"""
+Compare one-at-a-time GameService calls with the bulk start_games and apply_moves.
+
+Each run starts `--games` games and plays `--rounds` rounds in each of them,
+either through start_game/make_move or in batches of `--batch` moves.
+
+Usage:
+    python -m benchmarks.bench_bulk_game_service --games 2000 --rounds 3 --batch 500
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import Callable, Dict
+
+from src.application.interfaces.igame_repository import IGameRepository
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.event_sourced_game_repository import EventSourcedGameRepository
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+_REPOSITORIES: Dict[str, Callable[[str], IGameRepository]] = {
+    "in_memory": lambda directory: InMemoryGameRepository(),
+    "sqlite": lambda directory: SQLiteGameRepository(os.path.join(directory, "games.db")),
+    "event_sourced": lambda directory: EventSourcedGameRepository(os.path.join(directory, "games.log")),
+}
+
+
+def run(repository_name: str, games: int, rounds: int, batch: int) -> float:
+    """Return the number of calls (starts and moves) per second."""
+    with tempfile.TemporaryDirectory() as directory:
+        repository = _REPOSITORIES[repository_name](directory)
+        game_service = GameService(repository)
+        moves = list(Move)
+        start = time.perf_counter()
+        if batch == 1:
+            started = [game_service.start_game("Alice", "Bob") for _ in range(games)]
+            for _ in range(rounds):
+                for game in started:
+                    game_service.make_move(game.id, game.player1.id, random.choice(moves))
+                    game_service.make_move(game.id, game.player2.id, random.choice(moves))
+        else:
+            started = []
+            for offset in range(0, games, batch):
+                started.extend(game_service.start_games([("Alice", "Bob")] * min(batch, games - offset)))
+            plan = [
+                (game.id, player_id, random.choice(moves))
+                for _ in range(rounds)
+                for game in started
+                for player_id in (game.player1.id, game.player2.id)
+            ]
+            for offset in range(0, len(plan), batch):
+                game_service.apply_moves(plan[offset:offset + batch])
+        elapsed = time.perf_counter() - start
+        close = getattr(repository, "close", None)
+        if close is not None:
+            close()
+        return games * (1 + 2 * rounds) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batch", type=int, default=500, help="moves or games per bulk call")
+    parser.add_argument("--repository", choices=sorted(_REPOSITORIES), action="append")
+    args = parser.parse_args()
+
+    for repository_name in args.repository or list(_REPOSITORIES):
+        single = run(repository_name, args.games, args.rounds, 1)
+        bulk = run(repository_name, args.games, args.rounds, args.batch)
+        print(f"{repository_name:<14} single {single:>10,.0f} ops/s   bulk {bulk:>10,.0f} ops/s   {bulk / single:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure CachingGameRepository in front of SQLiteGameRepository.
+
+A fixed set of games is played through GameService, with moves drawn from
+a skewed distribution so a small hot set of games gets most of the traffic.
+Each move is one get and one save. The same workload runs against SQLite
+directly and through the cache in write-through and write-back mode. The
+write-back time includes the final flush.
+
+Usage:
+    python -m benchmarks.bench_caching_game_repository --games 5000 --moves 20000 --capacity 500
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from typing import List, Optional, Tuple
+
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.caching_game_repository import CachingGameRepository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+
+def run(games: int, plan: List[Tuple[int, Move]], capacity: int, mode: Optional[str]) -> Tuple[float, str]:
+    with tempfile.TemporaryDirectory() as directory:
+        backing = SQLiteGameRepository(os.path.join(directory, "bench.db"))
+        repository = backing if mode is None else CachingGameRepository(
+            backing, capacity=capacity, write_back=mode == "write-back"
+        )
+        game_service = GameService(repository)
+        started = [game_service.start_game("Player", "Computer", vs_computer=True) for _ in range(games)]
+        ids = [(game.id, game.player1.id) for game in started]
+
+        start = time.perf_counter()
+        for index, move in plan:
+            game_id, player_id = ids[index]
+            game_service.make_move(game_id, player_id, move)
+        repository.close()
+        elapsed = time.perf_counter() - start
+
+        detail = ""
+        if mode is not None:
+            stats = repository.stats
+            detail = f"hit rate {stats.hit_rate:6.1%}, {stats.writes:,} writes"
+        return len(plan) / elapsed, detail
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=5000)
+    parser.add_argument("--moves", type=int, default=20000)
+    parser.add_argument("--capacity", type=int, default=500, help="games kept by the cache")
+    parser.add_argument("--skew", type=float, default=1.2, help="Pareto shape of the game popularity")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    moves = list(Move)
+    plan = [(min(int(rng.paretovariate(args.skew)) - 1, args.games - 1), rng.choice(moves)) for _ in range(args.moves)]
+
+    for mode in (None, "write-through", "write-back"):
+        rate, detail = run(args.games, plan, args.capacity, mode)
+        print(f"{mode or 'uncached':<14} {rate:>10,.0f} moves/s  {detail}")
+
+
+if __name__ == "__main__":
+    main()
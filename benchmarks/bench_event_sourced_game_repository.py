@@ -0,0 +1,58 @@
+"""
+Show that the durable cost of a move stays flat as a match gets longer.
+
+Plays one long match through GameService on top of EventSourcedGameRepository
+and reports the average save latency and log growth per move for successive
+windows of rounds.
+
+Usage:
+    python -m benchmarks.bench_event_sourced_game_repository --rounds 20000 --window 5000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.event_sourced_game_repository import EventSourcedGameRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20000)
+    parser.add_argument("--window", type=int, default=5000)
+    parser.add_argument("--snapshot-interval", type=int, default=64)
+    parser.add_argument("--durable", action="store_true", help="fsync after every save")
+    args = parser.parse_args()
+
+    moves = list(Move)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "games.log")
+        repository = EventSourcedGameRepository(path, args.snapshot_interval, args.durable)
+        game_service = GameService(repository)
+        game = game_service.start_game("Player", "Computer", vs_computer=True)
+
+        for first_round in range(0, args.rounds, args.window):
+            size = os.path.getsize(path)
+            start = time.perf_counter()
+            for _ in range(args.window):
+                game_service.make_move(game.id, game.player1.id, random.choice(moves))
+            elapsed = time.perf_counter() - start
+            grown = os.path.getsize(path) - size
+            print(
+                f"rounds {first_round:>7}-{first_round + args.window:<7}"
+                f" {elapsed / args.window * 1e6:8.1f} us/move"
+                f" {grown / args.window:6.1f} log bytes/move"
+            )
+
+        start = time.perf_counter()
+        replayed = sum(1 for _ in repository.iter_events())
+        print(f"audit replay: {replayed:,} events in {time.perf_counter() - start:.3f}s")
+        repository.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Resident memory of finished games kept live versus moved to the archive.
+
+The same workload (first-to-N games played to completion through
+GameService) is run twice: once with every finished game left in
+InMemoryGameRepository, and once with an InMemoryGameArchive configured so
+that completed games are compacted into summaries and deleted from the
+repository.
+
+Usage:
+    python -m benchmarks.bench_game_archive --games 100000 --wins 3
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Optional
+
+from src.application.services.game_service import GameService
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_archive import InMemoryGameArchive
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+def play(games: int, wins: int, archive: Optional[InMemoryGameArchive]) -> float:
+    """Play `games` games to completion and return the traced memory per game."""
+    gc.collect()
+    tracemalloc.start()
+    repository = InMemoryGameRepository()
+    game_service = GameService(repository, archive=archive)
+    end_condition = FirstTo(wins)
+    for index in range(games):
+        game = game_service.start_game(f"player-{index % 1000}", f"player-{index % 997}", end_condition=end_condition)
+        for _ in range(wins):
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+            game_service.make_move(game.id, game.player2.id, Move.SCISSORS)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / games
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--wins", type=int, default=3)
+    args = parser.parse_args()
+
+    live = play(args.games, args.wins, None)
+    archived = play(args.games, args.wins, InMemoryGameArchive())
+    print(f"{args.games:,} completed games left in the repository: {live:8,.0f} bytes/game")
+    print(f"{args.games:,} completed games moved to the archive:    {archived:8,.0f} bytes/game")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Compare the binary game codec with pickle and JSON for size and speed.
+
+Games are played for a few rounds so every field is populated. JSON encodes
+the same live state as the codec, keyed by player ID as Game exposes it.
+
+Usage:
+    python -m benchmarks.bench_game_codec --games 20000 --rounds 3
+"""
+
+import argparse
+import json
+import pickle
+import random
+import time
+from typing import Callable, List
+
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.serialization.game_codec import decode_games, encode_games
+
+
+def to_json(games: List[Game]) -> bytes:
+    return json.dumps([
+        {
+            "id": game.id,
+            "status": game.status.value,
+            "round_number": game.round_number,
+            "players": [
+                {"id": player.id, "name": player.name, "is_computer": player.is_computer}
+                for player in (game.player1, game.player2)
+            ],
+            "scores": dict(game.scores),
+            "current_moves": {key: move and move.value for key, move in game.current_moves.items()},
+            "last_round_moves": {key: move.value for key, move in game.last_round_moves.items()},
+            "last_round_winner": game.last_round_winner,
+            "end_condition": None if game.end_condition is None else str(game.end_condition),
+        }
+        for game in games
+    ]).encode()
+
+
+def from_json(data: bytes) -> List[Game]:
+    games = []
+    for record in json.loads(data):
+        players = [Player(p["name"], is_computer=p["is_computer"], player_id=p["id"]) for p in record["players"]]
+        game = Game(players[0], players[1], game_id=record["id"])
+        game.round_number = record["round_number"]
+        game.scores = record["scores"]
+        game.current_moves = {key: value and Move(value) for key, value in record["current_moves"].items()}
+        if record["last_round_moves"]:
+            game.last_round_moves = {key: Move(value) for key, value in record["last_round_moves"].items()}
+        game.last_round_winner = record["last_round_winner"]
+        games.append(game)
+    return games
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    games = []
+    for _ in range(args.games):
+        game = Game(Player("Alice"), Player("Bob"))
+        for _ in range(args.rounds):
+            game.make_move(game.player1.id, random.choice(list(Move)))
+            game.make_move(game.player2.id, random.choice(list(Move)))
+        game.history = None  # Only the live state is compared
+        games.append(game)
+
+    formats = {
+        "binary": (encode_games, decode_games),
+        "pickle": (lambda items: pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (to_json, from_json),
+    }
+    print(f"{'format':<8}{'bytes/game':>12}{'encode':>14}{'decode':>14}")
+    for name, (encode, decode) in formats.items():
+        data = encode(games)
+        encode_time = best_of(args.repeat, lambda: encode(games))
+        decode_time = best_of(args.repeat, lambda: decode(data))
+        print(
+            f"{name:<8}{len(data) / args.games:>12,.1f}"
+            f"{encode_time / args.games * 1e9:>11,.0f} ns{decode_time / args.games * 1e9:>11,.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Report the resident memory cost of a live game held in InMemoryGameRepository.
+
+Games are started through GameService and played for a few rounds so that
+every per-game structure (scores, current and last round moves) is populated.
+
+Usage:
+    python -m benchmarks.bench_game_memory --games 100000 --rounds 3
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    gc.collect()
+    tracemalloc.start()
+    repository = InMemoryGameRepository()
+    game_service = GameService(repository)
+    for _ in range(args.games):
+        game = game_service.start_game("Alice", "Bob")
+        for _ in range(args.rounds):
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+            game_service.make_move(game.id, game.player2.id, Move.PAPER)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{args.games:,} live games: {current / args.games:,.0f} bytes/game")
+
+
+if __name__ == "__main__":
+    main()
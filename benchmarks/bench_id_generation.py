@@ -0,0 +1,49 @@
+"""
+Compare the cost of the ID generators, alone and when creating games.
+
+Usage:
+    python -m benchmarks.bench_id_generation --count 200000
+"""
+
+import argparse
+import time
+
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.id_generator import (
+    RandomUuidGenerator,
+    SnowflakeIdGenerator,
+    TimeOrderedIdGenerator,
+    set_id_generator,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200000)
+    args = parser.parse_args()
+
+    generators = {
+        "uuid4": RandomUuidGenerator(),
+        "time-ordered": TimeOrderedIdGenerator(),
+        "snowflake": SnowflakeIdGenerator(),
+    }
+    for name, generator in generators.items():
+        start = time.perf_counter()
+        for _ in range(args.count):
+            generator()
+        per_id = (time.perf_counter() - start) / args.count * 1e9
+
+        previous = set_id_generator(generator)
+        try:
+            start = time.perf_counter()
+            for _ in range(args.count // 10):
+                Game(Player("Alice"), Player("Bob"))
+            per_game = (time.perf_counter() - start) / (args.count // 10) * 1e9
+        finally:
+            set_id_generator(previous)
+        print(f"{name:<13} {per_id:>8,.0f} ns/id  {per_game:>8,.0f} ns/game (3 IDs)")
+
+
+if __name__ == "__main__":
+    main()
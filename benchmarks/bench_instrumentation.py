@@ -0,0 +1,70 @@
+"""
+Overhead of GameService instrumentation.
+
+Times the same human-vs-human workload three ways on InMemoryGameRepository:
+a GameService whose make_move has the instrumentation check stripped out
+(the baseline), GameService without metrics (instrumentation disabled) and
+GameService with a MetricsRegistry. Every
+run starts a fresh game, the variants are interleaved and the best of
+`--repeat` runs is reported, to filter out scheduling noise.
+
+Usage:
+    python -m benchmarks.bench_instrumentation --moves 100000 --repeat 15
+"""
+
+import argparse
+import time
+from typing import Callable, Dict
+
+from src.application.services.game_service import GameService
+from src.application.services.metrics_registry import MetricsRegistry
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+class UninstrumentedGameService(GameService):
+    """GameService.make_move as it would be without the `metrics is None` check."""
+
+    def make_move(self, game_id, player_id, move):
+        game = self.game_repository.get(game_id)
+        game.make_move(player_id, move)
+        return self._store_after_move(game)
+
+
+def through_service(service_type: type, metrics: bool) -> Callable[[int], float]:
+    def run(moves: int) -> float:
+        game_service = service_type(InMemoryGameRepository(), metrics=MetricsRegistry() if metrics else None)
+        game = game_service.start_game("Alice", "Bob")
+        seats = [(game.player1.id, Move.ROCK), (game.player2.id, Move.PAPER)]
+        game_id, make_move = game.id, game_service.make_move
+        start = time.perf_counter()
+        for index in range(moves):
+            player_id, move = seats[index & 1]
+            make_move(game_id, player_id, move)
+        return time.perf_counter() - start
+    return run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--moves", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    variants: Dict[str, Callable[[int], float]] = {
+        "baseline": through_service(UninstrumentedGameService, False),
+        "metrics disabled": through_service(GameService, False),
+        "metrics enabled": through_service(GameService, True),
+    }
+    best = {label: float("inf") for label in variants}
+    for _ in range(args.repeat):
+        for label, run in variants.items():
+            best[label] = min(best[label], run(args.moves))
+
+    baseline = best["baseline"]
+    for label, elapsed in best.items():
+        print(f"{label:<18}{elapsed / args.moves * 1e9:8.0f} ns/move  ({(elapsed - baseline) / baseline:+.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Leaderboard update and query latency with a large player population.
+
+Registers `--players` players, then times recording random results
+(two skip-list moves each) and top-K / rank-of-player queries against the
+full population.
+
+Usage:
+    python -m benchmarks.bench_leaderboard --players 1000000
+"""
+
+import argparse
+import random
+import time
+
+from src.application.services.leaderboard_service import LeaderboardService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=1000000)
+    parser.add_argument("--operations", type=int, default=100000)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"player-{index}" for index in range(args.players)]
+    leaderboard = LeaderboardService()
+
+    start = time.perf_counter()
+    for index in range(0, args.players - 1, 2):
+        leaderboard.record_result(names[index], names[index + 1], rng.choice((names[index], None)))
+    elapsed = time.perf_counter() - start
+    print(f"register {len(leaderboard):,} players   {elapsed:8.2f} s")
+
+    pairs = [rng.sample(names, 2) for _ in range(args.operations)]
+    start = time.perf_counter()
+    for player1, player2 in pairs:
+        leaderboard.record_result(player1, player2, player1)
+    elapsed = time.perf_counter() - start
+    print(f"record_result           {elapsed / args.operations * 1e6:8.1f} us/op")
+
+    queries = [rng.choice(names) for _ in range(args.operations)]
+    start = time.perf_counter()
+    for name in queries:
+        leaderboard.rank_of(name)
+    elapsed = time.perf_counter() - start
+    print(f"rank_of                 {elapsed / args.operations * 1e6:8.1f} us/op")
+
+    start = time.perf_counter()
+    for _ in range(args.operations // 10):
+        leaderboard.top(args.top)
+    elapsed = time.perf_counter() - start
+    print(f"top({args.top})                 {elapsed / (args.operations // 10) * 1e6:8.1f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Matchmaking simulation with a large number of queued players.
+
+`--players` players with normally distributed ratings arrive at
+`--arrival-rate` players per simulated second. A matchmaking pass runs
+every simulated `--tick` seconds and starts its games through GameService
+on an InMemoryGameRepository. The report shows the wall-clock cost of
+joining and matching, and the simulated time-to-match distribution.
+
+Usage:
+    python -m benchmarks.bench_matchmaking --players 100000 --arrival-rate 20000
+"""
+
+import argparse
+import random
+import time
+
+from src.application.services.game_service import GameService
+from src.application.services.matchmaking_service import MatchmakingService
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+class SimulatedClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=100000)
+    parser.add_argument("--arrival-rate", type=int, default=20000)
+    parser.add_argument("--tick", type=float, default=0.5)
+    parser.add_argument("--batch-size", type=int, default=8192)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    players = [(f"player-{index}", rng.gauss(1500, 300)) for index in range(args.players)]
+    clock = SimulatedClock()
+    matchmaking = MatchmakingService(
+        GameService(InMemoryGameRepository()), batch_size=args.batch_size, clock=clock
+    )
+
+    per_tick = max(1, int(args.arrival_rate * args.tick))
+    join_seconds = match_seconds = 0.0
+    passes = games = peak_depth = 0
+    arrived = 0
+    while arrived < len(players) or matchmaking.metrics.queue_depth > 1:
+        start = time.perf_counter()
+        for name, rating in players[arrived:arrived + per_tick]:
+            matchmaking.join(name, rating)
+        join_seconds += time.perf_counter() - start
+        arrived = min(len(players), arrived + per_tick)
+        peak_depth = max(peak_depth, matchmaking.metrics.queue_depth)
+
+        start = time.perf_counter()
+        games += len(matchmaking.match())
+        match_seconds += time.perf_counter() - start
+        passes += 1
+        clock.now += args.tick
+
+    metrics = matchmaking.metrics
+    print(f"players               {args.players:,}")
+    print(f"join                  {join_seconds / args.players * 1e6:8.2f} us/player")
+    print(f"match (incl. start)   {match_seconds / max(games, 1) * 1e6:8.2f} us/game, {passes} passes")
+    print(f"games created         {games:,}")
+    print(f"peak queue depth      {peak_depth:,}")
+    print(f"time to match         mean {metrics.mean_time_to_match:.2f} s, p50 {metrics.p50_time_to_match:.2f} s, "
+          f"p99 {metrics.p99_time_to_match:.2f} s, max {metrics.max_time_to_match:.2f} s (simulated)")
+
+
+if __name__ == "__main__":
+    main()
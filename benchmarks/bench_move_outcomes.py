@@ -0,0 +1,60 @@
+"""
+Microbenchmarks for round resolution.
+
+Compares the previous dict-building Move.compare_moves against the
+precomputed outcome matrix, and measures RuleSet.compare for larger
+variants (Rock-Paper-Scissors-Lizard-Spock and odd-N cyclic games).
+
+Usage:
+    python -m benchmarks.bench_move_outcomes
+"""
+
+import random
+import timeit
+
+from src.domain.value_objects.move import Move
+from src.domain.value_objects.rule_set import ROCK_PAPER_SCISSORS_LIZARD_SPOCK, RuleSet
+
+NUMBER = 200000
+
+
+def dict_compare_moves(move1, move2):
+    """The original implementation, kept here as the baseline."""
+    rules = {
+        Move.ROCK: Move.SCISSORS,
+        Move.SCISSORS: Move.PAPER,
+        Move.PAPER: Move.ROCK,
+    }
+    if move1 == move2:
+        return 0
+    elif rules[move1] == move2:
+        return 1
+    else:
+        return -1
+
+
+def report(label: str, function, pairs) -> None:
+    iterator = iter(pairs * (NUMBER // len(pairs) + 1))
+    seconds = timeit.timeit(lambda: function(*next(iterator)), number=NUMBER)
+    print(f"{label:<52} {seconds / NUMBER * 1e9:8.1f} ns/call")
+
+
+def main() -> None:
+    moves = list(Move)
+    move_pairs = [(move1, move2) for move1 in moves for move2 in moves]
+    report("dict-building compare_moves (baseline)", dict_compare_moves, move_pairs)
+    report("Move.compare_moves (outcome matrix)", Move.compare_moves, move_pairs)
+
+    variants = [
+        ("rock-paper-scissors-lizard-spock", ROCK_PAPER_SCISSORS_LIZARD_SPOCK),
+        ("cyclic, 11 moves", RuleSet.cyclic([str(code) for code in range(11)])),
+        ("cyclic, 101 moves", RuleSet.cyclic([str(code) for code in range(101)])),
+    ]
+    for label, rules in variants:
+        codes = range(rules.size)
+        code_pairs = [(random.choice(codes), random.choice(codes)) for _ in range(1000)]
+        report(f"RuleSet.compare, {label}", rules.compare, code_pairs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Show how MultiplayerGame rounds scale with the number of seats.
+
+For every lobby size, all seats are human and commit a random move through
+make_move, so a round covers the N moves and the counting resolution. The
+pairwise column times what resolving the same round with compare_moves on
+every pair of seats would cost; it is skipped above `--pairwise-max` seats.
+
+Usage:
+    python -m benchmarks.bench_multiplayer_game --seats 2 10 100 1000 10000
+"""
+
+import argparse
+import random
+import time
+
+from src.domain.entities.multiplayer_game import MultiplayerGame
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+
+
+def time_rounds(seats: int, rounds: int) -> float:
+    """Seconds per round played through make_move."""
+    game = MultiplayerGame([Player(f"Player {index}") for index in range(seats)])
+    player_ids = [player.id for player in game.players]
+    plans = [[random.choice(list(Move)) for _ in range(seats)] for _ in range(rounds)]
+    start = time.perf_counter()
+    for plan in plans:
+        for player_id, move in zip(player_ids, plan):
+            game.make_move(player_id, move)
+    return (time.perf_counter() - start) / rounds
+
+
+def time_pairwise(seats: int, rounds: int) -> float:
+    """Seconds per round to score every seat by comparing it with every other seat."""
+    plans = [[random.choice(list(Move)) for _ in range(seats)] for _ in range(rounds)]
+    compare = Move.compare_moves
+    start = time.perf_counter()
+    for plan in plans:
+        margins = [0] * seats
+        for seat1 in range(seats):
+            move1 = plan[seat1]
+            for seat2 in range(seat1 + 1, seats):
+                result = compare(move1, plan[seat2])
+                margins[seat1] += result
+                margins[seat2] -= result
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seats", type=int, nargs="+", default=[2, 10, 100, 1000, 10000])
+    parser.add_argument("--moves", type=int, default=200000, help="moves played per lobby size")
+    parser.add_argument("--pairwise-max", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'seats':>7}{'round':>14}{'per seat':>12}{'pairwise':>14}")
+    for seats in args.seats:
+        rounds = max(3, args.moves // seats)
+        per_round = time_rounds(seats, rounds)
+        pairwise = "-"
+        if seats <= args.pairwise_max:
+            pairwise = f"{time_pairwise(seats, max(3, rounds // seats)) * 1e6:,.1f} us"
+        print(f"{seats:>7}{per_round * 1e6:>11,.1f} us{per_round / seats * 1e9:>9,.0f} ns{pairwise:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Scaling benchmark for ParallelMatchRunner.
+
+Plays the same batch of computer-vs-computer games with an increasing number
+of worker processes and reports rounds per second and speed-up over a single
+worker. Near-linear scaling needs as many idle cores as workers.
+
+Usage:
+    python -m benchmarks.bench_parallel_match_runner --games 20000 --rounds 50 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from src.application.services.parallel_match_runner import ParallelMatchRunner
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs available")
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        games = [Game(Player("Bot", is_computer=True), Player("Computer", is_computer=True)) for _ in range(args.games)]
+        with ParallelMatchRunner(workers=workers) as runner:
+            runner.run(games[:workers], rounds=1)  # Start the worker processes outside the timing
+            start = time.perf_counter()
+            runner.run(games, rounds=args.rounds, seed=0)
+            elapsed = time.perf_counter() - start
+        rate = args.games * args.rounds / elapsed
+        baseline = baseline or rate
+        print(f"{workers:>3} workers: {rate:>12,.0f} rounds/s  ({rate / baseline:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure recording and replaying games played in deterministic mode.
+
+Games between a human and a computer are played through a seeded
+GameService, as the interactive loop in src/main.py would, recorded with
+record_match and rebuilt with replay_match. Also reports the cost of
+creating a seeded stream per game and the size of the records.
+
+Usage:
+    python -m benchmarks.bench_replay --games 2000 --rounds 50
+"""
+
+import argparse
+import pickle
+import random
+import time
+
+from src.application.services.game_service import GameService
+from src.application.services.replay_service import record_match, replay_match
+from src.domain.value_objects.move import Move
+from src.domain.value_objects.rng_stream import RngStream
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    moves = list(Move)
+    plans = [[random.choice(moves) for _ in range(args.rounds)] for _ in range(args.games)]
+    rounds = args.games * args.rounds
+
+    start = time.perf_counter()
+    streams = RngStream(args.seed)
+    for index in range(args.games):
+        streams.spawn(index)
+    spawn = time.perf_counter() - start
+    print(f"spawn stream   {spawn / args.games * 1e6:>9.2f} us/game")
+
+    game_service = GameService(InMemoryGameRepository(), seed=args.seed)
+    start = time.perf_counter()
+    games = []
+    for plan in plans:
+        game = game_service.start_game("Alice", "Computer", vs_computer=True)
+        for move in plan:
+            game = game_service.make_move(game.id, game.player1.id, move)
+        games.append(game)
+    play = time.perf_counter() - start
+    print(f"play           {play / rounds * 1e6:>9.2f} us/round")
+
+    records = [record_match(game) for game in games]
+    size = len(pickle.dumps(records, protocol=pickle.HIGHEST_PROTOCOL)) / args.games
+    print(f"record         {size:>9,.0f} bytes/game (pickled)")
+
+    start = time.perf_counter()
+    replayed = [replay_match(record) for record in records]
+    replay = time.perf_counter() - start
+    print(f"replay         {replay / rounds * 1e6:>9.2f} us/round, {rounds / replay:,.0f} rounds/s")
+
+    assert all(
+        game.history.moves == copy.history.moves and game.scores[game.player1.id] == copy.scores[copy.player1.id]
+        for game, copy in zip(games, replayed)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Streaming export benchmark for RoundHistoryExporter.
+
+Fills a repository with played games, then exports every round to chunked
+CSV files and reports rows per second and the peak memory allocated by the
+export itself, which stays bounded by the chunk size.
+
+Usage:
+    python -m benchmarks.bench_round_history_export --games 100000 --rounds 10
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.infrastructure.export.round_history_exporter import RoundHistoryExporter
+from src.infrastructure.repositories.sharded_in_memory_game_repository import ShardedInMemoryGameRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--rows-per-file", type=int, default=250000)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    repository = ShardedInMemoryGameRepository()
+    for _ in range(args.games):
+        game = Game(Player("Bot", is_computer=True), Player("Computer", is_computer=True))
+        for _ in range(args.rounds):
+            game.play_computer_round()
+        repository.save(game)
+
+    exporter = RoundHistoryExporter(repository, args.rows_per_file, args.chunk_size)
+    with tempfile.TemporaryDirectory() as directory:
+        tracemalloc.start()
+        start = time.perf_counter()
+        paths = exporter.export(directory)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    rows = args.games * args.rounds
+    print(f"exported {rows:,} rounds into {len(paths)} files: {rows / elapsed:,.0f} rows/s")
+    print(f"peak memory allocated during export: {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Load generator for the newline-delimited JSON game server.
+
+Every simulated match uses two TCP connections, one per player. Player 1
+starts the game, player 2 joins it, then both submit a move each round and
+wait for the pushed round result. Reports rounds per second and move latency.
+
+By default an in-process server is started on an ephemeral port; pass
+--host/--port to target a server started with `python -m src.server`.
+
+Usage:
+    python -m benchmarks.bench_server_load --matches 1000 --rounds 10
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List, Optional
+
+from src.application.services.async_game_service import AsyncGameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from src.server import GameServer
+
+MOVES = [move.value for move in Move]
+
+
+class Client:
+    """Minimal client: sends one request at a time and keeps pushed events aside."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.events: List[dict] = []
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "Client":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, **fields) -> dict:
+        self.writer.write(json.dumps(fields).encode() + b"\n")
+        while True:
+            message = json.loads(await self.reader.readline())
+            if "event" not in message:
+                if not message["ok"]:
+                    raise RuntimeError(message["error"])
+                return message["game"]
+            self.events.append(message)
+
+    async def next_event(self) -> dict:
+        if self.events:
+            return self.events.pop(0)
+        return json.loads(await self.reader.readline())
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def play_match(host: str, port: int, rounds: int, latencies: List[float]) -> None:
+    player1 = await Client.connect(host, port)
+    player2 = await Client.connect(host, port)
+    game = await player1.request(op="start_game", player1_name="Alice", player2_name="Bob")
+    await player2.request(op="join", game_id=game["id"])
+    player_ids = [player["id"] for player in game["players"]]
+
+    async def play(client: Client, player_id: str) -> None:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await client.request(op="make_move", game_id=game["id"], player_id=player_id, move=random.choice(MOVES))
+            latencies.append(time.perf_counter() - start)
+            await client.next_event()  # Wait for the round result before moving again
+
+    await asyncio.gather(play(player1, player_ids[0]), play(player2, player_ids[1]))
+    await player1.close()
+    await player2.close()
+
+
+async def main(host: Optional[str], port: int, matches: int, rounds: int) -> None:
+    server = None
+    if host is None:
+        game_server = GameServer(AsyncGameService(AsyncInMemoryGameRepository()))
+        server = await asyncio.start_server(game_server.handle_connection, "127.0.0.1", 0, backlog=4096)
+        host, port = server.sockets[0].getsockname()[:2]
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(play_match(host, port, rounds, latencies) for _ in range(matches)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{matches:,} concurrent matches, {matches * rounds:,} rounds in {elapsed:.2f}s")
+    print(f"throughput: {matches * rounds / elapsed:,.0f} rounds/s, {len(latencies) / elapsed:,.0f} moves/s")
+    print(
+        f"move latency: p50 {latencies[len(latencies) // 2] * 1e3:.2f} ms,"
+        f" p99 {latencies[int(len(latencies) * 0.99)] * 1e3:.2f} ms"
+    )
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", help="target an external server instead of an in-process one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--matches", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.host, args.port, args.matches, args.rounds))
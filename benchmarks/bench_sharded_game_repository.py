@@ -0,0 +1,97 @@
+"""
+Multi-threaded repository benchmark.
+
+Worker threads play games through GameService (one get and one save per
+move) while a background thread keeps listing all games. Compares a plain
+InMemoryGameRepository guarded by one global lock with
+ShardedInMemoryGameRepository.
+
+Usage:
+    python -m benchmarks.bench_sharded_game_repository --threads 8 --games 2000 --rounds 5
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from src.application.interfaces.igame_repository import IGameRepository
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+from src.infrastructure.repositories.sharded_in_memory_game_repository import ShardedInMemoryGameRepository
+
+
+class GlobalLockRepository(IGameRepository):
+    """Baseline: the unsharded repository made thread-safe with a single lock."""
+
+    def __init__(self):
+        self._repository = InMemoryGameRepository()
+        self._lock = threading.Lock()
+
+    def save(self, game):
+        with self._lock:
+            self._repository.save(game)
+
+    def get(self, game_id):
+        with self._lock:
+            return self._repository.get(game_id)
+
+    def delete(self, game_id):
+        with self._lock:
+            self._repository.delete(game_id)
+
+    def list_all(self):
+        with self._lock:
+            return self._repository.list_all()
+
+
+def run(repository: IGameRepository, threads: int, games: int, rounds: int) -> tuple:
+    game_service = GameService(repository)
+    moves = list(Move)
+    done = threading.Event()
+    scans = [0]
+
+    def worker() -> None:
+        for _ in range(games):
+            game = game_service.start_game("Player", "Computer", vs_computer=True)
+            for _ in range(rounds):
+                game_service.make_move(game.id, game.player1.id, random.choice(moves))
+
+    def scanner() -> None:
+        while not done.is_set():
+            for _ in repository.list_all():
+                pass
+            scans[0] += 1
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    listing = threading.Thread(target=scanner)
+    start = time.perf_counter()
+    listing.start()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    listing.join()
+    return threads * games * (rounds + 1) / elapsed, scans[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--games", type=int, default=2000, help="games per thread")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, repository in (
+        ("global lock", GlobalLockRepository()),
+        ("sharded (64 shards)", ShardedInMemoryGameRepository()),
+    ):
+        rate, scans = run(repository, args.threads, args.games, args.rounds)
+        print(f"{label:<20} {args.threads} threads: {rate:>10,.0f} service calls/s, {scans} full list_all scans")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Measure the cold start of InMemoryGameRepository from a snapshot file.
+
+Fills a repository with games, writes a snapshot, then compares attaching
+to the snapshot (lazy start plus first lookups) with decoding every game up
+front through list_all.
+
+Usage:
+    python -m benchmarks.bench_snapshot_restart --games 1000000 --lookups 10000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--lookups", type=int, default=10000, help="random gets after the lazy start")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "games.snapshot")
+        repository = InMemoryGameRepository(snapshot_path=path)
+        moves = list(Move)
+        ids = []
+        for _ in range(args.games):
+            game = Game(Player("Alice"), Player("Bob"))
+            game.make_move(game.player1.id, random.choice(moves))
+            game.make_move(game.player2.id, random.choice(moves))
+            game.history = None
+            repository.save(game)
+            ids.append(game.id)
+
+        start = time.perf_counter()
+        repository.save_snapshot()
+        elapsed = time.perf_counter() - start
+        print(f"snapshot write  {elapsed:>9.2f} s   {os.path.getsize(path) / args.games:,.0f} bytes/game")
+        del repository
+
+        start = time.perf_counter()
+        lazy = InMemoryGameRepository(snapshot_path=path)
+        attach = time.perf_counter() - start
+        first_get = time.perf_counter()
+        lazy.get(ids[0])
+        first_get = time.perf_counter() - first_get
+        latencies = []
+        for game_id in random.sample(ids, min(args.lookups, len(ids))):
+            lookup = time.perf_counter()
+            lazy.get(game_id)
+            latencies.append(time.perf_counter() - lookup)
+        del lazy
+        print(f"lazy attach     {attach * 1e3:>9.2f} ms  first get {first_get * 1e6:,.0f} us, "
+              f"cold get median {statistics.median(latencies) * 1e6:,.1f} us")
+
+        start = time.perf_counter()
+        eager = InMemoryGameRepository(snapshot_path=path)
+        eager.list_all()
+        print(f"eager load      {time.perf_counter() - start:>9.2f} s")
+
+
+if __name__ == "__main__":
+    main()
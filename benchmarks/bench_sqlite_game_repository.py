@@ -0,0 +1,73 @@
+"""
+Measure SQLiteGameRepository saves per second under concurrent writers.
+
+Each writer thread starts games through GameService and plays rounds against
+the computer, so every move results in one repository save.
+
+Usage:
+    python -m benchmarks.bench_sqlite_game_repository --threads 8 --games 200 --rounds 5
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+
+def run(threads: int, games: int, rounds: int, write_behind: bool, pool_size: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = SQLiteGameRepository(
+            os.path.join(directory, "bench.db"),
+            pool_size=pool_size,
+            write_behind=write_behind,
+        )
+        game_service = GameService(repository)
+        moves = list(Move)
+        saves = [0] * threads
+        barrier = threading.Barrier(threads + 1)
+
+        def writer(index: int) -> None:
+            barrier.wait()
+            count = 0
+            for _ in range(games):
+                game = game_service.start_game("Player", "Computer", vs_computer=True)
+                count += 1
+                for _ in range(rounds):
+                    game_service.make_move(game.id, game.player1.id, random.choice(moves))
+                    count += 1
+            saves[index] = count
+
+        workers = [threading.Thread(target=writer, args=(index,)) for index in range(threads)]
+        for worker in workers:
+            worker.start()
+        barrier.wait()
+        start = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        repository.close()  # Includes the final flush in write-behind mode
+        elapsed = time.perf_counter() - start
+        return sum(saves) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--games", type=int, default=200, help="games started per thread")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds played per game")
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    for write_behind in (False, True):
+        mode = "write-behind" if write_behind else "write-through"
+        rate = run(args.threads, args.games, args.rounds, write_behind, args.pool_size)
+        print(f"{mode:<14} {args.threads} writers: {rate:>12,.0f} saves/s")
+
+
+if __name__ == "__main__":
+    main()
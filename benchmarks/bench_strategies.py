@@ -0,0 +1,46 @@
+"""
+Per-move decision latency of each computer strategy.
+
+Each strategy plays against a random opponent; the timing covers one
+`choose` plus one `observe` call, i.e. the full per-round cost of a bot.
+
+Usage:
+    python -m benchmarks.bench_strategies --rounds 200000
+"""
+
+import argparse
+import random
+import time
+
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.mixture_of_experts_strategy import MixtureOfExpertsStrategy
+from src.domain.strategies.strategy import RandomStrategy
+from src.domain.value_objects.move import Move
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    opponent_moves = [rng.choice(list(Move)) for _ in range(args.rounds)]
+    strategies = [
+        ("random", RandomStrategy()),
+        ("frequency", FrequencyStrategy()),
+        ("markov, order 1", MarkovStrategy(order=1)),
+        ("markov, order 3", MarkovStrategy(order=3)),
+        ("mixture of experts", MixtureOfExpertsStrategy()),
+    ]
+    for label, strategy in strategies:
+        choose, observe = strategy.choose, strategy.observe
+        start = time.perf_counter()
+        for opponent_move in opponent_moves:
+            observe(choose(rng), opponent_move)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<20} {elapsed / args.rounds * 1e9:8.0f} ns/move")
+
+
+if __name__ == "__main__":
+    main()
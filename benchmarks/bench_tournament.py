@@ -0,0 +1,52 @@
+"""
+Throughput of a round-robin tournament of computer players.
+
+Runs the same round robin with a thread pool and a process pool, with and
+without a checkpoint file, and reports matches per second. Bots are a mix of
+the built-in strategies.
+
+Usage:
+    python -m benchmarks.bench_tournament --entrants 64 --rounds 100 --workers 4
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from src.application.services.tournament_service import Entrant, RoundRobin, Tournament
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.strategy import RandomStrategy
+from src.domain.value_objects.end_condition import RoundCap
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entrants", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    strategies = [RandomStrategy, FrequencyStrategy, MarkovStrategy]
+    entrants = [Entrant(f"bot-{index}", strategies[index % len(strategies)]) for index in range(args.entrants)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        for executor in ("thread", "process"):
+            for checkpoint in (False, True):
+                path = os.path.join(directory, f"{executor}.ndjson") if checkpoint else None
+                tournament = Tournament(
+                    entrants, RoundRobin(), RoundCap(args.rounds),
+                    workers=args.workers, executor=executor, checkpoint_path=path,
+                )
+                start = time.perf_counter()
+                for _ in tournament.run():
+                    pass
+                elapsed = time.perf_counter() - start
+                label = f"{executor}{' + checkpoint' if checkpoint else ''}"
+                print(f"{label:<20} {tournament.completed_matches:,} matches  "
+                      f"{tournament.completed_matches / elapsed:10,.0f} matches/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Reproducible benchmark suite for the domain, service and repository layers.
+
+Every case is timed `--repeat` times over a fixed number of operations,
+with the random module seeded and the garbage collector paused, and the
+best and median nanoseconds per operation are saved as JSON together with
+the machine and interpreter they were measured on. With `--compare`, the
+results are checked against a stored baseline, and any case whose best
+time got slower by more than `--threshold` is reported as a regression
+(exit status 1).
+
+Usage:
+    python -m benchmarks.run_suite --output baseline.json
+    python -m benchmarks.run_suite --compare baseline.json --output current.json
+    python -m benchmarks.run_suite --compare baseline.json --results current.json
+    python -m benchmarks.run_suite --list
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from src.application.interfaces.igame_repository import IGameRepository
+from src.application.services.game_service import GameService
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.caching_game_repository import CachingGameRepository
+from src.infrastructure.repositories.event_sourced_game_repository import EventSourcedGameRepository
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+from src.infrastructure.repositories.sharded_in_memory_game_repository import ShardedInMemoryGameRepository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+# A case builds its fixture and returns (timed function, operations per call, cleanup)
+_Setup = Callable[[int], Tuple[Callable[[], None], int, Callable[[], None]]]
+
+CASES: Dict[str, _Setup] = {}
+
+_REPOSITORIES: Dict[str, Callable[[str], IGameRepository]] = {
+    "in_memory": lambda directory: InMemoryGameRepository(),
+    "sharded_in_memory": lambda directory: ShardedInMemoryGameRepository(),
+    "sqlite": lambda directory: SQLiteGameRepository(os.path.join(directory, "games.db")),
+    "sqlite_write_behind": lambda directory: SQLiteGameRepository(
+        os.path.join(directory, "games.db"), write_behind=True
+    ),
+    "sqlite_cached": lambda directory: CachingGameRepository(
+        SQLiteGameRepository(os.path.join(directory, "games.db")), write_back=True
+    ),
+    "event_sourced": lambda directory: EventSourcedGameRepository(os.path.join(directory, "games.log")),
+}
+
+# Operations per timed call, before --scale; slow backends get fewer so every case takes similar time
+_OPERATIONS = {"in_memory": 20000, "sharded_in_memory": 20000, "sqlite": 500, "sqlite_write_behind": 5000,
+               "sqlite_cached": 5000, "event_sourced": 5000}
+
+
+def case(name: str) -> Callable[[_Setup], _Setup]:
+    """Register a benchmark case."""
+    def register(setup: _Setup) -> _Setup:
+        CASES[name] = setup
+        return setup
+    return register
+
+
+def _no_cleanup() -> None:
+    pass
+
+
+@case("domain.move.compare_moves")
+def _compare_moves(scale: int):
+    pairs = [(random.choice(list(Move)), random.choice(list(Move))) for _ in range(1000)]
+    compare = Move.compare_moves
+    repeat = 100 * scale
+
+    def run() -> None:
+        for _ in range(repeat):
+            for move1, move2 in pairs:
+                compare(move1, move2)
+    return run, repeat * len(pairs), _no_cleanup
+
+
+@case("domain.game.make_move.human")
+def _make_move_human(scale: int):
+    moves = 20000 * scale
+    plan = [(index & 1, random.choice(list(Move))) for index in range(moves)]
+
+    def run() -> None:
+        game = Game(Player("Alice"), Player("Bob"))
+        seats = (game.player1.id, game.player2.id)
+        for seat, move in plan:
+            game.make_move(seats[seat], move)
+    return run, moves, _no_cleanup
+
+
+@case("domain.game.make_move.computer")
+def _make_move_computer(scale: int):
+    moves = 20000 * scale
+    plan = [random.choice(list(Move)) for _ in range(moves)]
+
+    def run() -> None:
+        game = Game(Player("Alice"), Player("Computer", is_computer=True))
+        player_id = game.player1.id
+        for move in plan:
+            game.make_move(player_id, move)
+    return run, moves, _no_cleanup
+
+
+@case("domain.game.play_computer_round")
+def _play_computer_round(scale: int):
+    rounds = 20000 * scale
+
+    def run() -> None:
+        game = Game(Player("A", is_computer=True), Player("B", is_computer=True))
+        for _ in range(rounds):
+            game.play_computer_round()
+    return run, rounds, _no_cleanup
+
+
+def _service_cases(repository_name: str) -> None:
+    operations = _OPERATIONS[repository_name]
+
+    @case(f"service.start_game.{repository_name}")
+    def _start_game(scale: int):
+        directory = tempfile.TemporaryDirectory()
+        repository = _REPOSITORIES[repository_name](directory.name)
+        game_service = GameService(repository)
+        count = operations * scale
+
+        def run() -> None:
+            for _ in range(count):
+                game_service.start_game("Alice", "Bob")
+        return run, count, lambda: _close(repository, directory)
+
+    @case(f"service.make_move.{repository_name}")
+    def _make_move(scale: int):
+        directory = tempfile.TemporaryDirectory()
+        repository = _REPOSITORIES[repository_name](directory.name)
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Bob")
+        count = operations * scale
+        plan = [((game.player1.id, game.player2.id)[index & 1], random.choice(list(Move))) for index in range(count)]
+
+        def run() -> None:
+            for player_id, move in plan:
+                game_service.make_move(game.id, player_id, move)
+        return run, count, lambda: _close(repository, directory)
+
+    @case(f"repository.list_all.{repository_name}")
+    def _list_all(scale: int):
+        directory = tempfile.TemporaryDirectory()
+        repository = _REPOSITORIES[repository_name](directory.name)
+        game_service = GameService(repository)
+        count = 5 * operations * scale
+        for _ in range(count):
+            game = game_service.start_game("Alice", "Bob")
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+            game_service.make_move(game.id, game.player2.id, Move.PAPER)
+
+        def run() -> None:
+            for _ in repository.list_all():
+                pass
+        return run, count, lambda: _close(repository, directory)
+
+
+def _close(repository: IGameRepository, directory: tempfile.TemporaryDirectory) -> None:
+    close = getattr(repository, "close", None)
+    if close is not None:
+        close()
+    directory.cleanup()
+
+
+for _repository_name in _REPOSITORIES:
+    _service_cases(_repository_name)
+
+
+def measure(name: str, repeat: int, scale: int) -> dict:
+    """Time one case; returns best and median nanoseconds per operation."""
+    random.seed(0)
+    run, operations, cleanup = CASES[name](scale)
+    timings: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        run()  # Warm-up, also brings lazily created state to its steady size
+        gc.collect()
+        gc.disable()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        cleanup()
+    per_operation = [timing / operations * 1e9 for timing in timings]
+    return {
+        "best_ns": min(per_operation),
+        "median_ns": statistics.median(per_operation),
+        "operations": operations,
+        "repeat": repeat,
+    }
+
+
+def run_suite(names: List[str], repeat: int, scale: int) -> Iterator[Tuple[str, dict]]:
+    for name in names:
+        yield name, measure(name, repeat, scale)
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Print a comparison table and return the names of the cases that regressed."""
+    regressions = []
+    print(f"{'case':<45}{'baseline':>12}{'current':>12}{'change':>9}")
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<45}{'-':>12}{result['best_ns']:>10,.0f}ns{'new':>9}")
+            continue
+        change = result["best_ns"] / before["best_ns"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<45}{before['best_ns']:>10,.0f}ns{result['best_ns']:>10,.0f}ns{change:>+9.1%}{flag}")
+    if baseline.get("machine") != current.get("machine"):
+        print("warning: baseline was recorded on a different machine or interpreter")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="flag regressions against this results file")
+    parser.add_argument("--results", help="compare this results file instead of running the suite")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown that counts as a regression")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=int, default=1, help="multiply the operations of every case")
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.filter in name]
+    if args.list:
+        print("\n".join(names))
+        return
+
+    if args.results:
+        with open(args.results, encoding="utf-8") as results_file:
+            current = json.load(results_file)
+    else:
+        current = {
+            "machine": {
+                "python": sys.version.split()[0],
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "processor": platform.processor() or platform.machine(),
+                "cpus": os.cpu_count(),
+            },
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": args.repeat,
+            "scale": args.scale,
+            "results": {},
+        }
+        for name, result in run_suite(names, args.repeat, args.scale):
+            current["results"][name] = result
+            print(f"{name:<45}{result['best_ns']:>10,.0f} ns/op  (median {result['median_ns']:,.0f})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(current, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
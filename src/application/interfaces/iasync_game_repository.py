@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List
+from ...domain.entities.game import Game
+
+class IAsyncGameRepository(ABC):
+
+    @abstractmethod
+    async def save(self, game: Game):
+        """Save or update a game."""
+        pass
+
+    @abstractmethod
+    async def get(self, game_id: str) -> Game:
+        """Retrieve a game by its ID."""
+        pass
+
+    @abstractmethod
+    async def delete(self, game_id: str):
+        """Delete a game by its ID."""
+        pass
+
+    @abstractmethod
+    async def list_all(self) -> List[Game]:
+        """List all games."""
+        pass
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+from ...domain.entities.game_summary import GameSummary
+
+class IGameArchive(ABC):
+    """Cold storage for summaries of finished games."""
+
+    @abstractmethod
+    def add(self, summary: GameSummary):
+        """Archive the summary of a finished game."""
+        pass
+
+    @abstractmethod
+    def get(self, game_id: str) -> Optional[GameSummary]:
+        """Retrieve the summary of a game by its ID, or None if it was not archived."""
+        pass
+
+    @abstractmethod
+    def list_all(self) -> Iterable[GameSummary]:
+        """List all archived summaries, oldest first."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of archived games."""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, Iterable, Iterator
 from ...domain.entities.game import Game
 
 class IGameRepository(ABC):
@@ -20,6 +20,37 @@ class IGameRepository(ABC):
         pass
 
     @abstractmethod
-    def list_all(self) -> List[Game]:
-        """List all games."""
+    def list_all(self) -> Iterable[Game]:
+        """List all games. Implementations may return a lazy iterator instead of a list."""
         pass
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        """
+        Retrieve several games by ID, keyed by ID. Missing games are left out.
+
+        The default calls `get` once per ID; repositories that can read in bulk override it.
+        """
+        games = {}
+        for game_id in game_ids:
+            game = self.get(game_id)
+            if game is not None:
+                games[game_id] = game
+        return games
+
+    def iter_games(self) -> Iterator[Game]:
+        """
+        Iterate over all games, including their round history, for bulk reads such as exports.
+
+        The default iterates over `list_all`; repositories that can page through their storage
+        override it so that only one page of games is held in memory at a time.
+        """
+        return iter(self.list_all())
+
+    def save_many(self, games: Iterable[Game]):
+        """
+        Save or update several games.
+
+        The default calls `save` once per game; repositories that can write in bulk override it.
+        """
+        for game in games:
+            self.save(game)
@@ -0,0 +1,117 @@
+import asyncio
+import weakref
+from typing import Optional
+from ..interfaces.iasync_game_repository import IAsyncGameRepository
+from ..interfaces.igame_archive import IGameArchive
+from .leaderboard_service import LeaderboardService
+from ...domain.entities.player import Player
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.game_summary import GameSummary
+from ...domain.strategies.strategy import Strategy
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+
+class AsyncGameService:
+    """
+    Asynchronous counterpart of GameService for event-loop based front ends.
+
+    Moves on the same game are serialized with a per-game lock, so the
+    get -> make_move -> save sequence of one player can never interleave with
+    the other player's. Moves on different games run concurrently.
+    """
+
+    def __init__(
+        self,
+        game_repository: IAsyncGameRepository,
+        archive: Optional[IGameArchive] = None,
+        leaderboard: Optional[LeaderboardService] = None,
+    ):
+        """
+        Initialize the AsyncGameService with an asynchronous game repository.
+
+        Args:
+            game_repository (IAsyncGameRepository): The repository used for game data persistence.
+            archive (Optional[IGameArchive], optional): Where completed games are moved. Completed games stay in
+                the repository if omitted.
+            leaderboard (Optional[LeaderboardService], optional): Leaderboard that records every completed round.
+        """
+        self.game_repository = game_repository
+        self.archive = archive
+        self.leaderboard = leaderboard
+        # Locks disappear on their own once no coroutine holds or waits on them
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    async def start_game(
+        self,
+        player1_name: str,
+        player2_name: str,
+        vs_computer: bool = False,
+        computer_strategy: Optional[Strategy] = None,
+        end_condition: Optional[EndCondition] = None,
+        player1_id: Optional[str] = None,
+        player2_id: Optional[str] = None,
+    ) -> Game:
+        """
+        Start a new game with two players.
+
+        Args:
+            player1_name (str): The name of the first player.
+            player2_name (str): The name of the second player (or "Computer" if vs_computer is True).
+            vs_computer (bool, optional): Whether the second player is a computer. Defaults to False.
+            computer_strategy (Optional[Strategy], optional): How the computer picks its moves. Defaults to random.
+            end_condition (Optional[EndCondition], optional): When the game is over. Defaults to never.
+            player1_id (Optional[str], optional): Account key of the first player, reused across their games so
+                leaderboard ratings follow them. A new ID is generated if omitted.
+            player2_id (Optional[str], optional): Account key of the second player, ignored for a computer.
+
+        Returns:
+            Game: The newly created game instance.
+        """
+        player1 = Player(name=player1_name, player_id=player1_id)
+        if vs_computer:
+            player2 = Player(name="Computer", is_computer=True, strategy=computer_strategy)
+        else:
+            player2 = Player(name=player2_name, player_id=player2_id)
+
+        game = Game(player1=player1, player2=player2, end_condition=end_condition)
+        await self.game_repository.save(game)
+        return game
+
+    async def make_move(self, game_id: str, player_id: str, move: Move) -> Game:
+        """
+        Make a move in an existing game.
+
+        If the move completed the game and an archive is configured, the game
+        is summarized into the archive and deleted from the repository.
+
+        Args:
+            game_id (str): The ID of the game to make a move in.
+            player_id (str): The ID of the player making the move.
+            move (Move): The move being made by the player.
+
+        Returns:
+            Game: The updated game instance after the move has been made.
+
+        Raises:
+            ValueError: If the game does not exist.
+        """
+        async with self._lock_for(game_id):
+            game = await self.game_repository.get(game_id)
+            if game is None:
+                raise ValueError("Game not found.")
+            game.make_move(player_id, move)
+            if self.leaderboard is not None and not any(game.current_moves.values()):
+                self.leaderboard.record_round(game)
+            if self.archive is not None and game.status == GameStatus.COMPLETED:
+                self.archive.add(GameSummary.from_game(game))
+                await self.game_repository.delete(game.id)
+            else:
+                await self.game_repository.save(game)
+        return game
+
+    def _lock_for(self, game_id: str) -> asyncio.Lock:
+        lock = self._locks.get(game_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[game_id] = lock
+        return lock
@@ -0,0 +1,248 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ...domain.entities.game import Game, GameStatus
+from ...domain.strategies.strategy import RandomStrategy
+from ...domain.value_objects.end_condition import AnyOf, BestOf, EndCondition, FirstTo, RoundCap
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rule_set import CLASSIC
+
+MOVES = sorted(Move, key=lambda move: move.code)  # Indexed by Move.code
+
+# OUTCOMES[code1, code2] is Move.compare_moves for the moves with those codes
+OUTCOMES = np.array(CLASSIC.outcomes, dtype=np.int8)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a batch of simulated computer-vs-computer games.
+
+    All arrays are indexed by game position in the batch. Scores and rounds
+    count what happened during the simulation only. Winner seats are 0 for
+    player 1, 1 for player 2 and -1 for a tie or a game that played no round.
+    """
+    player1_scores: np.ndarray
+    player2_scores: np.ndarray
+    last_round_moves: np.ndarray  # shape (games, 2), move codes
+    last_round_winner: np.ndarray
+    rounds_played: np.ndarray  # Per game; fewer than requested for games that completed
+    completed: np.ndarray  # Per game: whether its end condition was met
+
+    @property
+    def statuses(self) -> List[GameStatus]:
+        """Status of every game, as `Game.status` would report it."""
+        return [GameStatus.COMPLETED if done else GameStatus.ONGOING for done in self.completed.tolist()]
+
+    def apply_to(self, games: Sequence[Game]) -> None:
+        """
+        Write the simulated scores, last round and status into the given games.
+
+        The result must have been simulated from the games' current state, as
+        `BatchMatchSimulator.simulate_games` does, for the end conditions to
+        have been evaluated on the right scores. Simulated rounds are not
+        recorded individually, so the games' round history restarts after the
+        simulated rounds.
+
+        Args:
+            games (Sequence[Game]): One game per simulated game, in batch order.
+        """
+        if len(games) != len(self.player1_scores):
+            raise ValueError("Expected one game per simulated game.")
+
+        player1_scores = self.player1_scores.tolist()
+        player2_scores = self.player2_scores.tolist()
+        last_moves = self.last_round_moves.tolist()
+        winners = self.last_round_winner.tolist()
+        rounds_played = self.rounds_played.tolist()
+        completed = self.completed.tolist()
+        for index, game in enumerate(games):
+            if not rounds_played[index]:
+                continue
+            player_ids = (game.player1.id, game.player2.id)
+            game.scores[player_ids[0]] += player1_scores[index]
+            game.scores[player_ids[1]] += player2_scores[index]
+            game.last_round_moves = {
+                player_ids[0]: Move.from_code(last_moves[index][0]),
+                player_ids[1]: Move.from_code(last_moves[index][1]),
+            }
+            winner = winners[index]
+            game.last_round_winner = None if winner < 0 else player_ids[winner]
+            game.round_number += rounds_played[index]
+            game.history = None  # Simulated rounds are not recorded one by one
+            if completed[index]:
+                game.status = GameStatus.COMPLETED
+
+
+def _is_met(condition: EndCondition, scores1: np.ndarray, scores2: np.ndarray, rounds: np.ndarray) -> np.ndarray:
+    """Vectorized EndCondition.is_met over arrays of scores and rounds played."""
+    if isinstance(condition, FirstTo):
+        return np.maximum(scores1, scores2) >= condition.wins
+    if isinstance(condition, BestOf):
+        return np.maximum(scores1, scores2) > condition.rounds // 2
+    if isinstance(condition, RoundCap):
+        return np.broadcast_to(rounds >= condition.rounds, scores1.shape)
+    if isinstance(condition, AnyOf):
+        met = np.zeros(scores1.shape, dtype=bool)
+        for part in condition.conditions:
+            met |= _is_met(part, scores1, scores2, rounds)
+        return met
+    # Unknown conditions are asked one game and round at a time
+    rounds = np.broadcast_to(rounds, scores1.shape)
+    return np.frompyfunc(lambda score1, score2, played: condition.is_met((score1, score2), played), 3, 1)(
+        scores1, scores2, rounds
+    ).astype(bool)
+
+
+class BatchMatchSimulator:
+    """
+    Vectorized simulator for large numbers of computer-vs-computer games.
+
+    Moves are encoded as small integers and every round of every game in a
+    batch is resolved at once with a lookup in the precomputed OUTCOMES table,
+    instead of calling `Game.make_move` move by move.
+
+    End conditions are evaluated on the running scores of every round, so a
+    game stops at the round that completes it, as it would when played
+    through `Game.play_computer_round`.
+    """
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        player1_probabilities: Optional[Sequence[float]] = None,
+        player2_probabilities: Optional[Sequence[float]] = None,
+        max_chunk_size: int = 1 << 22,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            seed (Optional[int]): Seed for the random generator, for reproducible batches.
+            player1_probabilities (Optional[Sequence[float]]): Probability of each move, indexed by Move.code, for player 1.
+                Moves are uniform if omitted.
+            player2_probabilities (Optional[Sequence[float]]): Same as above, for player 2.
+            max_chunk_size (int, optional): Maximum number of rounds (across all games) held in memory at once.
+        """
+        self._rng = np.random.default_rng(seed)
+        self._probabilities = (player1_probabilities, player2_probabilities)
+        self._max_chunk_size = max_chunk_size
+
+    def simulate(self, num_games: int, rounds: int, end_condition: Optional[EndCondition] = None) -> BatchResult:
+        """
+        Simulate up to `rounds` rounds of `num_games` independent new games.
+
+        Args:
+            num_games (int): Number of games in the batch.
+            rounds (int): Number of rounds played in every game that does not complete first.
+            end_condition (Optional[EndCondition], optional): When each game is over. Defaults to never.
+
+        Returns:
+            BatchResult: Per-game scores, last round, rounds played and completion.
+        """
+        zeros = np.zeros(num_games, dtype=np.int64)
+        return self._simulate(rounds, [end_condition] * num_games, zeros, zeros, zeros)
+
+    def simulate_games(self, games: Sequence[Game], rounds: int) -> BatchResult:
+        """
+        Simulate up to `rounds` rounds for each of the given games and update them in place.
+
+        Each game continues from its current scores and round number and stops
+        at the round that meets its own end condition. Moves are drawn from
+        this simulator's probabilities, uniform unless given, so only games
+        whose computers play the random strategy are accepted.
+
+        Args:
+            games (Sequence[Game]): The games to advance.
+            rounds (int): Number of rounds played in every game that does not complete first.
+
+        Returns:
+            BatchResult: The raw per-game result arrays.
+
+        Raises:
+            ValueError: If a game is already completed, or a computer in it plays another strategy than random.
+        """
+        if any(game.status != GameStatus.ONGOING for game in games):
+            raise ValueError("Completed games cannot be simulated.")
+        if any(
+            player.strategy is not None and not isinstance(player.strategy, RandomStrategy)
+            for game in games for player in (game.player1, game.player2)
+        ):
+            raise ValueError("Only games whose computers play the random strategy can be simulated.")
+        result = self._simulate(
+            rounds,
+            [game.end_condition for game in games],
+            np.array([game.scores[game.player1.id] for game in games], dtype=np.int64),
+            np.array([game.scores[game.player2.id] for game in games], dtype=np.int64),
+            np.array([game.round_number for game in games], dtype=np.int64),
+        )
+        result.apply_to(games)
+        return result
+
+    def _simulate(
+        self,
+        rounds: int,
+        end_conditions: Sequence[Optional[EndCondition]],
+        start_scores1: np.ndarray,
+        start_scores2: np.ndarray,
+        start_rounds: np.ndarray,
+    ) -> BatchResult:
+        num_games = len(end_conditions)
+        columns = np.arange(num_games)
+        scores1 = start_scores1.copy()
+        scores2 = start_scores2.copy()
+        played = np.zeros(num_games, dtype=np.int64)
+        completed = np.zeros(num_games, dtype=bool)
+        last_moves = np.zeros((num_games, 2), dtype=np.uint8)
+        last_winner = np.full(num_games, -1, dtype=np.int8)
+
+        # Games sharing an end condition are checked together
+        groups: Dict[EndCondition, List[int]] = {}
+        for index, condition in enumerate(end_conditions):
+            if condition is not None:
+                groups.setdefault(condition, []).append(index)
+        group_columns = [(condition, np.array(indexes)) for condition, indexes in groups.items()]
+
+        rounds_per_chunk = max(1, self._max_chunk_size // max(num_games, 1))
+        remaining = rounds
+        while remaining > 0 and not completed.all():
+            chunk = min(rounds_per_chunk, remaining)
+            moves1 = self._draw(self._probabilities[0], (chunk, num_games))
+            moves2 = self._draw(self._probabilities[1], (chunk, num_games))
+            outcomes = OUTCOMES[moves1, moves2]
+            running1 = scores1 + np.cumsum(outcomes == 1, axis=0)
+            running2 = scores2 + np.cumsum(outcomes == -1, axis=0)
+
+            # Rounds taken from this chunk: none for completed games, else up to the one that completes them
+            taken = np.where(completed, 0, chunk)
+            for condition, indexes in group_columns:
+                indexes = indexes[~completed[indexes]]
+                if not len(indexes):
+                    continue
+                rounds_so_far = (start_rounds + played)[indexes] + np.arange(1, chunk + 1)[:, None]
+                met = _is_met(condition, running1[:, indexes], running2[:, indexes], rounds_so_far)
+                hit = met.any(axis=0)
+                taken[indexes[hit]] = met[:, hit].argmax(axis=0) + 1
+                completed[indexes[hit]] = True
+
+            advanced = taken > 0
+            last = np.maximum(taken - 1, 0)
+            scores1 = np.where(advanced, running1[last, columns], scores1)
+            scores2 = np.where(advanced, running2[last, columns], scores2)
+            last_moves[advanced, 0] = moves1[last, columns][advanced]
+            last_moves[advanced, 1] = moves2[last, columns][advanced]
+            final_outcomes = outcomes[last, columns]
+            last_winner[advanced] = np.select([final_outcomes == 1, final_outcomes == -1], [0, 1], -1)[advanced]
+            played += taken
+            remaining -= chunk
+
+        return BatchResult(
+            scores1 - start_scores1, scores2 - start_scores2, last_moves, last_winner, played, completed,
+        )
+
+    def _draw(self, probabilities: Optional[Sequence[float]], shape: tuple) -> np.ndarray:
+        if probabilities is None:
+            return self._rng.integers(0, len(MOVES), size=shape, dtype=np.uint8)
+        return self._rng.choice(len(MOVES), size=shape, p=probabilities).astype(np.uint8)
@@ -1,7 +1,46 @@
+import itertools
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from ..interfaces.igame_archive import IGameArchive
 from ..interfaces.igame_repository import IGameRepository
+from .instrumented_game_repository import InstrumentedGameRepository
+from .leaderboard_service import LeaderboardService
+from .metrics_registry import MetricsRegistry
 from ...domain.entities.player import Player
-from ...domain.entities.game import Game
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.game_summary import GameSummary
+from ...domain.strategies.strategy import Strategy
+from ...domain.value_objects.end_condition import EndCondition
 from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+
+class _Instruments:
+    """The GameService metrics, resolved once so the hot path never looks them up by name."""
+
+    __slots__ = ("make_move_seconds", "game_make_move_seconds", "games_started", "games_completed", "rounds_played")
+
+    def __init__(self, metrics: MetricsRegistry):
+        self.make_move_seconds = metrics.histogram(
+            "make_move_seconds", "Latency of GameService.make_move in seconds, repository included."
+        )
+        self.game_make_move_seconds = metrics.histogram(
+            "game_make_move_seconds", "Latency of the domain logic in Game.make_move in seconds."
+        )
+        self.games_started = metrics.counter("games_started_total", "Games started.")
+        self.games_completed = metrics.counter("games_completed_total", "Games that met their end condition.")
+        self.rounds_played = metrics.counter("rounds_played_total", "Rounds completed.")
+
+class MoveResult(NamedTuple):
+    """Outcome of one move of a GameService.apply_moves batch."""
+    game_id: str
+    player_id: str
+    move: Move
+    game: Optional[Game]  # The game after the move, None if it was not found
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
 class GameService:
     """
@@ -11,16 +50,54 @@ class GameService:
     using a game repository for data persistence.
     """
 
-    def __init__(self, game_repository: IGameRepository):
+    def __init__(
+        self,
+        game_repository: IGameRepository,
+        leaderboard: Optional[LeaderboardService] = None,
+        archive: Optional[IGameArchive] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize the GameService with a game repository.
 
+        Instrumentation is opt-in: without a metrics registry, make_move only
+        pays for one `is None` check.
+
+        With a seed, the service runs in deterministic mode: the n-th game it
+        starts gets child stream n of an RngStream seeded with `seed`, so its
+        computer moves can be reproduced with replay_service.
+
         Args:
             game_repository (IGameRepository): The repository used for game data persistence.
+            leaderboard (Optional[LeaderboardService], optional): Leaderboard that records every completed round.
+            archive (Optional[IGameArchive], optional): Where completed games are moved. Completed games stay in
+                the repository if omitted.
+            metrics (Optional[MetricsRegistry], optional): Registry that records latencies, game and round counters
+                and repository hit/miss counts. The repository is wrapped in an InstrumentedGameRepository.
+            seed (Optional[int], optional): Root seed of the games' random streams. Computer moves use the global
+                `random` module if omitted.
         """
+        if metrics is not None:
+            game_repository = InstrumentedGameRepository(game_repository, metrics)
         self.game_repository = game_repository
+        self.leaderboard = leaderboard
+        self.archive = archive
+        self.metrics = metrics
+        self._instruments = None if metrics is None else _Instruments(metrics)
+        self._streams = None if seed is None else RngStream(seed)
+        self._games_started = itertools.count()
 
-    def start_game(self, player1_name: str, player2_name: str, vs_computer: bool = False) -> Game:
+    def start_game(
+        self,
+        player1_name: str,
+        player2_name: str,
+        vs_computer: bool = False,
+        computer_strategy: Optional[Strategy] = None,
+        end_condition: Optional[EndCondition] = None,
+        player1_id: Optional[str] = None,
+        player2_id: Optional[str] = None,
+    ) -> Game:
         """
         Start a new game with two players.
 
@@ -31,33 +108,94 @@ class GameService:
             player1_name (str): The name of the first player.
             player2_name (str): The name of the second player (or "Computer" if vs_computer is True).
             vs_computer (bool, optional): Whether the second player is a computer. Defaults to False.
+            computer_strategy (Optional[Strategy], optional): How the computer picks its moves. Defaults to random.
+            end_condition (Optional[EndCondition], optional): When the game is over. Defaults to never.
+            player1_id (Optional[str], optional): Account key of the first player, reused across their games so
+                leaderboard ratings follow them. A new ID is generated if omitted.
+            player2_id (Optional[str], optional): Account key of the second player, ignored for a computer.
 
         Returns:
             Game: The newly created game instance.
         """
         # Create the first player
-        player1 = Player(name=player1_name)
+        player1 = Player(name=player1_name, player_id=player1_id)
 
         # Create the second player, either human or computer
         if vs_computer:
-            player2 = Player(name="Computer", is_computer=True)
+            player2 = Player(name="Computer", is_computer=True, strategy=computer_strategy)
         else:
-            player2 = Player(name=player2_name)
+            player2 = Player(name=player2_name, player_id=player2_id)
 
         # Initialize a new game with the two players
-        game = Game(player1=player1, player2=player2)
+        game = Game(player1=player1, player2=player2, end_condition=end_condition, rng=self._next_rng())
 
         # Save the initial game state to the repository
         self.game_repository.save(game)
 
+        if self._instruments is not None:
+            self._instruments.games_started.increment()
+
         return game
 
+    def start_games(
+        self,
+        pairings: Iterable[Tuple[str, str]],
+        vs_computer: bool = False,
+        computer_strategy_factory: Optional[Callable[[], Strategy]] = None,
+        end_condition: Optional[EndCondition] = None,
+        player_ids: Optional[Sequence[Tuple[Optional[str], Optional[str]]]] = None,
+    ) -> List[Game]:
+        """
+        Start several games and save them with a single bulk write.
+
+        Args:
+            pairings (Iterable[Tuple[str, str]]): The player names of each game.
+            vs_computer (bool, optional): Whether the second player of every game is a computer. Defaults to False.
+            computer_strategy_factory (Optional[Callable[[], Strategy]], optional): Creates the strategy of each
+                computer. It is called once per game, so adaptive strategies do not share a model. Defaults to random.
+            end_condition (Optional[EndCondition], optional): When each game is over. Defaults to never.
+            player_ids (Optional[Sequence[Tuple[Optional[str], Optional[str]]]], optional): Account keys of each
+                game's players, in the order of the pairings, as in `start_game`. New IDs are generated if omitted.
+
+        Returns:
+            List[Game]: The new games, in the order of the pairings.
+
+        Raises:
+            ValueError: If `player_ids` and `pairings` differ in length.
+        """
+        pairings = list(pairings)
+        if player_ids is None:
+            player_ids = [(None, None)] * len(pairings)
+        elif len(player_ids) != len(pairings):
+            raise ValueError("There must be one pair of player IDs per pairing.")
+
+        games = []
+        for (player1_name, player2_name), (player1_id, player2_id) in zip(pairings, player_ids):
+            if vs_computer:
+                strategy = None if computer_strategy_factory is None else computer_strategy_factory()
+                player2 = Player(name="Computer", is_computer=True, strategy=strategy)
+            else:
+                player2 = Player(name=player2_name, player_id=player2_id)
+            games.append(Game(
+                player1=Player(name=player1_name, player_id=player1_id), player2=player2,
+                end_condition=end_condition, rng=self._next_rng(),
+            ))
+
+        self.game_repository.save_many(games)
+
+        if self._instruments is not None:
+            self._instruments.games_started.increment(len(games))
+
+        return games
+
     def make_move(self, game_id: str, player_id: str, move: Move) -> Game:
         """
         Make a move in an existing game.
 
         This method retrieves the game from the repository,
         applies the player's move and saves the updated game state.
+        If the move completed the game and an archive is configured, the game
+        is summarized into the archive and deleted from the repository instead.
 
         Args:
             game_id (str): The ID of the game to make a move in.
@@ -67,12 +205,105 @@ class GameService:
         Returns:
             Game: The updated game instance after the move has been made.
         """
+        if self._instruments is not None:
+            return self._measured_make_move(game_id, player_id, move)
+
         # Retrieve the current game state from the repository
         game = self.game_repository.get(game_id)
 
         # Apply the player's move to the game
         game.make_move(player_id, move)
 
+        return self._store_after_move(game)
+
+    def apply_moves(self, moves: Iterable[Tuple[str, str, Move]]) -> List[MoveResult]:
+        """
+        Apply a batch of moves with one bulk read and one bulk write.
+
+        Moves are applied in the given order, so several moves of the same game
+        play out as they would through make_move. A move that fails does not
+        stop the batch; its error is reported in its result and the game is
+        left as it was before that move. Games completed by the batch are
+        archived as in make_move, and later moves on them fail.
+
+        Args:
+            moves (Iterable[Tuple[str, str, Move]]): (game ID, player ID, move) of every move.
+
+        Returns:
+            List[MoveResult]: One result per move, in the same order.
+        """
+        moves = list(moves)
+        games = self.game_repository.get_many(dict.fromkeys(game_id for game_id, _, _ in moves))
+        rounds_before = {game_id: game.round_number for game_id, game in games.items()}
+        changed: Dict[str, Game] = {}
+        results = []
+        for game_id, player_id, move in moves:
+            game = games.get(game_id)
+            if game is None:
+                results.append(MoveResult(game_id, player_id, move, None, ValueError("Game not found.")))
+                continue
+            try:
+                game.make_move(player_id, move)
+            except Exception as error:
+                results.append(MoveResult(game_id, player_id, move, game, error))
+                continue
+            changed[game_id] = game
+            if self.leaderboard is not None and not any(game.current_moves.values()):
+                self.leaderboard.record_round(game)
+            results.append(MoveResult(game_id, player_id, move, game))
+
+        to_save = []
+        for game in changed.values():
+            completed = game.status == GameStatus.COMPLETED
+            if self._instruments is not None:
+                self._instruments.rounds_played.increment(game.round_number - rounds_before[game.id])
+                if completed:
+                    self._instruments.games_completed.increment()
+            if self.archive is not None and completed:
+                self.archive.add(GameSummary.from_game(game))
+                self.game_repository.delete(game.id)
+            else:
+                to_save.append(game)
+        self.game_repository.save_many(to_save)
+
+        return results
+
+    def _measured_make_move(self, game_id: str, player_id: str, move: Move) -> Game:
+        """make_move with every step measured; only used when metrics are enabled."""
+        instruments = self._instruments
+        start = perf_counter()
+        game = self.game_repository.get(game_id)  # Timed by the InstrumentedGameRepository
+
+        round_number = game.round_number
+        domain_start = perf_counter()
+        game.make_move(player_id, move)
+        instruments.game_make_move_seconds.observe(perf_counter() - domain_start)
+        if game.round_number != round_number:
+            instruments.rounds_played.increment(game.round_number - round_number)
+        if game.status == GameStatus.COMPLETED:
+            instruments.games_completed.increment()
+
+        self._store_after_move(game)
+        instruments.make_move_seconds.observe(perf_counter() - start)
+        return game
+
+    def _next_rng(self) -> Optional[RngStream]:
+        """Random stream of the next game started in deterministic mode, None otherwise."""
+        if self._streams is None:
+            return None
+        return self._streams.spawn(next(self._games_started))
+
+    def _store_after_move(self, game: Game) -> Game:
+        # Rank the players if the move completed a round
+        if self.leaderboard is not None and not any(game.current_moves.values()):
+            self.leaderboard.record_round(game)
+
+        # Move completed games out of the repository
+        if self.archive is not None and game.status == GameStatus.COMPLETED:
+            self.archive.add(GameSummary.from_game(game))
+            self.game_repository.delete(game.id)
+            return game
+
         # Save the updated game state to the repository
         self.game_repository.save(game)
 
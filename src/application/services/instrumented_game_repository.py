@@ -0,0 +1,76 @@
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, Optional
+
+from .metrics_registry import MetricsRegistry
+from ..interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game
+
+
+class InstrumentedGameRepository(IGameRepository):
+    """
+    Repository decorator that records latency and hit/miss counts.
+
+    Every call is forwarded to the wrapped repository; `get` is counted as a
+    hit when it finds the game and as a miss when it returns None, and
+    `get_many` counts one hit or miss per requested ID.
+    """
+
+    def __init__(self, repository: IGameRepository, metrics: MetricsRegistry):
+        """
+        Wrap a repository.
+
+        Args:
+            repository (IGameRepository): The repository to forward calls to.
+            metrics (MetricsRegistry): Registry the measurements are recorded in.
+        """
+        self.repository = repository
+        help_text = "Latency of game repository operations in seconds."
+        self._get_seconds = metrics.histogram("repository_operation_seconds", help_text, {"operation": "get"})
+        self._save_seconds = metrics.histogram("repository_operation_seconds", help_text, {"operation": "save"})
+        self._delete_seconds = metrics.histogram("repository_operation_seconds", help_text, {"operation": "delete"})
+        self._get_many_seconds = metrics.histogram(
+            "repository_operation_seconds", help_text, {"operation": "get_many"}
+        )
+        self._save_many_seconds = metrics.histogram(
+            "repository_operation_seconds", help_text, {"operation": "save_many"}
+        )
+        help_text = "Game repository lookups by result."
+        self._hits = metrics.counter("repository_lookups_total", help_text, {"result": "hit"})
+        self._misses = metrics.counter("repository_lookups_total", help_text, {"result": "miss"})
+
+    def save(self, game: Game):
+        start = perf_counter()
+        self.repository.save(game)
+        self._save_seconds.observe(perf_counter() - start)
+
+    def get(self, game_id: str) -> Optional[Game]:
+        start = perf_counter()
+        game = self.repository.get(game_id)
+        self._get_seconds.observe(perf_counter() - start)
+        (self._misses if game is None else self._hits).increment()
+        return game
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        game_ids = list(game_ids)
+        start = perf_counter()
+        games = self.repository.get_many(game_ids)
+        self._get_many_seconds.observe(perf_counter() - start)
+        self._hits.increment(len(games))
+        self._misses.increment(len(set(game_ids)) - len(games))
+        return games
+
+    def save_many(self, games: Iterable[Game]):
+        start = perf_counter()
+        self.repository.save_many(games)
+        self._save_many_seconds.observe(perf_counter() - start)
+
+    def delete(self, game_id: str):
+        start = perf_counter()
+        self.repository.delete(game_id)
+        self._delete_seconds.observe(perf_counter() - start)
+
+    def list_all(self) -> Iterable[Game]:
+        return self.repository.list_all()
+
+    def iter_games(self) -> Iterator[Game]:
+        return self.repository.iter_games()
@@ -0,0 +1,264 @@
+import random
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ...domain.entities.game import Game
+
+DEFAULT_RATING = 1500.0
+
+_MAX_LEVEL = 32
+
+_Key = Tuple[float, str]  # (-rating, player ID): best rating first, ties broken by ID
+
+
+class _Node:
+    __slots__ = ("key", "next", "width")
+
+    def __init__(self, key: Optional[_Key], level: int):
+        self.key = key
+        self.next: List[Optional["_Node"]] = [None] * level
+        self.width: List[int] = [1] * level  # Positions skipped by following next[level]
+
+
+class _IndexedSkipList:
+    """
+    Sorted set of unique keys with O(log n) insert, remove, rank and index lookup.
+
+    Every forward link stores how many positions it skips, so the position of a
+    key is the sum of the widths followed to reach it.
+    """
+
+    def __init__(self):
+        self._head = _Node(None, _MAX_LEVEL)
+        self._size = 0
+        self._level = 1  # Levels above this one are empty
+
+    def __len__(self) -> int:
+        return self._size
+
+    def insert(self, key: _Key) -> None:
+        update, positions = self._find(key)
+        position = positions[0] + 1  # Position of the new node; the head is at 0
+        level = self._random_level()
+        if level > self._level:
+            for index in range(self._level, level):
+                update.append(self._head)
+                positions.append(0)
+                self._head.width[index] = self._size + 1
+            self._level = level
+        node = _Node(key, level)
+        for index in range(level):
+            previous = update[index]
+            node.next[index] = previous.next[index]
+            previous.next[index] = node
+            node.width[index] = previous.width[index] + positions[index] + 1 - position
+            previous.width[index] = position - positions[index]
+        for index in range(level, self._level):
+            update[index].width[index] += 1
+        self._size += 1
+
+    def remove(self, key: _Key) -> None:
+        update, _ = self._find(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        for index in range(self._level):
+            previous = update[index]
+            if previous.next[index] is node:
+                previous.width[index] += node.width[index] - 1
+                previous.next[index] = node.next[index]
+            else:
+                previous.width[index] -= 1
+        self._size -= 1
+
+    def rank(self, key: _Key) -> int:
+        """0-based position of a key that is in the list."""
+        update, positions = self._find(key)
+        node = update[0].next[0]
+        if node is None or node.key != key:
+            raise KeyError(key)
+        return positions[0]
+
+    def iter_from(self, index: int) -> Iterator[_Key]:
+        """Iterate over the keys starting at the 0-based position `index`."""
+        remaining = index + 1
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        if node is self._head:
+            node = node.next[0]
+        while node is not None:
+            yield node.key
+            node = node.next[0]
+
+    def _find(self, key: _Key) -> Tuple[List[_Node], List[int]]:
+        """Last node before `key` on every level, and the position of each of those nodes."""
+        update: List[_Node] = [self._head] * self._level
+        positions = [0] * self._level
+        node = self._head
+        position = 0
+        for level in reversed(range(self._level)):
+            following = node.next[level]
+            while following is not None and following.key < key:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    @staticmethod
+    def _random_level() -> int:
+        # Each extra level with probability 1/2
+        bits = random.getrandbits(_MAX_LEVEL - 1) | (1 << (_MAX_LEVEL - 1))
+        return (bits & -bits).bit_length()
+
+
+class _PlayerStats:
+    __slots__ = ("name", "rating", "wins", "losses", "ties")
+
+    def __init__(self, name: str, rating: float):
+        self.name = name  # Display name, the latest one seen
+        self.rating = rating
+        self.wins = 0
+        self.losses = 0
+        self.ties = 0
+
+
+@dataclass(frozen=True)
+class PlayerStanding:
+    """A player's position on the leaderboard."""
+    name: str
+    rank: int  # 1 for the best rated player
+    rating: float
+    wins: int
+    losses: int
+    ties: int
+    player_id: str
+
+
+class LeaderboardService:
+    """
+    Incrementally maintained leaderboard with Elo ratings.
+
+    Players are identified by player ID, their account key; names are only
+    displayed. Every computer opponent and every pair of players who happen
+    to share a name are rated separately, and a player's rating carries over
+    to the games started with the same player ID (see `GameService.start_game`).
+    Each recorded result updates win/loss/tie counts and both players'
+    Elo ratings, and moves them within an indexable skip list ordered by
+    rating, so top-K and rank-of-player queries cost O(log n) rather than a
+    rescan of every game.
+    """
+
+    def __init__(self, initial_rating: float = DEFAULT_RATING, k_factor: float = 32.0):
+        """
+        Initialize an empty leaderboard.
+
+        Args:
+            initial_rating (float, optional): Rating of a player's first appearance. Defaults to 1500.
+            k_factor (float, optional): Maximum rating change per result. Defaults to 32.
+        """
+        self.initial_rating = initial_rating
+        self.k_factor = k_factor
+        self._players: Dict[str, _PlayerStats] = {}
+        self._ranking = _IndexedSkipList()
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def record_round(self, game: Game) -> None:
+        """Record the last completed round of a game."""
+        self.record_result(
+            game.player1.id, game.player2.id, game.last_round_winner, game.player1.name, game.player2.name,
+        )
+
+    def record_game(self, game: Game) -> None:
+        """Record the final result of a game: the player with the higher score wins."""
+        score1 = game.scores[game.player1.id]
+        score2 = game.scores[game.player2.id]
+        if score1 == score2:
+            winner = None
+        else:
+            winner = game.player1.id if score1 > score2 else game.player2.id
+        self.record_result(game.player1.id, game.player2.id, winner, game.player1.name, game.player2.name)
+
+    def record_result(
+        self,
+        player1: str,
+        player2: str,
+        winner: Optional[str],
+        player1_name: Optional[str] = None,
+        player2_name: Optional[str] = None,
+    ) -> None:
+        """
+        Record one result between two players.
+
+        Args:
+            player1 (str): ID of the first player.
+            player2 (str): ID of the second player.
+            winner (Optional[str]): ID of the winner, or None for a tie.
+            player1_name (Optional[str], optional): Display name of the first player. Defaults to the ID.
+            player2_name (Optional[str], optional): Display name of the second player. Defaults to the ID.
+        """
+        stats1 = self._stats(player1, player1_name)
+        stats2 = self._stats(player2, player2_name)
+        if winner is None:
+            stats1.ties += 1
+            stats2.ties += 1
+            score = 0.5
+        elif winner == player1:
+            stats1.wins += 1
+            stats2.losses += 1
+            score = 1.0
+        else:
+            stats1.losses += 1
+            stats2.wins += 1
+            score = 0.0
+
+        expected = 1.0 / (1.0 + 10.0 ** ((stats2.rating - stats1.rating) / 400.0))
+        delta = self.k_factor * (score - expected)
+        if delta:
+            self._rerate(player1, stats1, stats1.rating + delta)
+            self._rerate(player2, stats2, stats2.rating - delta)
+
+    def top(self, count: int) -> List[PlayerStanding]:
+        """The `count` best rated players, best first."""
+        standings = []
+        for rank, (_, player_id) in enumerate(self._ranking.iter_from(0), start=1):
+            if rank > count:
+                break
+            standings.append(self._standing(player_id, rank))
+        return standings
+
+    def rank_of(self, player_id: str) -> Optional[int]:
+        """1-based rank of a player, or None if the player has no results."""
+        stats = self._players.get(player_id)
+        if stats is None:
+            return None
+        return self._ranking.rank((-stats.rating, player_id)) + 1
+
+    def standing(self, player_id: str) -> Optional[PlayerStanding]:
+        """A player's full standing, or None if the player has no results."""
+        rank = self.rank_of(player_id)
+        return None if rank is None else self._standing(player_id, rank)
+
+    def _stats(self, player_id: str, name: Optional[str]) -> _PlayerStats:
+        stats = self._players.get(player_id)
+        if stats is None:
+            stats = self._players[player_id] = _PlayerStats(name or player_id, self.initial_rating)
+            self._ranking.insert((-stats.rating, player_id))
+        elif name:
+            stats.name = name
+        return stats
+
+    def _rerate(self, player_id: str, stats: _PlayerStats, rating: float) -> None:
+        self._ranking.remove((-stats.rating, player_id))
+        stats.rating = rating
+        self._ranking.insert((-rating, player_id))
+
+    def _standing(self, player_id: str, rank: int) -> PlayerStanding:
+        stats = self._players[player_id]
+        return PlayerStanding(stats.name, rank, stats.rating, stats.wins, stats.losses, stats.ties, player_id)
@@ -0,0 +1,224 @@
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from .game_service import GameService
+from .leaderboard_service import DEFAULT_RATING, LeaderboardService
+from ...domain.entities.game import Game
+from ...domain.value_objects.end_condition import EndCondition
+
+
+class _Ticket:
+    """A queued player."""
+
+    __slots__ = ("name", "rating", "bucket", "joined_at")
+
+    def __init__(self, name: str, rating: float, bucket: int, joined_at: float):
+        self.name = name
+        self.rating = rating
+        self.bucket = bucket
+        self.joined_at = joined_at
+
+
+@dataclass(frozen=True)
+class MatchmakingMetrics:
+    """Point-in-time view of the matchmaking queue."""
+    queue_depth: int
+    players_matched: int
+    games_created: int
+    mean_time_to_match: float  # Seconds, over every match so far
+    p50_time_to_match: float  # Seconds, over the most recent matches
+    p99_time_to_match: float
+    max_time_to_match: float
+
+
+class MatchmakingService:
+    """
+    Pairs queued players of similar rating and starts their games.
+
+    Players are queued FIFO in buckets of `bucket_width` rating points, so
+    `join` is O(1). Each `match` pass pairs players within their bucket first.
+    A player left without a partner accepts one more neighbouring bucket for
+    every `widen_interval` seconds of waiting, and anyone who has waited
+    `max_wait` seconds is paired with the nearest waiting player regardless of
+    rating, which bounds the time to match. The pairs of a pass are then
+    started together through `GameService.start_games`, i.e. saved with one
+    bulk write, at most `batch_size` games per pass.
+
+    Ratings come from the leaderboard when one is given, so the queue pairs
+    players by their current Elo. Queued names are account keys: matched
+    games give each player their name as player ID too, which is how the
+    leaderboard tells players apart and follows them from game to game.
+    """
+
+    def __init__(
+        self,
+        game_service: GameService,
+        leaderboard: Optional[LeaderboardService] = None,
+        bucket_width: float = 100.0,
+        widen_interval: float = 2.0,
+        max_wait: float = 10.0,
+        batch_size: int = 1024,
+        end_condition: Optional[EndCondition] = None,
+        clock: Callable[[], float] = time.monotonic,
+        latency_window: int = 10000,
+    ):
+        """
+        Initialize an empty queue.
+
+        Args:
+            game_service (GameService): Service used to start matched games.
+            leaderboard (Optional[LeaderboardService], optional): Source of player ratings.
+            bucket_width (float, optional): Rating points per bucket. Defaults to 100.
+            widen_interval (float, optional): Seconds of waiting before accepting one more bucket away. Defaults to 2.
+            max_wait (float, optional): Seconds after which rating is ignored. Defaults to 10.
+            batch_size (int, optional): Maximum number of games started per pass. Defaults to 1024.
+            end_condition (Optional[EndCondition], optional): End condition of every matched game.
+            clock (Callable[[], float], optional): Time source in seconds. Defaults to time.monotonic.
+            latency_window (int, optional): Number of recent matches the percentiles are computed over.
+        """
+        self.game_service = game_service
+        self.leaderboard = leaderboard
+        self.bucket_width = bucket_width
+        self.widen_interval = widen_interval
+        self.max_wait = max_wait
+        self.batch_size = batch_size
+        self.end_condition = end_condition
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, Deque[_Ticket]] = {}
+        self._tickets: Dict[str, _Ticket] = {}
+        self._players_matched = 0
+        self._games_created = 0
+        self._total_wait = 0.0
+        self._max_wait_seen = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=latency_window)
+
+    def join(self, name: str, rating: Optional[float] = None) -> None:
+        """
+        Queue a player.
+
+        Args:
+            name (str): The player's name.
+            rating (Optional[float]): The player's rating. Looked up on the leaderboard if omitted.
+
+        Raises:
+            ValueError: If the player is already queued.
+        """
+        if rating is None:
+            rating = self._rating_of(name)
+        bucket = math.floor(rating / self.bucket_width)
+        with self._lock:
+            if name in self._tickets:
+                raise ValueError("Player is already queued.")
+            ticket = self._tickets[name] = _Ticket(name, rating, bucket, self._clock())
+            queue = self._buckets.get(bucket)
+            if queue is None:
+                queue = self._buckets[bucket] = deque()
+            queue.append(ticket)
+
+    def leave(self, name: str) -> bool:
+        """Remove a player from the queue. Returns False if the player was not queued."""
+        with self._lock:
+            ticket = self._tickets.pop(name, None)
+            if ticket is None:
+                return False
+            queue = self._buckets[ticket.bucket]
+            queue.remove(ticket)
+            if not queue:
+                del self._buckets[ticket.bucket]
+            return True
+
+    def is_queued(self, name: str) -> bool:
+        """Whether a player is waiting for a match."""
+        return name in self._tickets
+
+    def match(self) -> List[Game]:
+        """
+        Run one matchmaking pass and start a game for every pair found.
+
+        Returns:
+            List[Game]: The games started, player1 being the player who waited longer.
+        """
+        now = self._clock()
+        with self._lock:
+            pairs = self._pair(now)
+            for ticket1, ticket2 in pairs:
+                del self._tickets[ticket1.name]
+                del self._tickets[ticket2.name]
+                for ticket in (ticket1, ticket2):
+                    wait = now - ticket.joined_at
+                    self._total_wait += wait
+                    self._max_wait_seen = max(self._max_wait_seen, wait)
+                    self._recent_waits.append(wait)
+            self._players_matched += 2 * len(pairs)
+            self._games_created += len(pairs)
+
+        if not pairs:
+            return []
+        names = [(ticket1.name, ticket2.name) for ticket1, ticket2 in pairs]
+        return self.game_service.start_games(names, end_condition=self.end_condition, player_ids=names)
+
+    @property
+    def metrics(self) -> MatchmakingMetrics:
+        """Queue depth and time-to-match statistics."""
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            matched = self._players_matched
+
+            def percentile(fraction: float) -> float:
+                return waits[min(len(waits) - 1, int(fraction * len(waits)))] if waits else 0.0
+
+            return MatchmakingMetrics(
+                queue_depth=len(self._tickets),
+                players_matched=matched,
+                games_created=self._games_created,
+                mean_time_to_match=self._total_wait / matched if matched else 0.0,
+                p50_time_to_match=percentile(0.5),
+                p99_time_to_match=percentile(0.99),
+                max_time_to_match=self._max_wait_seen,
+            )
+
+    def _rating_of(self, name: str) -> float:
+        if self.leaderboard is None:
+            return DEFAULT_RATING
+        standing = self.leaderboard.standing(name)
+        return self.leaderboard.initial_rating if standing is None else standing.rating
+
+    def _pair(self, now: float) -> List[Tuple[_Ticket, _Ticket]]:
+        """Take up to `batch_size` pairs off the queue; caller holds the lock."""
+        pairs: List[Tuple[_Ticket, _Ticket]] = []
+        leftovers: List[_Ticket] = []
+        for bucket in sorted(self._buckets):
+            queue = self._buckets[bucket]
+            while len(queue) >= 2 and len(pairs) < self.batch_size:
+                pairs.append((queue.popleft(), queue.popleft()))
+            if queue:
+                leftovers.append(queue[0])
+
+        # Pair the oldest player of neighbouring buckets once their waits allow it
+        index = 0
+        while index + 1 < len(leftovers) and len(pairs) < self.batch_size:
+            ticket1, ticket2 = leftovers[index], leftovers[index + 1]
+            tolerance = max(self._tolerance(ticket1, now), self._tolerance(ticket2, now))
+            if ticket2.bucket - ticket1.bucket <= tolerance:
+                self._buckets[ticket1.bucket].popleft()
+                self._buckets[ticket2.bucket].popleft()
+                pairs.append((ticket1, ticket2) if ticket1.joined_at <= ticket2.joined_at else (ticket2, ticket1))
+                index += 2
+            else:
+                index += 1
+
+        for bucket in [bucket for bucket, queue in self._buckets.items() if not queue]:
+            del self._buckets[bucket]
+        return pairs
+
+    def _tolerance(self, ticket: _Ticket, now: float) -> float:
+        """How many buckets away a ticket accepts a partner from."""
+        wait = now - ticket.joined_at
+        if wait >= self.max_wait:
+            return math.inf
+        return wait // self.widen_interval
@@ -0,0 +1,164 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds in seconds, from 1 microsecond to 1 second
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0,
+)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """
+    Monotonically increasing count.
+
+    Updates take no lock: they run on the request path, and an update lost
+    to a thread switch now and then is acceptable for monitoring.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def increment(self, amount: int = 1) -> None:
+        self.value += amount
+
+
+class Histogram:
+    """
+    Distribution of observed values over fixed buckets.
+
+    Only per-bucket counts and the sum are kept, so observing a value costs
+    one binary search and memory does not grow with traffic. Like Counter,
+    updates take no lock.
+    """
+
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # The last slot counts values above every bucket
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observed values."""
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    def quantile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the given quantile (inf if above every bucket)."""
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return self.buckets[index] if index < len(self.buckets) else float("inf")
+        return 0.0
+
+
+class MetricsRegistry:
+    """
+    Named counters and histograms, exportable as Prometheus text or a plain dict.
+
+    Instruments are created once and then updated directly, so the hot path
+    never looks anything up by name. A metric name may be registered with
+    several label sets, e.g. one latency histogram per repository operation.
+    """
+
+    def __init__(self, prefix: str = "rps_"):
+        """
+        Initialize an empty registry.
+
+        Args:
+            prefix (str, optional): Prepended to every metric name. Defaults to "rps_".
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}  # name -> (type, help)
+        self._counters: Dict[Tuple[str, _Labels], Counter] = {}
+        self._histograms: Dict[Tuple[str, _Labels], Histogram] = {}
+
+    def counter(self, name: str, help_text: str, labels: Optional[Dict[str, str]] = None) -> Counter:
+        """Get or create a counter."""
+        return self._instrument(self._counters, "counter", name, help_text, labels, Counter)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._instrument(self._histograms, "histogram", name, help_text, labels, lambda: Histogram(buckets))
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            for name, (metric_type, help_text) in self._help.items():
+                full_name = self.prefix + name
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {metric_type}")
+                if metric_type == "counter":
+                    for (counter_name, labels), counter in self._counters.items():
+                        if counter_name == name:
+                            lines.append(f"{full_name}{_format_labels(labels)} {counter.value}")
+                    continue
+                for (histogram_name, labels), histogram in self._histograms.items():
+                    if histogram_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{full_name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                    lines.append(f"{full_name}_sum{_format_labels(labels)} {histogram.sum!r}")
+                    lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self) -> dict:
+        """
+        Snapshot every metric as a JSON-serializable dict.
+
+        Counters map to their value; histograms to their count, sum, p50/p99
+        bucket bounds and per-bucket counts. Labelled metrics are keyed as
+        `name{label="value"}`.
+        """
+        snapshot = {}
+        with self._lock:
+            for (name, labels), counter in self._counters.items():
+                snapshot[self.prefix + name + _format_labels(labels)] = counter.value
+            for (name, labels), histogram in self._histograms.items():
+                snapshot[self.prefix + name + _format_labels(labels)] = {
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "p50": histogram.quantile(0.5),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": dict(zip([str(bound) for bound in histogram.buckets] + ["+Inf"], histogram.counts)),
+                }
+        return snapshot
+
+    def _instrument(self, instruments: dict, metric_type: str, name: str, help_text: str, labels, factory):
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            registered = self._help.setdefault(name, (metric_type, help_text))
+            if registered[0] != metric_type:
+                raise ValueError(f"Metric {name} is already registered as a {registered[0]}.")
+            instrument = instruments.get(key)
+            if instrument is None:
+                instrument = instruments[key] = factory()
+            return instrument
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in labels) + "}"
@@ -0,0 +1,204 @@
+import os
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+
+# Per-game result layout in shared memory, as parallel arrays:
+#   scores:        2 x uint32 (player1, player2 scores at the end of the run)
+#   rounds played: 1 x uint32 (rounds actually played, fewer if the game completed)
+#   last moves:    2 x uint8  (Move.code of the last round)
+#   last winner:   1 x int8   (0 or 1 for the winning seat, -1 for a tie)
+#   completed:     1 x uint8  (1 if the end condition was met)
+_SCORE_BYTES = 8
+_ROUNDS_BYTES = 4
+_MOVE_BYTES = 2
+_WINNER_BYTES = 1
+_COMPLETED_BYTES = 1
+_GAME_BYTES = _SCORE_BYTES + _ROUNDS_BYTES + _MOVE_BYTES + _WINNER_BYTES + _COMPLETED_BYTES
+
+_NO_MOVE = -1
+# index, game ID, players (with their strategies), end condition, round number, scores, current move codes
+_GameSpec = Tuple[int, str, Player, Player, Optional[EndCondition], int, Tuple[int, int], Tuple[int, int]]
+
+
+def owner_of(game_id: str, workers: int) -> int:
+    """Worker that owns a game. Stable across processes, unlike hash()."""
+    return zlib.crc32(game_id.encode()) % workers
+
+
+class ParallelMatchRunner:
+    """
+    Plays many games concurrently across a pool of worker processes.
+
+    Games are partitioned by `Game.id` so each game is always played by the
+    same worker. Workers rebuild their games from their current state (scores,
+    round number, moves already committed and end condition), play the
+    requested rounds (human seats pick random moves, computer seats play
+    their strategy) and stop a game as soon as it completes. The results are
+    written into shared-memory arrays indexed by game position, which the
+    parent then merges back into its own `Game` objects, status included.
+    Only the compact game specs cross the process boundary; results never get
+    pickled. Computer strategies learn in the worker only: the parent's
+    strategy objects are not updated.
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            workers (Optional[int]): Number of worker processes. Defaults to the number of CPUs.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def run(self, games: Sequence[Game], rounds: int, seed: Optional[int] = None) -> None:
+        """
+        Play `rounds` rounds in every game and update the games in place.
+
+        Args:
+            games (Sequence[Game]): The games to play.
+            rounds (int): Number of rounds to play in each game that does not complete first.
+            seed (Optional[int]): Root seed. The game at position i is played with child stream i of an
+                RngStream seeded with it, so the results do not depend on the number of workers.
+
+        Raises:
+            ValueError: If a game is already completed.
+        """
+        if any(game.status != GameStatus.ONGOING for game in games):
+            raise ValueError("Completed games cannot be played.")
+        if not games or rounds <= 0:
+            return
+
+        partitions: List[List[_GameSpec]] = [[] for _ in range(self.workers)]
+        for index, game in enumerate(games):
+            partitions[owner_of(game.id, self.workers)].append((
+                index, game.id, game.player1, game.player2, game.end_condition, game.round_number,
+                (game.scores[game.player1.id], game.scores[game.player2.id]),
+                tuple(_NO_MOVE if move is None else move.code for move in game.current_moves.values()),
+            ))
+
+        count = len(games)
+        memory = shared_memory.SharedMemory(create=True, size=count * _GAME_BYTES)
+        try:
+            futures = [
+                self._executor.submit(
+                    _play_partition, memory.name, count, partition, rounds, seed,
+                )
+                for partition in partitions if partition
+            ]
+            for future in futures:
+                future.result()
+            self._merge(memory, games)
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelMatchRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @staticmethod
+    def _merge(memory: shared_memory.SharedMemory, games: Sequence[Game]) -> None:
+        views = _views(memory, len(games))
+        scores, rounds_played, last_moves, winners, completed = views
+        try:
+            for index, game in enumerate(games):
+                played = rounds_played[index]
+                if not played:
+                    continue
+                player1_id, player2_id = game.player1.id, game.player2.id
+                game.scores = {player1_id: scores[2 * index], player2_id: scores[2 * index + 1]}
+                game.current_moves = {player1_id: None, player2_id: None}  # Every round played was completed
+                game.last_round_moves = {
+                    player1_id: Move.from_code(last_moves[2 * index]),
+                    player2_id: Move.from_code(last_moves[2 * index + 1]),
+                }
+                winner = winners[index]
+                game.last_round_winner = None if winner < 0 else (player1_id, player2_id)[winner]
+                game.round_number += played
+                game.history = None  # Rounds played in workers are not recorded one by one
+                if completed[index]:
+                    game.status = GameStatus.COMPLETED
+        finally:
+            for view in views:
+                view.release()
+
+
+def _views(memory: shared_memory.SharedMemory, count: int) -> tuple:
+    buffer = memory.buf
+    rounds_start = count * _SCORE_BYTES
+    moves_start = rounds_start + count * _ROUNDS_BYTES
+    winners_start = moves_start + count * _MOVE_BYTES
+    completed_start = winners_start + count * _WINNER_BYTES
+    return (
+        buffer[:rounds_start].cast("I"),
+        buffer[rounds_start:moves_start].cast("I"),
+        buffer[moves_start:winners_start],
+        buffer[winners_start:completed_start].cast("b"),
+        buffer[completed_start:completed_start + count * _COMPLETED_BYTES],
+    )
+
+
+def _play_partition(memory_name: str, count: int, specs: List[_GameSpec], rounds: int, seed: Optional[int]) -> None:
+    """Worker entry point: play the games of one partition and write their results."""
+    streams = None if seed is None else RngStream(seed)
+    moves = tuple(Move)
+
+    memory = shared_memory.SharedMemory(name=memory_name)
+    views = _views(memory, count)
+    scores, rounds_played, last_moves, winners, completed = views
+    try:
+        for index, game_id, player1, player2, end_condition, round_number, game_scores, current_codes in specs:
+            rng = None if streams is None else streams.spawn(index)
+            game = Game(player1, player2, game_id=game_id, end_condition=end_condition, rng=rng)
+            game.round_number = round_number
+            game.scores = {player1.id: game_scores[0], player2.id: game_scores[1]}
+            game.current_moves = {
+                player.id: None if code == _NO_MOVE else Move.from_code(code)
+                for player, code in zip((player1, player2), current_codes)
+            }
+            choice = (random if rng is None else rng).choice
+            humans = [player.id for player in (player1, player2) if not player.is_computer]
+            current_moves = game.current_moves
+            for _ in range(rounds):
+                if humans:
+                    for player_id in humans:
+                        if current_moves[player_id] is None:
+                            game.make_move(player_id, choice(moves))
+                else:
+                    game.play_computer_round()
+                if game.status != GameStatus.ONGOING:
+                    break
+
+            played = game.round_number - round_number
+            rounds_played[index] = played
+            completed[index] = game.status != GameStatus.ONGOING
+            if not played:
+                continue
+            final_scores = game.scores
+            scores[2 * index] = final_scores[player1.id]
+            scores[2 * index + 1] = final_scores[player2.id]
+            round_moves = game.last_round_moves
+            last_moves[2 * index] = round_moves[player1.id].code
+            last_moves[2 * index + 1] = round_moves[player2.id].code
+            winner = game.last_round_winner
+            winners[index] = -1 if winner is None else (0 if winner == player1.id else 1)
+    finally:
+        for view in views:
+            view.release()
+        memory.close()
@@ -0,0 +1,103 @@
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.strategies.strategy import Strategy
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+
+
+@dataclass(frozen=True)
+class MatchRecord:
+    """
+    Compact record of a game played with a seeded RngStream.
+
+    Besides the players and the end condition, a record only holds the seed
+    and path of the game's stream and one byte per round, packed as in
+    RoundHistory. The computer moves in `moves` are regenerated from the
+    seed on replay and serve as a check that the replay did not diverge.
+    """
+    seed: int
+    path: Tuple[int, ...]
+    player1: str
+    player2: str
+    player1_computer: bool
+    player2_computer: bool
+    moves: bytes  # Per round: player1 code << 4 | player2 code
+    end_condition: Optional[EndCondition] = None
+
+    @property
+    def rounds(self) -> int:
+        return len(self.moves)
+
+
+def record_match(game: Game) -> MatchRecord:
+    """
+    Capture a game as a replayable record.
+
+    A round in progress is not recorded.
+
+    Args:
+        game (Game): A game created with an RngStream, e.g. by a GameService in deterministic mode,
+            whose history covers every round.
+
+    Raises:
+        ValueError: If the game has no seeded stream or its history is incomplete.
+    """
+    if not isinstance(game.rng, RngStream):
+        raise ValueError("Only games played with an RngStream can be recorded.")
+    history = game.history
+    if history.first_round != 1 or len(history) != game.round_number:
+        raise ValueError("The game's history does not cover every round.")
+    return MatchRecord(
+        game.rng.root_seed, game.rng.path,
+        game.player1.name, game.player2.name, game.player1.is_computer, game.player2.is_computer,
+        history.moves.tobytes(), game.end_condition,
+    )
+
+
+def replay_match(record: MatchRecord, strategies: Sequence[Callable[[], Strategy]] = ()) -> Game:
+    """
+    Rebuild a recorded game by playing it again.
+
+    The human moves are fed to a new Game directly, with no repository or
+    service in between, while the computers draw their moves from a fresh
+    copy of the recorded stream. The result is a new game, with new IDs, in
+    the state the original game was in when it was recorded.
+
+    Args:
+        record (MatchRecord): The record to replay.
+        strategies (Sequence[Callable[[], Strategy]], optional): Factories of the computer strategies, in seat
+            order. They must create the strategies the original game was played with. Defaults to random.
+
+    Raises:
+        ValueError: If a regenerated computer move differs from the recorded one, i.e. the strategies do not
+            match, or the record goes on after the game ended.
+    """
+    factories = iter(strategies)
+    players = []
+    for name, is_computer in ((record.player1, record.player1_computer), (record.player2, record.player2_computer)):
+        factory = next(factories, None) if is_computer else None
+        players.append(Player(name, is_computer=is_computer, strategy=factory and factory()))
+    game = Game(players[0], players[1], end_condition=record.end_condition, rng=RngStream(record.seed, record.path))
+
+    humans = [(seat, player.id) for seat, player in enumerate(players) if not player.is_computer]
+    for packed in record.moves:
+        if game.status != GameStatus.ONGOING:
+            break  # Reported below
+        if humans:
+            for seat, player_id in humans:
+                game.make_move(player_id, Move.from_code(packed >> 4 if seat == 0 else packed & 0x0F))
+        else:
+            game.play_computer_round()
+
+    # Computer moves are checked once at the end, which keeps the loop tight
+    played = game.history.moves.tobytes()
+    if played != record.moves:
+        for round_number, (expected, actual) in enumerate(zip(record.moves, played), start=1):
+            if expected != actual:
+                raise ValueError(f"Replay diverged from the record in round {round_number}.")
+        raise ValueError(f"The record goes on after the game ended in round {game.round_number}.")
+    return game
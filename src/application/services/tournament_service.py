@@ -0,0 +1,497 @@
+import json
+import math
+import os
+import random
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.strategies.strategy import Strategy
+from ...domain.value_objects.end_condition import EndCondition, RoundCap
+from ...domain.value_objects.rng_stream import RngStream
+
+_Pairing = Tuple[int, Optional[int]]  # Entrant indexes; None as the second entrant is a bye
+_MatchSpec = Tuple[int, str, str, Callable[[], Strategy], Callable[[], Strategy], EndCondition, int, Optional[int]]
+_Outcome = Tuple[int, int, int, int, bool]  # match index, player1 score, player2 score, rounds played, capped
+
+
+@dataclass(frozen=True)
+class Entrant:
+    """
+    A computer player entered in a tournament.
+
+    `strategy` is called once per match so that adaptive strategies start every
+    match fresh. With a process pool it must be picklable, e.g. a Strategy
+    class or a functools.partial, not a lambda.
+    """
+    name: str
+    strategy: Callable[[], Strategy]
+
+
+@dataclass(frozen=True)
+class MatchResult:
+    """Final score of one tournament match."""
+    index: int  # Position of the match in the tournament schedule
+    round_number: int
+    player1: str
+    player2: str
+    player1_score: int
+    player2_score: int
+    rounds_played: int
+    capped: bool = False  # Stopped at the tournament's max_rounds before the end condition was met
+
+    @property
+    def winner(self) -> Optional[str]:
+        """Name of the winner, or None for a draw."""
+        if self.capped or self.player1_score == self.player2_score:
+            return None
+        return self.player1 if self.player1_score > self.player2_score else self.player2
+
+
+@dataclass(frozen=True)
+class Standing:
+    """An entrant's position in the tournament."""
+    rank: int
+    name: str
+    points: float  # 1 per match won or bye, 0.5 per draw
+    played: int
+    wins: int
+    draws: int
+    losses: int
+    round_difference: int  # Rounds won minus rounds lost, the first tiebreak
+
+
+class _Record:
+    __slots__ = ("wins", "draws", "losses", "byes", "rounds_won", "rounds_lost")
+
+    def __init__(self):
+        self.wins = self.draws = self.losses = self.byes = 0
+        self.rounds_won = self.rounds_lost = 0
+
+    @property
+    def points(self) -> float:
+        return self.wins + self.byes + 0.5 * self.draws
+
+
+class TournamentFormat(ABC):
+    """
+    Schedules the rounds of a tournament.
+
+    `rounds` is a generator that yields the pairings of one round at a time.
+    The tournament plays the whole round before asking for the next one, so
+    adaptive formats can pair on the results so far. Pairings must be
+    deterministic given those results, which is what makes checkpoints
+    resumable.
+    """
+
+    name = ""
+    depends_on_results = True
+    scores_byes = False
+
+    @abstractmethod
+    def rounds(self, tournament: "Tournament") -> Iterator[List[_Pairing]]:
+        """Yield the pairings of every round."""
+
+    @abstractmethod
+    def total_matches(self, entrants: int) -> int:
+        """Number of matches the tournament will play."""
+
+
+class RoundRobin(TournamentFormat):
+    """Every entrant meets every other entrant, `cycles` times, swapping seats every other cycle."""
+
+    name = "round_robin"
+    depends_on_results = False
+
+    def __init__(self, cycles: int = 1):
+        self.cycles = cycles
+
+    def rounds(self, tournament: "Tournament") -> Iterator[List[_Pairing]]:
+        # Circle method: entrant 0 stays put while the others rotate, so every
+        # entrant plays once per round. An odd field gets a dummy entrant (a bye).
+        count = len(tournament.entrants)
+        seats: List[Optional[int]] = list(range(count)) + ([None] if count % 2 else [])
+        for cycle in range(self.cycles):
+            rotation = seats[:]
+            for _ in range(len(seats) - 1):
+                pairings = []
+                for position in range(len(rotation) // 2):
+                    first, second = rotation[position], rotation[-1 - position]
+                    if first is None or second is None:
+                        continue  # Byes are not scored in a round robin
+                    pairings.append((second, first) if cycle % 2 else (first, second))
+                yield pairings
+                rotation = [rotation[0], rotation[-1]] + rotation[1:-1]
+
+    def total_matches(self, entrants: int) -> int:
+        return self.cycles * entrants * (entrants - 1) // 2
+
+
+class Swiss(TournamentFormat):
+    """
+    Entrants with the same points meet each other, without rematches when possible.
+
+    Defaults to ceil(log2(entrants)) rounds. With an odd field, the lowest
+    ranked entrant without a bye yet gets one, worth a win.
+    """
+
+    name = "swiss"
+    scores_byes = True
+
+    def __init__(self, rounds: Optional[int] = None):
+        self.round_count = rounds
+
+    def rounds(self, tournament: "Tournament") -> Iterator[List[_Pairing]]:
+        count = len(tournament.entrants)
+        had_bye: Set[int] = set()
+        for _ in range(self._round_count(count)):
+            order = tournament.ranking()
+            pairings: List[_Pairing] = []
+            if count % 2:
+                bye = next((entrant for entrant in reversed(order) if entrant not in had_bye), order[-1])
+                had_bye.add(bye)
+                order.remove(bye)
+                pairings.append((bye, None))
+            while order:
+                first = order.pop(0)
+                opponent = next((entrant for entrant in order if not tournament.have_met(first, entrant)), order[0])
+                order.remove(opponent)
+                pairings.append((first, opponent))
+            yield pairings
+
+    def total_matches(self, entrants: int) -> int:
+        return self._round_count(entrants) * (entrants // 2)
+
+    def _round_count(self, entrants: int) -> int:
+        return self.round_count or max(1, math.ceil(math.log2(max(entrants, 2))))
+
+
+class Knockout(TournamentFormat):
+    """
+    Single elimination in a seeded bracket; entrant order is seeding order.
+
+    Top seeds get byes when the field is not a power of two. A drawn match
+    is won by the better seeded entrant. Once the rounds are over, `champion`
+    is the index of the winner.
+    """
+
+    name = "knockout"
+
+    def __init__(self):
+        self.champion: Optional[int] = None
+
+    def rounds(self, tournament: "Tournament") -> Iterator[List[_Pairing]]:
+        count = len(tournament.entrants)
+        size = 1 << max(0, (count - 1).bit_length())
+        bracket = [0]
+        while len(bracket) < size:  # Standard bracket order: 1 v 8, 4 v 5, 2 v 7, 3 v 6, ...
+            bracket = [seed for top in bracket for seed in (top, 2 * len(bracket) - 1 - top)]
+        alive: List[Optional[int]] = [seed if seed < count else None for seed in bracket]
+
+        while len(alive) > 1:
+            pairings = [(alive[position], alive[position + 1]) for position in range(0, len(alive), 2)]
+            yield [
+                (first, second) if first is not None else (second, first)
+                for first, second in pairings if first is not None or second is not None
+            ]
+            alive = [self._winner(tournament, first, second) for first, second in pairings]
+        self.champion = alive[0]
+
+    def total_matches(self, entrants: int) -> int:
+        return max(0, entrants - 1)
+
+    @staticmethod
+    def _winner(tournament: "Tournament", first: Optional[int], second: Optional[int]) -> Optional[int]:
+        if first is None or second is None:
+            return second if first is None else first
+        points = tournament.points_between(first, second)
+        if points == tournament.points_between(second, first):
+            return min(first, second)
+        return first if points > tournament.points_between(second, first) else second
+
+
+class Tournament:
+    """
+    Plays a tournament of computer players.
+
+    Matches are `Game`s between two computer players, played with
+    `Game.play_computer_round` until the end condition is met. Bot matches
+    need no persistence, so they run on a pool of worker threads or
+    processes rather than through a repository, in chunks of
+    `chunk_size` matches. `run` yields each result as soon as its chunk
+    completes. Standings and the crosstable are kept up to date incrementally.
+
+    With a checkpoint path, every result is appended to a newline-delimited
+    JSON file. Running a tournament again with the same file replays the
+    recorded results and plays only the missing matches, so even a
+    tournament of millions of matches can resume after a crash.
+
+    With a seed, match i is played with child stream i of an RngStream
+    seeded with it, so the results are the same whatever the pool, the
+    number of workers and the order in which chunks complete.
+
+    A match that reaches `max_rounds` before its end condition is met, e.g.
+    two deterministic bots that always tie under FirstTo, is stopped there
+    and counts as a draw.
+    """
+
+    def __init__(
+        self,
+        entrants: Sequence[Entrant],
+        tournament_format: TournamentFormat,
+        end_condition: EndCondition = RoundCap(100),
+        workers: Optional[int] = None,
+        executor: str = "process",
+        chunk_size: int = 64,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every: int = 1000,
+        seed: Optional[int] = None,
+        max_rounds: int = 10000,
+    ):
+        """
+        Initialize a tournament.
+
+        Args:
+            entrants (Sequence[Entrant]): The entrants, best seed first. Names must be unique.
+            tournament_format (TournamentFormat): RoundRobin, Swiss or Knockout.
+            end_condition (EndCondition, optional): When a match is over. Defaults to 100 rounds.
+            workers (Optional[int]): Size of the pool. Defaults to the number of CPUs.
+            executor (str, optional): "process" or "thread". Defaults to "process".
+            chunk_size (int, optional): Matches sent to a worker at once. Defaults to 64.
+            checkpoint_path (Optional[str]): File results are appended to and resumed from.
+            checkpoint_every (int, optional): Results written between flushes of the checkpoint. Defaults to 1000.
+            seed (Optional[int]): Root seed of the match streams. Matches use the global `random` module if omitted.
+            max_rounds (int, optional): Rounds after which an unfinished match is stopped as a draw.
+                Defaults to 10000.
+
+        Raises:
+            ValueError: If entrant names are not unique, the executor is unknown or max_rounds is not positive.
+        """
+        if len({entrant.name for entrant in entrants}) != len(entrants):
+            raise ValueError("Entrant names must be unique.")
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Unknown executor: {executor}")
+        if max_rounds < 1:
+            raise ValueError("max_rounds must be positive.")
+        self.entrants = list(entrants)
+        self.format = tournament_format
+        self.end_condition = end_condition
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.seed = seed
+        self.max_rounds = max_rounds
+        self.completed_matches = 0
+        self.total_matches = tournament_format.total_matches(len(self.entrants))
+        self._records = [_Record() for _ in self.entrants]
+        self._points: Dict[Tuple[int, int], float] = {}  # (entrant, opponent) -> points scored against them
+        self._done = bytearray()  # Per match index: 1 once the result is recorded
+        self._replayed: Dict[int, _Outcome] = {}  # Checkpointed results not applied yet
+        self._checkpoint = None
+        self._unflushed = 0
+
+    def run(self) -> Iterator[MatchResult]:
+        """
+        Play every match that has no recorded result, yielding results as they complete.
+
+        Raises:
+            ValueError: If the checkpoint file belongs to a different tournament.
+        """
+        if self.checkpoint_path is not None:
+            self._open_checkpoint()
+        if self.executor == "process":
+            # Forked workers would otherwise share the parent's random state
+            pool = ProcessPoolExecutor(max_workers=self.workers, initializer=random.seed)
+        else:
+            pool = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            with pool:
+                index = 0
+                for round_number, pairings in enumerate(self.format.rounds(self), start=1):
+                    specs: List[_MatchSpec] = []
+                    players: Dict[int, Tuple[int, int]] = {}
+                    for first, second in pairings:
+                        if second is None:
+                            self._records[first].byes += self.format.scores_byes
+                            continue
+                        players[index] = (first, second)
+                        if self._is_done(index):
+                            pass
+                        elif index in self._replayed:
+                            self._record(index, round_number, first, second, self._replayed.pop(index), replayed=True)
+                        else:
+                            specs.append((
+                                index, self.entrants[first].name, self.entrants[second].name,
+                                self.entrants[first].strategy, self.entrants[second].strategy, self.end_condition,
+                                self.max_rounds, self.seed,
+                            ))
+                        index += 1
+                    yield from self._play(pool, round_number, specs, players)
+                    self._flush(force=True)
+        finally:
+            if self._checkpoint is not None:
+                self._checkpoint.close()
+                self._checkpoint = None
+
+    def standings(self) -> List[Standing]:
+        """Current standings, best first: points, then round difference, then seed."""
+        return [
+            Standing(
+                rank, self.entrants[entrant].name, record.points, record.wins + record.draws + record.losses,
+                record.wins, record.draws, record.losses, record.rounds_won - record.rounds_lost,
+            )
+            for rank, (entrant, record) in enumerate(
+                ((entrant, self._records[entrant]) for entrant in self.ranking()), start=1
+            )
+        ]
+
+    def crosstable(self) -> List[List[Optional[float]]]:
+        """
+        Points each entrant scored against each opponent, in entrant order.
+
+        Row i, column j holds entrant i's points against entrant j, summed over
+        their matches; None where they have not met.
+        """
+        count = len(self.entrants)
+        return [[self._points.get((row, column)) for column in range(count)] for row in range(count)]
+
+    def ranking(self) -> List[int]:
+        """Entrant indexes ordered as in `standings`."""
+        def key(entrant: int) -> tuple:
+            record = self._records[entrant]
+            return -record.points, record.rounds_lost - record.rounds_won, entrant
+        return sorted(range(len(self.entrants)), key=key)
+
+    def have_met(self, entrant: int, opponent: int) -> bool:
+        """Whether two entrants have played each other."""
+        return (entrant, opponent) in self._points
+
+    def points_between(self, entrant: int, opponent: int) -> float:
+        """Points an entrant scored against an opponent."""
+        return self._points.get((entrant, opponent), 0.0)
+
+    def _play(
+        self, pool: Executor, round_number: int, specs: List[_MatchSpec], players: Dict[int, Tuple[int, int]]
+    ) -> Iterator[MatchResult]:
+        chunks = [specs[start:start + self.chunk_size] for start in range(0, len(specs), self.chunk_size)]
+        chunks.reverse()
+        in_flight = set()
+        while chunks or in_flight:
+            while chunks and len(in_flight) < 2 * self.workers:  # Bound the results held in memory
+                in_flight.add(pool.submit(_play_matches, chunks.pop()))
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                for outcome in future.result():
+                    first, second = players[outcome[0]]
+                    yield self._record(outcome[0], round_number, first, second, outcome)
+
+    def _record(
+        self, index: int, round_number: int, first: int, second: int, outcome: _Outcome, replayed: bool = False
+    ) -> MatchResult:
+        _, score1, score2, rounds_played, capped = outcome
+        record1, record2 = self._records[first], self._records[second]
+        if capped:
+            record1.draws += 1
+            record2.draws += 1
+            points = 0.5
+        elif score1 > score2:
+            record1.wins += 1
+            record2.losses += 1
+            points = 1.0
+        elif score1 < score2:
+            record1.losses += 1
+            record2.wins += 1
+            points = 0.0
+        else:
+            record1.draws += 1
+            record2.draws += 1
+            points = 0.5
+        record1.rounds_won += score1
+        record1.rounds_lost += score2
+        record2.rounds_won += score2
+        record2.rounds_lost += score1
+        self._points[first, second] = self._points.get((first, second), 0.0) + points
+        self._points[second, first] = self._points.get((second, first), 0.0) + 1.0 - points
+
+        if len(self._done) <= index:
+            self._done.extend(bytes(index + 1 - len(self._done)))
+        self._done[index] = 1
+        self.completed_matches += 1
+        if self._checkpoint is not None and not replayed:
+            self._checkpoint.write(
+                json.dumps([index, round_number, first, second, score1, score2, rounds_played, capped]) + "\n"
+            )
+            self._flush()
+        return MatchResult(
+            index, round_number, self.entrants[first].name, self.entrants[second].name, score1, score2, rounds_played,
+            capped,
+        )
+
+    def _is_done(self, index: int) -> bool:
+        return index < len(self._done) and self._done[index] == 1
+
+    def _flush(self, force: bool = False) -> None:
+        if self._checkpoint is None:
+            return
+        self._unflushed += 1
+        if force or self._unflushed >= self.checkpoint_every:
+            self._checkpoint.flush()
+            self._unflushed = 0
+
+    def _header(self) -> dict:
+        header = {
+            "format": self.format.name,
+            "entrants": [entrant.name for entrant in self.entrants],
+            "end_condition": str(self.end_condition),
+        }
+        if self.seed is not None:  # Unseeded checkpoints keep their original header
+            header["seed"] = self.seed
+        return header
+
+    def _open_checkpoint(self) -> None:
+        """Replay the results recorded by a previous run and reopen the file for appending."""
+        header = self._header()
+        lines: List[bytes] = []
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path, "rb") as checkpoint:
+                data = checkpoint.read()
+            complete = data.rfind(b"\n") + 1  # Drop a line torn by a crash
+            if complete < len(data):
+                os.truncate(self.checkpoint_path, complete)
+            lines = data[:complete].splitlines()
+        if lines and json.loads(lines[0]) != header:
+            raise ValueError("Checkpoint belongs to a different tournament.")
+
+        for line in lines[1:]:
+            index, round_number, first, second, score1, score2, rounds_played, *capped = json.loads(line)
+            outcome = (index, score1, score2, rounds_played, bool(capped and capped[0]))
+            if self.format.depends_on_results:
+                self._replayed[index] = outcome  # Applied when its round comes up, so pairings repeat exactly
+            elif not self._is_done(index):
+                self._record(index, round_number, first, second, outcome, replayed=True)
+
+        self._checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+        if not lines:
+            self._checkpoint.write(json.dumps(header) + "\n")
+
+
+def _play_matches(specs: List[_MatchSpec]) -> List[_Outcome]:
+    """Worker entry point: play a chunk of matches."""
+    outcomes = []
+    for index, name1, name2, strategy1, strategy2, end_condition, max_rounds, seed in specs:
+        player1 = Player(name1, is_computer=True, strategy=strategy1())
+        player2 = Player(name2, is_computer=True, strategy=strategy2())
+        rng = None if seed is None else RngStream(seed, (index,))
+        game = Game(player1, player2, end_condition=end_condition, rng=rng)
+        while game.status == GameStatus.ONGOING and game.round_number < max_rounds:
+            game.play_computer_round()
+        outcomes.append((
+            index, game.scores[player1.id], game.scores[player2.id], game.round_number,
+            game.status == GameStatus.ONGOING,
+        ))
+    return outcomes
@@ -1,44 +1,180 @@
 from enum import Enum
-from typing import Dict, Optional
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Mapping, Optional
 from ...domain.entities.player import Player
+from ...domain.entities.round_history import RoundHistory
+from ...domain.events.game_events import GameEvent, MovePlayed, RoundCompleted
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.id_generator import new_id
 from ...domain.value_objects.move import Move
-import uuid
 import random
+import time
 
 class GameStatus(Enum):
     """Enum representing the possible states of a game."""
     ONGOING = "ongoing"
     COMPLETED = "completed"
 
+class SeatView(MutableMapping):
+    """
+    Dict-like view keyed by player ID over a per-seat list stored on a Game.
+
+    Games keep their state in small lists indexed by seat (0 or 1); these views
+    translate player IDs at the API boundary without copying anything.
+    """
+
+    __slots__ = ("_game", "_values")
+
+    def __init__(self, game: "Game", values: Optional[list]):
+        self._game = game
+        self._values = values  # None means the view is empty
+
+    def __getitem__(self, player_id: str):
+        if self._values is None:
+            raise KeyError(player_id)
+        return self._values[self._game._seat_of(player_id, KeyError)]
+
+    def __setitem__(self, player_id: str, value) -> None:
+        if self._values is None:
+            raise KeyError(player_id)
+        self._values[self._game._seat_of(player_id, KeyError)] = value
+        self._game.version += 1
+
+    def __delitem__(self, player_id: str) -> None:
+        raise TypeError("Seats cannot be removed from a game.")
+
+    def __iter__(self) -> Iterator[str]:
+        if self._values is not None:
+            yield self._game.player1.id
+            yield self._game.player2.id
+
+    def __len__(self) -> int:
+        return 0 if self._values is None else 2
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
 class Game:
     """
     Represents a game of Rock-Paper-Scissors.
 
     This class manages the game state, including players, moves, and scores.
     It also handles the logic for determining round winners and updating game status.
+
+    State is stored per seat (0 for player1, 1 for player2) in fixed-size slots;
+    `scores`, `current_moves` and `last_round_moves` are views keyed by player ID.
+
+    A game without an end condition goes on until it is deleted; with one, it
+    becomes COMPLETED after the round that meets it and rejects further moves.
+
+    `version` increases with every move and every change made through the
+    state properties, so callers such as caches can tell whether a game
+    changed since they last saw it.
+
+    Computer moves are drawn from `rng`, the global `random` module unless
+    the game is given its own generator. With a seeded RngStream, the
+    computer moves of a game depend only on its seed and on the moves of the
+    other seats, so the game can be replayed exactly (see replay_service).
+    Durable repositories store an RngStream's position with the game, so a
+    game read back goes on drawing where it stopped; other generators are
+    not persisted.
     """
 
-    def __init__(self, player1: Player, player2: Player):
+    __slots__ = (
+        "id", "player1", "player2", "status", "round_number",
+        "_scores", "_current_moves", "_last_round_moves", "_last_round_winner", "_pending_events", "_history",
+        "end_condition", "version", "rng",
+    )
+
+    def __init__(
+        self,
+        player1: Player,
+        player2: Player,
+        game_id: Optional[str] = None,
+        end_condition: Optional[EndCondition] = None,
+        rng: Optional[random.Random] = None,
+    ):
         """
         Initialize a new game with two players.
 
         Args:
             player1 (Player): The first player.
             player2 (Player): The second player.
+            game_id (Optional[str]): The ID of an existing game being restored. A new ID is generated if omitted.
+            end_condition (Optional[EndCondition]): When the game is over. The game never ends if omitted.
+            rng (Optional[random.Random]): Generator of the computer moves. Defaults to the global `random` module.
         """
-        self.id = str(uuid.uuid4())  # Generate a unique ID for the game
+        self.id = game_id or new_id()  # Generate a unique ID for the game
         self.player1 = player1
         self.player2 = player2
-        self.scores = {player1.id: 0, player2.id: 0}  # Initialize scores to 0
+        self._scores = [0, 0]  # Initialize scores to 0
 
         # Initialize current moves for both players to None
-        self.current_moves: Dict[str, Optional[Move]] = {
-            player1.id: None,
-            player2.id: None
-        }
+        self._current_moves: List[Optional[Move]] = [None, None]
         self.status = GameStatus.ONGOING
-        self.last_round_moves: Dict[str, Move] = {}  # Store last round's moves
-        self.last_round_winner: Optional[str] = None  # ID of the last round's winner, if any
+        self._last_round_moves: Optional[List[Move]] = None  # Store last round's moves
+        self._last_round_winner: Optional[int] = None  # Seat of the last round's winner, if any
+        self.round_number = 0  # Number of rounds played so far
+        self._pending_events: Optional[List[GameEvent]] = None  # Only recorded once tracking is enabled
+        self._history: Optional[RoundHistory] = None  # Created when the first round is recorded
+        self.end_condition = end_condition
+        self.version = 0
+        self.rng = rng
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        """Scores keyed by player ID."""
+        return SeatView(self, self._scores)
+
+    @scores.setter
+    def scores(self, scores: Mapping[str, int]) -> None:
+        self._scores = [scores[self.player1.id], scores[self.player2.id]]
+        self.version += 1
+
+    @property
+    def current_moves(self) -> Dict[str, Optional[Move]]:
+        """Moves committed in the current round, keyed by player ID."""
+        return SeatView(self, self._current_moves)
+
+    @current_moves.setter
+    def current_moves(self, moves: Mapping[str, Optional[Move]]) -> None:
+        self._current_moves = [moves[self.player1.id], moves[self.player2.id]]
+        self.version += 1
+
+    @property
+    def last_round_moves(self) -> Dict[str, Move]:
+        """Moves of the last completed round keyed by player ID, empty before the first round."""
+        return SeatView(self, self._last_round_moves)
+
+    @last_round_moves.setter
+    def last_round_moves(self, moves: Mapping[str, Move]) -> None:
+        self._last_round_moves = [moves[self.player1.id], moves[self.player2.id]] if moves else None
+        self.version += 1
+
+    @property
+    def last_round_winner(self) -> Optional[str]:
+        """ID of the last round's winner, if any."""
+        if self._last_round_winner is None:
+            return None
+        return self._player_at(self._last_round_winner).id
+
+    @last_round_winner.setter
+    def last_round_winner(self, player_id: Optional[str]) -> None:
+        self._last_round_winner = None if player_id is None else self._seat_of(player_id, ValueError)
+        self.version += 1
+
+    @property
+    def history(self) -> RoundHistory:
+        """Rounds recorded by this game object, oldest first."""
+        if self._history is None:
+            return RoundHistory(first_round=self.round_number + 1)
+        return self._history
+
+    @history.setter
+    def history(self, history: Optional[RoundHistory]) -> None:
+        # None drops the recorded rounds; recording restarts with the next round
+        self._history = history
+        self.version += 1
 
     def make_move(self, player_id: str, move: Move) -> None:
         """
@@ -53,44 +189,132 @@ class Game:
         """
         if self.status != GameStatus.ONGOING:
             raise Exception("Game has already ended.")
-        
-        if player_id not in [self.player1.id, self.player2.id]:
-            raise Exception("Invalid player ID.")
 
-        self.current_moves[player_id] = move  # Record the player's move
+        seat = self._seat_of(player_id, Exception)
+
+        self._record_move(seat, move)  # Record the player's move
 
         # Generate move for the computer player if necessary
         self._generate_computer_move()
 
         # If both players have moved, determine the winner and reset for next round
-        if all(self.current_moves.values()):
+        if self._current_moves[0] is not None and self._current_moves[1] is not None:
             self._determine_round_winner()
             self._reset_current_moves()
 
+    def play_computer_round(self) -> None:
+        """
+        Play a full round between two computer players.
+
+        Raises:
+            Exception: If the game has already ended or if a player is not a computer.
+        """
+        if self.status != GameStatus.ONGOING:
+            raise Exception("Game has already ended.")
+
+        if not (self.player1.is_computer and self.player2.is_computer):
+            raise Exception("Both players must be computers.")
+
+        self._generate_computer_move()
+        self._determine_round_winner()
+        self._reset_current_moves()
+
+    def track_events(self) -> None:
+        """
+        Start recording domain events for every state change.
+
+        Event-sourced repositories call this so they can append only what changed
+        instead of rewriting the whole game on every save.
+        """
+        if self._pending_events is None:
+            self._pending_events = []
+
+    @property
+    def is_tracking_events(self) -> bool:
+        """Whether domain events are being recorded."""
+        return self._pending_events is not None
+
+    def pull_events(self) -> List[GameEvent]:
+        """Return the events recorded since the last call and clear them."""
+        events = self._pending_events or []
+        if self._pending_events is not None:
+            self._pending_events = []
+        return events
+
+    def apply_event(self, event: GameEvent) -> None:
+        """
+        Re-apply a previously recorded event when rebuilding the game from a log.
+
+        Computer moves are not generated again; they are replayed from their own
+        MovePlayed events. RoundCompleted events are derived, so they are skipped.
+        """
+        if isinstance(event, MovePlayed):
+            self._current_moves[self._seat_of(event.player_id, ValueError)] = event.move
+            self.version += 1
+            if self._current_moves[0] is not None and self._current_moves[1] is not None:
+                self._determine_round_winner()
+                self._reset_current_moves()
+
+    def _seat_of(self, player_id: str, error: type) -> int:
+        """Translate a player ID into a seat index, raising `error` for unknown players."""
+        if player_id == self.player1.id:
+            return 0
+        if player_id == self.player2.id:
+            return 1
+        raise error("Invalid player ID.")
+
+    def _player_at(self, seat: int) -> Player:
+        return self.player1 if seat == 0 else self.player2
+
+    def _record_move(self, seat: int, move: Move) -> None:
+        """Store a move for the current round and emit the corresponding event."""
+        self._current_moves[seat] = move
+        self.version += 1
+        if self._pending_events is not None:
+            self._pending_events.append(MovePlayed(self.id, self._player_at(seat).id, move))
+
     def _generate_computer_move(self) -> None:
         """
-        Generate a move for the computer player if necessary.
+        Generate a move for every computer player that has not moved yet.
         """
-        for player in [self.player1, self.player2]:
-            if player.is_computer and self.current_moves[player.id] is None:
-                self.current_moves[player.id] = random.choice(list(Move))
-                break  # Only one player can be a computer, so we can stop after generating a move
+        rng = random if self.rng is None else self.rng
+        for seat, player in enumerate((self.player1, self.player2)):
+            if player.is_computer and self._current_moves[seat] is None:
+                self._record_move(seat, player.strategy.choose(rng))
 
     def _determine_round_winner(self) -> None:
         """Determine the winner of the current round and update game state."""
-        move1 = self.current_moves[self.player1.id]
-        move2 = self.current_moves[self.player2.id]
-        
-        # Store moves for history
-        self.last_round_moves = {
-            self.player1.id: move1,
-            self.player2.id: move2
-        }
-        
+        move1, move2 = self._current_moves
+
+        # Store moves for history, reusing the seat list after the first round
+        if self._last_round_moves is None:
+            self._last_round_moves = [move1, move2]
+        else:
+            self._last_round_moves[0] = move1
+            self._last_round_moves[1] = move2
+
+        self.round_number += 1
+
         # Compare moves and update scores
         result = Move.compare_moves(move1, move2)
         self._update_scores_and_winner(result)
 
+        if self._history is None:
+            self._history = RoundHistory(first_round=self.round_number)
+        self._history.append(move1, move2, self._last_round_winner, time.time())
+
+        # Let adaptive computer players learn from this round only
+        if self.player1.is_computer:
+            self.player1.strategy.observe(move1, move2)
+        if self.player2.is_computer:
+            self.player2.strategy.observe(move2, move1)
+
+        if self._pending_events is not None:
+            self._pending_events.append(RoundCompleted(self.id, self.round_number, self.last_round_winner))
+
+        if self.end_condition is not None and self.end_condition.is_met(self._scores, self.round_number):
+            self.status = GameStatus.COMPLETED
+
     def _update_scores_and_winner(self, result: int) -> None:
         """
         Update scores and set the round winner based on the result.
@@ -99,17 +323,15 @@ class Game:
             result (int): 1 if player1 wins, -1 if player2 wins, 0 if tie.
         """
         if result == 1:
-            self.scores[self.player1.id] += 1
-            self.last_round_winner = self.player1.id
+            self._scores[0] += 1
+            self._last_round_winner = 0
         elif result == -1:
-            self.scores[self.player2.id] += 1
-            self.last_round_winner = self.player2.id
+            self._scores[1] += 1
+            self._last_round_winner = 1
         else:
-            self.last_round_winner = None  # Tie
+            self._last_round_winner = None  # Tie
 
     def _reset_current_moves(self) -> None:
         """Reset current moves for the next round."""
-        self.current_moves = {
-            self.player1.id: None,
-            self.player2.id: None
-        }
\ No newline at end of file
+        self._current_moves[0] = None
+        self._current_moves[1] = None
@@ -0,0 +1,44 @@
+import time
+from typing import NamedTuple, Optional
+from ...domain.entities.game import Game
+
+class GameSummary(NamedTuple):
+    """
+    Immutable record of a finished game.
+
+    Keeps only what outlives the game: who played, the final score and when it
+    ended. Moves, round history and strategies are dropped.
+    """
+    game_id: str
+    player1_name: str
+    player2_name: str
+    player1_score: int
+    player2_score: int
+    rounds_played: int
+    completed_at: float  # Seconds since the epoch
+
+    @classmethod
+    def from_game(cls, game: Game, completed_at: Optional[float] = None) -> "GameSummary":
+        """
+        Summarize a game.
+
+        Args:
+            game (Game): The game to summarize, normally a completed one.
+            completed_at (Optional[float]): When the game ended. Defaults to now.
+        """
+        return cls(
+            game.id,
+            game.player1.name,
+            game.player2.name,
+            game.scores[game.player1.id],
+            game.scores[game.player2.id],
+            game.round_number,
+            time.time() if completed_at is None else completed_at,
+        )
+
+    @property
+    def winner_name(self) -> Optional[str]:
+        """Name of the player with the higher score, or None for a draw."""
+        if self.player1_score == self.player2_score:
+            return None
+        return self.player1_name if self.player1_score > self.player2_score else self.player2_name
@@ -0,0 +1,206 @@
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+from ...domain.entities.game import GameStatus
+from ...domain.entities.player import Player
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.id_generator import new_id
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rule_set import CLASSIC
+
+_MOVES = tuple(Move.from_code(code) for code in range(len(Move)))  # Indexed by Move.code
+
+class MultiplayerGame:
+    """
+    A Rock-Paper-Scissors game between any number of seats.
+
+    Every seat commits a move each round. Computer seats move once all human
+    seats have moved (or on `play_computer_round` when every seat is a
+    computer), and then the round is resolved.
+
+    Resolution never compares seats pairwise. The game keeps a count of how
+    many seats chose each move, so the net margin of a move, i.e. the seats
+    it beats minus the seats that beat it, is a sum over the three move
+    counts. The move with the highest positive margin wins the round, and
+    every seat that played it scores a point; the round is a tie when no move
+    has a positive margin or several share the highest one. With two moves in
+    play this is the usual rule (the winning move beats all the others), and
+    with all three in play a large lobby still produces a winner: the move
+    facing the fewest counters. A round therefore costs O(N) in the number of
+    seats rather than the O(N^2) of comparing every pair.
+
+    Scores count rounds won, so end conditions such as FirstTo apply as they
+    do to two-player games.
+
+    As in Game, computer moves come from `rng`, the global `random` module
+    unless a seeded generator is given.
+    """
+
+    __slots__ = (
+        "id", "players", "status", "round_number", "end_condition", "version", "rng",
+        "_seats", "_scores", "_current_moves", "_move_counts", "_waiting", "_humans",
+        "_last_round_moves", "_last_round_winners",
+    )
+
+    def __init__(
+        self,
+        players: Sequence[Player],
+        game_id: Optional[str] = None,
+        end_condition: Optional[EndCondition] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Initialize a new game.
+
+        Args:
+            players (Sequence[Player]): The players, in seat order.
+            game_id (Optional[str]): The ID of an existing game being restored. A new ID is generated if omitted.
+            end_condition (Optional[EndCondition]): When the game is over. The game never ends if omitted.
+            rng (Optional[random.Random]): Generator of the computer moves. Defaults to the global `random` module.
+
+        Raises:
+            ValueError: If there are fewer than two players or a player ID is repeated.
+        """
+        if len(players) < 2:
+            raise ValueError("A game needs at least two players.")
+        self._seats: Dict[str, int] = {player.id: seat for seat, player in enumerate(players)}
+        if len(self._seats) != len(players):
+            raise ValueError("Player IDs must be unique.")
+
+        self.id = game_id or new_id()
+        self.players: Tuple[Player, ...] = tuple(players)
+        self.status = GameStatus.ONGOING
+        self.round_number = 0
+        self.end_condition = end_condition
+        self.version = 0
+        self.rng = rng
+        self._scores = [0] * len(players)
+        self._current_moves: List[Optional[Move]] = [None] * len(players)
+        self._move_counts = [0] * len(_MOVES)
+        self._humans = sum(1 for player in players if not player.is_computer)
+        self._waiting = self._humans  # Human seats that have not moved this round
+        self._last_round_moves: Optional[List[Move]] = None
+        self._last_round_winners: List[int] = []
+
+    @property
+    def scores(self) -> Dict[str, int]:
+        """Rounds won, keyed by player ID."""
+        return {player.id: score for player, score in zip(self.players, self._scores)}
+
+    def score_of(self, player_id: str) -> int:
+        """Rounds won by one player."""
+        return self._scores[self._seat_of(player_id)]
+
+    @property
+    def current_moves(self) -> Dict[str, Optional[Move]]:
+        """Moves committed in the current round, keyed by player ID."""
+        return {player.id: move for player, move in zip(self.players, self._current_moves)}
+
+    @property
+    def last_round_moves(self) -> Dict[str, Move]:
+        """Moves of the last completed round keyed by player ID, empty before the first round, as in Game."""
+        if self._last_round_moves is None:
+            return {}
+        return {player.id: move for player, move in zip(self.players, self._last_round_moves)}
+
+    @property
+    def last_round_winners(self) -> List[str]:
+        """IDs of the players who won the last round; empty after a tie."""
+        return [self.players[seat].id for seat in self._last_round_winners]
+
+    @property
+    def move_counts(self) -> Dict[Move, int]:
+        """How many seats committed each move in the current round."""
+        return {move: self._move_counts[move.code] for move in _MOVES}
+
+    def make_move(self, player_id: str, move: Move) -> None:
+        """
+        Record a human player's move and play the round once every human has moved.
+
+        A player may change their move until the round is resolved.
+
+        Raises:
+            Exception: If the game has already ended.
+            ValueError: If the player is not in the game or is a computer.
+        """
+        if self.status != GameStatus.ONGOING:
+            raise Exception("Game has already ended.")
+        seat = self._seat_of(player_id)
+        if self.players[seat].is_computer:
+            raise ValueError("Computer players choose their own moves.")
+
+        previous = self._current_moves[seat]
+        if previous is None:
+            self._waiting -= 1
+        else:
+            self._move_counts[previous.code] -= 1
+        self._current_moves[seat] = move
+        self._move_counts[move.code] += 1
+        self.version += 1
+
+        if self._waiting == 0:
+            self._play_round()
+
+    def play_computer_round(self) -> None:
+        """
+        Play a full round between computer players.
+
+        Raises:
+            Exception: If the game has already ended or if a seat is held by a human.
+        """
+        if self.status != GameStatus.ONGOING:
+            raise Exception("Game has already ended.")
+        if self._humans:
+            raise Exception("All players must be computers.")
+        self._play_round()
+
+    def _seat_of(self, player_id: str) -> int:
+        seat = self._seats.get(player_id)
+        if seat is None:
+            raise ValueError("Invalid player ID.")
+        return seat
+
+    def _play_round(self) -> None:
+        """Let the computers move, then resolve and score the round."""
+        moves = self._current_moves
+        counts = self._move_counts
+        rng = random if self.rng is None else self.rng
+        for seat, player in enumerate(self.players):
+            if player.is_computer:
+                move = player.strategy.choose(rng)
+                moves[seat] = move
+                counts[move.code] += 1
+
+        # Net margin of every move: the seats it beats minus the seats that beat it
+        outcomes = CLASSIC.outcomes
+        margins = [
+            sum(outcome * count for outcome, count in zip(outcomes[code], counts)) if counts[code] else None
+            for code in range(len(_MOVES))
+        ]
+        best = max((margin for margin in margins if margin is not None), default=0)
+        winning = [code for code, margin in enumerate(margins) if margin == best]
+        winning_code = winning[0] if best > 0 and len(winning) == 1 else None
+
+        self.round_number += 1
+        if winning_code is None:
+            self._last_round_winners = []
+        else:
+            self._last_round_winners = [seat for seat, move in enumerate(moves) if move.code == winning_code]
+            for seat in self._last_round_winners:
+                self._scores[seat] += 1
+
+        # Adaptive computers learn from the move most played by the others
+        for seat, player in enumerate(self.players):
+            if player.is_computer:
+                own = moves[seat]
+                counts[own.code] -= 1
+                player.strategy.observe(own, _MOVES[max(range(len(_MOVES)), key=counts.__getitem__)])
+                counts[own.code] += 1
+
+        self._last_round_moves = moves
+        self._current_moves = [None] * len(self.players)
+        self._move_counts = [0] * len(_MOVES)
+        self._waiting = self._humans
+        self.version += 1
+
+        if self.end_condition is not None and self.end_condition.is_met(self._scores, self.round_number):
+            self.status = GameStatus.COMPLETED
@@ -1,7 +1,19 @@
-import uuid
+from typing import Optional
+from ...domain.strategies.strategy import RANDOM, Strategy
+from ...domain.value_objects.id_generator import new_id
 
 class Player:
-    def __init__(self, name: str, is_computer: bool = False):
-        self.id = str(uuid.uuid4())
+    __slots__ = ("id", "name", "is_computer", "strategy")
+
+    def __init__(
+        self,
+        name: str,
+        is_computer: bool = False,
+        player_id: Optional[str] = None,
+        strategy: Optional[Strategy] = None,
+    ):
+        self.id = player_id or new_id()
         self.name = name
-        self.is_computer = is_computer
\ No newline at end of file
+        self.is_computer = is_computer
+        # Computer players decide through a strategy, random unless told otherwise
+        self.strategy = strategy or (RANDOM if is_computer else None)
\ No newline at end of file
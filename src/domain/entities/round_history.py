@@ -0,0 +1,66 @@
+from array import array
+from typing import Iterator, NamedTuple, Optional
+from ...domain.value_objects.move import Move
+
+class RoundRecord(NamedTuple):
+    """One completed round, as read back from a RoundHistory."""
+    round_number: int
+    player1_move: Move
+    player2_move: Move
+    winner_seat: Optional[int]  # 0 for player1, 1 for player2, None for a tie
+    timestamp: float  # Seconds since the epoch
+
+class RoundHistory:
+    """
+    Columnar record of the rounds of a game.
+
+    Each round costs 10 bytes: both move codes packed into one byte, the
+    winning seat (-1 for a tie) and a float timestamp, each stored in its own
+    typed array. The history may be a window that starts at `first_round`,
+    e.g. for a game reloaded from a repository that keeps older rounds on disk.
+    """
+
+    __slots__ = ("first_round", "moves", "winners", "timestamps")
+
+    def __init__(self, first_round: int = 1):
+        """
+        Initialize an empty history.
+
+        Args:
+            first_round (int, optional): Round number of the first round that will be recorded. Defaults to 1.
+        """
+        self.first_round = first_round
+        self.moves = array("B")  # player1 code << 4 | player2 code
+        self.winners = array("b")
+        self.timestamps = array("d")
+
+    def append(self, move1: Move, move2: Move, winner_seat: Optional[int], timestamp: float) -> None:
+        """Record the next round."""
+        self.moves.append(move1.code << 4 | move2.code)
+        self.winners.append(-1 if winner_seat is None else winner_seat)
+        self.timestamps.append(timestamp)
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __getitem__(self, index: int) -> RoundRecord:
+        if index < 0:
+            index += len(self.moves)
+        packed = self.moves[index]
+        winner = self.winners[index]
+        return RoundRecord(
+            self.first_round + index,
+            Move.from_code(packed >> 4),
+            Move.from_code(packed & 0x0F),
+            None if winner < 0 else winner,
+            self.timestamps[index],
+        )
+
+    def __iter__(self) -> Iterator[RoundRecord]:
+        for index in range(len(self.moves)):
+            yield self[index]
+
+    def since(self, round_number: int) -> Iterator[RoundRecord]:
+        """Iterate over the recorded rounds numbered `round_number` and above."""
+        for index in range(max(0, round_number - self.first_round), len(self.moves)):
+            yield self[index]
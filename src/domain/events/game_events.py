@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+from ...domain.value_objects.move import Move
+
+@dataclass(frozen=True)
+class MovePlayed:
+    """A player (human or computer) committed a move in the current round."""
+    game_id: str
+    player_id: str
+    move: Move
+
+@dataclass(frozen=True)
+class RoundCompleted:
+    """Both players have moved and the round was resolved."""
+    game_id: str
+    round_number: int
+    winner_id: Optional[str]  # None for a tie
+
+GameEvent = Union[MovePlayed, RoundCompleted]
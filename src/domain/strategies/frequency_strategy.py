@@ -0,0 +1,38 @@
+from typing import Any, Dict
+from ...domain.value_objects.move import Move
+from .strategy import MOVE_COUNT, MOVES, Strategy, counter_move
+
+class FrequencyStrategy(Strategy):
+    """
+    Counter the opponent's most frequent move.
+
+    Keeps one counter per move and the index of the current maximum, so both
+    `observe` and `choose` are O(1).
+    """
+
+    __slots__ = ("_counts", "_most_frequent")
+
+    def __init__(self):
+        self._counts = [0] * MOVE_COUNT
+        self._most_frequent = -1  # No observation yet
+
+    def choose(self, rng) -> Move:
+        if self._most_frequent < 0:
+            return rng.choice(MOVES)
+        return counter_move(self._most_frequent)
+
+    def observe(self, own_move: Move, opponent_move: Move) -> None:
+        code = opponent_move.code
+        self._counts[code] += 1
+        if self._most_frequent < 0 or self._counts[code] > self._counts[self._most_frequent]:
+            self._most_frequent = code
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"counts": list(self._counts), "most_frequent": self._most_frequent}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "FrequencyStrategy":
+        strategy = cls()
+        strategy._counts = list(state["counts"])
+        strategy._most_frequent = state["most_frequent"]
+        return strategy
@@ -0,0 +1,72 @@
+from typing import Any, Dict
+from ...domain.value_objects.move import Move
+from .strategy import MOVE_COUNT, MOVES, Strategy, counter_move
+
+_SYMBOLS = MOVE_COUNT * MOVE_COUNT  # One symbol per (own move, opponent move) pair
+
+class MarkovStrategy(Strategy):
+    """
+    Order-k Markov (n-gram) predictor.
+
+    The context is the last `order` rounds, each encoded as one of 9 symbols
+    (own move, opponent move) and packed into a single integer. For every
+    context the strategy counts what the opponent played next and keeps the
+    most frequent answer, then plays its counter. Updating the rolling context
+    and the counts is O(1) per round.
+    """
+
+    __slots__ = ("order", "_context", "_history_length", "_modulus", "_counts", "_predictions")
+
+    def __init__(self, order: int = 2):
+        """
+        Initialize the strategy.
+
+        Args:
+            order (int, optional): Number of past rounds used as context. Defaults to 2.
+        """
+        if order < 1:
+            raise ValueError("Order must be at least 1.")
+        self.order = order
+        self._context = 0
+        self._history_length = 0
+        self._modulus = _SYMBOLS ** order
+        self._counts = [0] * (self._modulus * MOVE_COUNT)
+        self._predictions = [-1] * self._modulus  # Most frequent next opponent move per context
+
+    def choose(self, rng) -> Move:
+        if self._history_length < self.order or self._predictions[self._context] < 0:
+            return rng.choice(MOVES)
+        return counter_move(self._predictions[self._context])
+
+    def observe(self, own_move: Move, opponent_move: Move) -> None:
+        code = opponent_move.code
+        if self._history_length >= self.order:
+            context = self._context
+            slot = context * MOVE_COUNT
+            self._counts[slot + code] += 1
+            best = self._predictions[context]
+            if best < 0 or self._counts[slot + code] > self._counts[slot + best]:
+                self._predictions[context] = code
+        else:
+            self._history_length += 1
+        self._context = (self._context * _SYMBOLS + own_move.code * MOVE_COUNT + code) % self._modulus
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "order": self.order,
+            "context": self._context,
+            "history_length": self._history_length,
+            "counts": list(self._counts),
+            "predictions": list(self._predictions),
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "MarkovStrategy":
+        strategy = cls(state["order"])
+        if len(state["counts"]) != len(strategy._counts) or len(state["predictions"]) != strategy._modulus:
+            raise ValueError("Markov strategy state does not match its order.")
+        strategy._context = state["context"]
+        strategy._history_length = state["history_length"]
+        strategy._counts = list(state["counts"])
+        strategy._predictions = list(state["predictions"])
+        return strategy
@@ -0,0 +1,67 @@
+from typing import Any, Dict, List, Optional, Sequence
+from ...domain.value_objects.move import Move
+from .frequency_strategy import FrequencyStrategy
+from .markov_strategy import MarkovStrategy
+from .strategy import RandomStrategy, Strategy
+
+class MixtureOfExpertsStrategy(Strategy):
+    """
+    Follow whichever expert strategy has been doing best lately.
+
+    Every expert proposes a move each round. Once the opponent's move is known,
+    each expert is scored on how its proposal would have fared (+1 win, -1
+    loss) with exponential decay, so the mixture switches quickly when the
+    opponent changes style. Work per round is proportional to the (fixed)
+    number of experts.
+    """
+
+    __slots__ = ("experts", "_decay", "_scores", "_proposals")
+
+    def __init__(self, experts: Optional[Sequence[Strategy]] = None, decay: float = 0.9):
+        """
+        Initialize the mixture.
+
+        Args:
+            experts (Optional[Sequence[Strategy]]): The experts. Defaults to random, frequency and
+                order-1/order-2 Markov strategies.
+            decay (float, optional): Weight kept by past results each round. Defaults to 0.9.
+        """
+        self.experts: List[Strategy] = list(experts) if experts else [
+            RandomStrategy(), FrequencyStrategy(), MarkovStrategy(order=1), MarkovStrategy(order=2),
+        ]
+        self._decay = decay
+        self._scores = [0.0] * len(self.experts)
+        self._proposals: List[Optional[Move]] = [None] * len(self.experts)
+
+    def choose(self, rng) -> Move:
+        best = 0
+        for index, expert in enumerate(self.experts):
+            self._proposals[index] = expert.choose(rng)
+            if self._scores[index] > self._scores[best]:
+                best = index
+        return self._proposals[best]
+
+    def observe(self, own_move: Move, opponent_move: Move) -> None:
+        for index, expert in enumerate(self.experts):
+            proposal = self._proposals[index]
+            if proposal is not None:
+                self._scores[index] = self._decay * self._scores[index] + Move.compare_moves(proposal, opponent_move)
+            expert.observe(own_move, opponent_move)
+
+    def get_state(self) -> Dict[str, Any]:
+        """The mixture's own state; the experts are stored separately by the caller, in `experts` order."""
+        return {
+            "decay": self._decay,
+            "scores": list(self._scores),
+            "proposals": [None if proposal is None else proposal.code for proposal in self._proposals],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "MixtureOfExpertsStrategy":
+        """Rebuild a mixture; `state["experts"]` holds the already rebuilt experts."""
+        strategy = cls(state["experts"], state["decay"])
+        if len(state["scores"]) != len(strategy.experts) or len(state["proposals"]) != len(strategy.experts):
+            raise ValueError("Mixture state does not match its experts.")
+        strategy._scores = list(state["scores"])
+        strategy._proposals = [None if code is None else Move.from_code(code) for code in state["proposals"]]
+        return strategy
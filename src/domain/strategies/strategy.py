@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rule_set import CLASSIC
+
+MOVES = tuple(Move)
+MOVE_COUNT = len(MOVES)
+
+def counter_move(code: int) -> Move:
+    """The move that beats the move with the given code."""
+    return Move.from_code(CLASSIC.beaten_by[code][0])
+
+class Strategy(ABC):
+    """
+    Decision policy of a computer player.
+
+    `choose` is called whenever the computer has to move. After every round,
+    `observe` is called with both moves so adaptive strategies can update their
+    model incrementally instead of rescanning the game history.
+
+    `get_state` and `from_state` expose that model as plain data, so that
+    repositories can store a computer player's strategy with its game.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def choose(self, rng) -> Move:
+        """
+        Pick the next move.
+
+        Args:
+            rng: Source of randomness with the `random.Random` interface (`choice`, `random`).
+        """
+        pass
+
+    def observe(self, own_move: Move, opponent_move: Move) -> None:
+        """Learn from the last round. Stateless strategies ignore it."""
+        pass
+
+    def get_state(self) -> Dict[str, Any]:
+        """The parameters and learned model of the strategy, as JSON-compatible data."""
+        return {}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "Strategy":
+        """Rebuild a strategy from the output of `get_state`."""
+        return cls()
+
+class RandomStrategy(Strategy):
+    """Uniformly random moves, the unexploitable baseline."""
+
+    __slots__ = ()
+
+    def choose(self, rng) -> Move:
+        return rng.choice(MOVES)
+
+# Stateless, so every computer player can share it
+RANDOM = RandomStrategy()
@@ -0,0 +1,95 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+class EndCondition(ABC):
+    """
+    Rule that decides when a game is over.
+
+    Conditions are checked after every round with the per-seat scores and the
+    number of rounds played. Their string form (e.g. "first_to:3" or
+    "best_of:5|round_cap:20") is what repositories persist; `parse` reverses it.
+    """
+
+    @abstractmethod
+    def is_met(self, scores: Sequence[int], rounds_played: int) -> bool:
+        """Whether a game with these per-seat scores after `rounds_played` rounds is over."""
+
+    @staticmethod
+    def parse(spec: str) -> "EndCondition":
+        """
+        Rebuild a condition from its string form.
+
+        Raises:
+            ValueError: If the string does not describe a known condition.
+        """
+        parts = spec.split("|")
+        if len(parts) > 1:
+            return AnyOf(tuple(EndCondition.parse(part) for part in parts))
+        name, _, value = spec.partition(":")
+        kinds = {"first_to": FirstTo, "best_of": BestOf, "round_cap": RoundCap}
+        if name not in kinds or not value.isdigit():
+            raise ValueError(f"Unknown end condition: {spec!r}")
+        return kinds[name](int(value))
+
+def _require_positive(value: int, name: str) -> None:
+    if value < 1:
+        raise ValueError(f"{name} must be at least 1.")
+
+@dataclass(frozen=True)
+class FirstTo(EndCondition):
+    """The game ends as soon as a player has won `wins` rounds."""
+    wins: int
+
+    def __post_init__(self):
+        _require_positive(self.wins, "wins")
+
+    def is_met(self, scores: Sequence[int], rounds_played: int) -> bool:
+        return max(scores) >= self.wins
+
+    def __str__(self) -> str:
+        return f"first_to:{self.wins}"
+
+@dataclass(frozen=True)
+class BestOf(EndCondition):
+    """
+    The game ends once a player has won the majority of `rounds` decisive rounds.
+
+    Ties do not count towards the N rounds; combine with RoundCap to bound a
+    game that keeps tying.
+    """
+    rounds: int
+
+    def __post_init__(self):
+        _require_positive(self.rounds, "rounds")
+
+    def is_met(self, scores: Sequence[int], rounds_played: int) -> bool:
+        return max(scores) > self.rounds // 2
+
+    def __str__(self) -> str:
+        return f"best_of:{self.rounds}"
+
+@dataclass(frozen=True)
+class RoundCap(EndCondition):
+    """The game ends after `rounds` rounds, ties included."""
+    rounds: int
+
+    def __post_init__(self):
+        _require_positive(self.rounds, "rounds")
+
+    def is_met(self, scores: Sequence[int], rounds_played: int) -> bool:
+        return rounds_played >= self.rounds
+
+    def __str__(self) -> str:
+        return f"round_cap:{self.rounds}"
+
+@dataclass(frozen=True)
+class AnyOf(EndCondition):
+    """The game ends as soon as any of the conditions is met."""
+    conditions: Tuple[EndCondition, ...]
+
+    def is_met(self, scores: Sequence[int], rounds_played: int) -> bool:
+        return any(condition.is_met(scores, rounds_played) for condition in self.conditions)
+
+    def __str__(self) -> str:
+        return "|".join(str(condition) for condition in self.conditions)
@@ -0,0 +1,162 @@
+import itertools
+import os
+import random
+import threading
+import time
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+
+
+class IdGenerator(ABC):
+    """
+    Source of unique entity IDs.
+
+    Generators produce integers; calling a generator renders the next one as
+    the string the entities store and repositories persist.
+    """
+
+    @abstractmethod
+    def next_int(self) -> int:
+        """Return the next ID as an integer."""
+
+    def format(self, value: int) -> str:
+        """Render an integer ID as a string."""
+        return str(value)
+
+    def __call__(self) -> str:
+        return self.format(self.next_int())
+
+
+class RandomUuidGenerator(IdGenerator):
+    """Random version 4 UUIDs, read from os.urandom."""
+
+    def next_int(self) -> int:
+        return uuid.uuid4().int
+
+    def __call__(self) -> str:
+        return str(uuid.uuid4())
+
+    def format(self, value: int) -> str:
+        return str(uuid.UUID(int=value))
+
+
+class TimeOrderedIdGenerator(IdGenerator):
+    """
+    128-bit IDs laid out as version 7 UUIDs, ordered by creation time.
+
+    The top 48 bits are the Unix time in milliseconds, followed by a 26-bit
+    sequence number and a 48-bit node chosen at random per process. The
+    sequence comes from a lock-free counter, so IDs are unique within a
+    process even when the clock stalls or several threads share the
+    generator, and a single thread gets strictly increasing IDs. The random
+    node keeps processes apart; it is redrawn after a fork.
+
+    IDs render as canonical UUID strings, so they are accepted wherever a
+    UUID is expected, and sort by time as both integers and strings.
+    """
+
+    _SEQUENCE_BITS = 26
+    _NODE_BITS = 48
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._last_millis = 0
+        self._node = 0
+        self.reseed()
+        _time_ordered_generators.add(self)
+
+    def reseed(self) -> None:
+        """Draw a new random node."""
+        self._node = random.SystemRandom().getrandbits(self._NODE_BITS)
+
+    def next_int(self) -> int:
+        millis = time.time_ns() // 1_000_000
+        if millis < self._last_millis:
+            millis = self._last_millis  # Never step back when the wall clock does
+        self._last_millis = millis
+        sequence = next(self._counter) & ((1 << self._SEQUENCE_BITS) - 1)
+        # 48-bit time | version 7 | 12 bits of sequence | variant 0b10 | 14 bits of sequence | node
+        return (
+            millis << 80 | 0x7 << 76 | (sequence >> 14) << 64
+            | 0b10 << 62 | (sequence & 0x3FFF) << 48 | self._node
+        )
+
+    def format(self, value: int) -> str:
+        digits = "%032x" % value
+        return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+
+class SnowflakeIdGenerator(IdGenerator):
+    """
+    63-bit IDs in the Snowflake layout, rendered as decimal strings.
+
+    41 bits of milliseconds since `epoch_millis`, a 10-bit worker ID and a
+    12-bit per-millisecond sequence. When 4096 IDs are taken within one
+    millisecond, the generator waits for the next one. Workers sharing a
+    database must be given distinct worker IDs.
+    """
+
+    _WORKER_BITS = 10
+    _SEQUENCE_BITS = 12
+
+    def __init__(self, worker_id: int = 0, epoch_millis: int = 1_577_836_800_000):
+        """
+        Initialize the generator.
+
+        Args:
+            worker_id (int, optional): Unique number of this process, 0 to 1023. Defaults to 0.
+            epoch_millis (int, optional): Start of the time range, as Unix milliseconds. Defaults to 2020-01-01.
+
+        Raises:
+            ValueError: If the worker ID does not fit in 10 bits.
+        """
+        if not 0 <= worker_id < 1 << self._WORKER_BITS:
+            raise ValueError(f"Worker ID must be between 0 and {(1 << self._WORKER_BITS) - 1}.")
+        self.worker_id = worker_id
+        self.epoch_millis = epoch_millis
+        self._lock = threading.Lock()
+        self._last_millis = -1
+        self._sequence = 0
+
+    def next_int(self) -> int:
+        with self._lock:
+            millis = max(time.time_ns() // 1_000_000 - self.epoch_millis, self._last_millis)
+            if millis == self._last_millis:
+                self._sequence = (self._sequence + 1) & ((1 << self._SEQUENCE_BITS) - 1)
+                if self._sequence == 0:
+                    while millis <= self._last_millis:
+                        millis = time.time_ns() // 1_000_000 - self.epoch_millis
+            else:
+                self._sequence = 0
+            self._last_millis = millis
+            return (
+                millis << (self._WORKER_BITS + self._SEQUENCE_BITS)
+                | self.worker_id << self._SEQUENCE_BITS
+                | self._sequence
+            )
+
+
+# A forked child must not hand out the IDs of its parent
+_time_ordered_generators: "weakref.WeakSet[TimeOrderedIdGenerator]" = weakref.WeakSet()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: [generator.reseed() for generator in _time_ordered_generators])
+
+_generator: IdGenerator = TimeOrderedIdGenerator()
+
+
+def new_id() -> str:
+    """Generate an ID with the current generator."""
+    return _generator()
+
+
+def set_id_generator(generator: IdGenerator) -> IdGenerator:
+    """
+    Replace the generator used for new games and players.
+
+    Returns:
+        IdGenerator: The previous generator, so it can be restored.
+    """
+    global _generator
+    previous, _generator = _generator, generator
+    return previous
@@ -1,20 +1,27 @@
 from enum import Enum
+from .rule_set import CLASSIC
 
 class Move(Enum):
-    ROCK = "rock"
-    PAPER = "paper"
-    SCISSORS = "scissors"
+    # (value, code): codes are persisted by repositories and codecs, so they are
+    # fixed here rather than derived from declaration order, and index CLASSIC
+    ROCK = ("rock", 0)
+    PAPER = ("paper", 1)
+    SCISSORS = ("scissors", 2)
+
+    def __new__(cls, value, code):
+        move = object.__new__(cls)
+        move._value_ = value
+        move.code = code
+        return move
+
+    @staticmethod
+    def from_code(code):
+        return _MOVES_BY_CODE[code]
 
     @staticmethod
     def compare_moves(move1, move2):
-        rules = {
-            Move.ROCK: Move.SCISSORS,
-            Move.SCISSORS: Move.PAPER,
-            Move.PAPER: Move.ROCK,
-        }
-        if move1 == move2:
-            return 0  # Tie
-        elif rules[move1] == move2:
-            return 1  # Move1 wins
-        else:
-            return -1  # Move2 wins
+        # 1 if move1 wins, -1 if move2 wins, 0 for a tie
+        return _OUTCOMES[move1.code][move2.code]
+
+_MOVES_BY_CODE = tuple(sorted(Move, key=lambda move: move.code))
+_OUTCOMES = CLASSIC.outcomes
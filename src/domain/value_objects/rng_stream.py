@@ -0,0 +1,92 @@
+import random
+from hashlib import blake2b
+from typing import List, Tuple
+
+_MAX_WORDS_PER_SKIP = 1 << 20  # Bounds the integer built while skipping
+
+
+class RngStream(random.Random):
+    """
+    Seeded, splittable random number generator.
+
+    A stream is identified by a root seed and a path of child indexes; its
+    state is seeded from a hash of both, so `spawn(i)` always returns the
+    same child no matter how much of the parent has been consumed, and
+    sibling streams are statistically independent. Giving every game (or
+    every worker) its own child of one root stream makes a whole simulation
+    reproducible from a single integer, whatever the order or the process
+    the games are played in.
+
+    A stream also counts the 32-bit words it has drawn, so its position can
+    be stored as a short string (see `__str__` and `parse`) and restored by
+    skipping that many words, instead of storing the full generator state.
+    """
+
+    def __init__(self, seed: int, path: Tuple[int, ...] = (), draws: int = 0):
+        """
+        Initialize a stream.
+
+        Args:
+            seed (int): Root seed shared by the whole family of streams.
+            path (Tuple[int, ...], optional): Child indexes from the root stream down to this one.
+            draws (int, optional): Number of 32-bit words to skip, e.g. the `draws` of a stored stream.
+        """
+        self.root_seed = seed
+        self.path = tuple(path)
+        key = ",".join(map(str, (seed,) + self.path)).encode("ascii")
+        super().__init__(int.from_bytes(blake2b(key, digest_size=16).digest(), "little"))
+        self.draws = 0
+        self.advance(draws)
+
+    @staticmethod
+    def parse(spec: str) -> "RngStream":
+        """
+        Rebuild a stream, at its stored position, from its string form.
+
+        Raises:
+            ValueError: If the string does not describe a stream.
+        """
+        try:
+            seed, path, draws = spec.split(":")
+            return RngStream(int(seed), tuple(int(index) for index in path.split(".") if index), int(draws))
+        except ValueError:
+            raise ValueError(f"Unknown RNG stream: {spec!r}") from None
+
+    def getrandbits(self, k: int) -> int:
+        # Every other method draws through getrandbits or random
+        self.draws += (k + 31) >> 5
+        return super().getrandbits(k)
+
+    def random(self) -> float:
+        self.draws += 2
+        return super().random()
+
+    def advance(self, draws: int) -> None:
+        """Skip `draws` 32-bit words, as if they had been drawn."""
+        while draws > 0:
+            words = min(draws, _MAX_WORDS_PER_SKIP)
+            super().getrandbits(32 * words)  # Draws exactly `words` words
+            self.draws += words
+            draws -= words
+
+    def spawn(self, index: int) -> "RngStream":
+        """Return the child stream with the given index."""
+        return RngStream(self.root_seed, self.path + (index,))
+
+    def split(self, count: int) -> List["RngStream"]:
+        """Return the first `count` child streams."""
+        return [self.spawn(index) for index in range(count)]
+
+    def __reduce__(self):
+        # random.Random pickles by calling the class without arguments
+        return RngStream, (self.root_seed, self.path), (self.getstate(), self.draws)
+
+    def __setstate__(self, state) -> None:
+        generator_state, self.draws = state
+        self.setstate(generator_state)
+
+    def __str__(self) -> str:
+        return f"{self.root_seed}:{'.'.join(map(str, self.path))}:{self.draws}"
+
+    def __repr__(self) -> str:
+        return f"RngStream({self.root_seed!r}, {self.path!r})"
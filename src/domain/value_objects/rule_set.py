@@ -0,0 +1,72 @@
+from typing import Sequence, Tuple
+
+class RuleSet:
+    """
+    Precomputed outcome matrix for a hand game such as Rock-Paper-Scissors.
+
+    Moves are identified by small integer codes (their position in `names`).
+    `outcomes[code1][code2]` is 1 if code1 beats code2, -1 if it loses and 0 for
+    a tie, so resolving a round is two tuple lookups with no allocation.
+    """
+
+    __slots__ = ("names", "outcomes", "beaten_by")
+
+    def __init__(self, names: Sequence[str], outcomes: Sequence[Sequence[int]]):
+        """
+        Initialize a rule set from an explicit outcome matrix.
+
+        Args:
+            names (Sequence[str]): Name of every move, in code order.
+            outcomes (Sequence[Sequence[int]]): Square, antisymmetric matrix of 1/0/-1 outcomes.
+
+        Raises:
+            ValueError: If the matrix is not square or not antisymmetric.
+        """
+        size = len(names)
+        if len(outcomes) != size or any(len(row) != size for row in outcomes):
+            raise ValueError("Outcome matrix must be square and match the number of moves.")
+        for code1 in range(size):
+            for code2 in range(size):
+                if outcomes[code1][code2] != -outcomes[code2][code1]:
+                    raise ValueError("Outcome matrix must be antisymmetric.")
+
+        self.names: Tuple[str, ...] = tuple(names)
+        self.outcomes: Tuple[Tuple[int, ...], ...] = tuple(tuple(row) for row in outcomes)
+        # beaten_by[code] lists the codes that beat `code`, e.g. for counter-strategies
+        self.beaten_by: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(other for other in range(size) if self.outcomes[other][code] == 1) for code in range(size)
+        )
+
+    @classmethod
+    def cyclic(cls, names: Sequence[str]) -> "RuleSet":
+        """
+        Build a balanced cyclic game with an odd number of moves.
+
+        Move i beats move j when (i - j) mod n is odd, so every move beats exactly
+        half of the others. With ("rock", "paper", "scissors") this gives the
+        classic rules and with ("rock", "paper", "scissors", "spock", "lizard")
+        it gives Rock-Paper-Scissors-Lizard-Spock.
+
+        Raises:
+            ValueError: If the number of moves is even.
+        """
+        size = len(names)
+        if size % 2 == 0:
+            raise ValueError("Cyclic games need an odd number of moves.")
+        outcomes = [
+            [0 if code1 == code2 else (1 if (code1 - code2) % size % 2 else -1) for code2 in range(size)]
+            for code1 in range(size)
+        ]
+        return cls(names, outcomes)
+
+    @property
+    def size(self) -> int:
+        """Number of moves in the game."""
+        return len(self.names)
+
+    def compare(self, code1: int, code2: int) -> int:
+        """Return 1 if code1 wins, -1 if code2 wins and 0 for a tie."""
+        return self.outcomes[code1][code2]
+
+CLASSIC = RuleSet.cyclic(("rock", "paper", "scissors"))
+ROCK_PAPER_SCISSORS_LIZARD_SPOCK = RuleSet.cyclic(("rock", "paper", "scissors", "spock", "lizard"))
@@ -0,0 +1,99 @@
+import csv
+import itertools
+import os
+from typing import Iterable, Iterator, List
+
+from ...application.interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game
+
+COLUMNS = (
+    "game_id", "round_number", "player1_id", "player2_id",
+    "player1_move", "player2_move", "winner_id", "played_at",
+)
+
+
+class RoundHistoryExporter:
+    """
+    Streams the round history of every game in a repository to chunked CSV files.
+
+    The export is a generator pipeline: games are pulled from the repository's
+    `iter_games` one at a time, flattened into rows, grouped into fixed-size chunks and
+    written to numbered part files (part-00000.csv, part-00001.csv, ...) of at
+    most `rows_per_file` rows each, like a partitioned Parquet dataset. Only one
+    chunk of rows is held in memory at a time, however many games are exported.
+    """
+
+    def __init__(self, game_repository: IGameRepository, rows_per_file: int = 1_000_000, chunk_size: int = 10_000):
+        """
+        Initialize the exporter.
+
+        Args:
+            game_repository (IGameRepository): The repository to export from.
+            rows_per_file (int, optional): Maximum number of rows per part file. Defaults to 1,000,000.
+            chunk_size (int, optional): Number of rows buffered before each write. Defaults to 10,000.
+        """
+        self.game_repository = game_repository
+        self.rows_per_file = rows_per_file
+        self.chunk_size = min(chunk_size, rows_per_file)
+
+    def export(self, directory: str) -> List[str]:
+        """
+        Export all rounds to part files in `directory`.
+
+        Returns:
+            List[str]: Paths of the files written.
+        """
+        os.makedirs(directory, exist_ok=True)
+        rows = self.iter_rows(self.game_repository.iter_games())
+        return self._write(self.iter_chunks(rows, self.chunk_size), directory)
+
+    @staticmethod
+    def iter_rows(games: Iterable[Game]) -> Iterator[tuple]:
+        """Flatten games into one row per recorded round, in COLUMNS order."""
+        for game in games:
+            player_ids = (game.player1.id, game.player2.id)
+            for record in game.history:
+                yield (
+                    game.id,
+                    record.round_number,
+                    player_ids[0],
+                    player_ids[1],
+                    record.player1_move.value,
+                    record.player2_move.value,
+                    "" if record.winner_seat is None else player_ids[record.winner_seat],
+                    f"{record.timestamp:.6f}",
+                )
+
+    @staticmethod
+    def iter_chunks(rows: Iterable[tuple], size: int) -> Iterator[List[tuple]]:
+        """Group rows into lists of at most `size` rows."""
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _write(self, chunks: Iterator[List[tuple]], directory: str) -> List[str]:
+        paths: List[str] = []
+        output = None
+        rows_in_file = 0
+        try:
+            for chunk in chunks:
+                while chunk:
+                    if output is None or rows_in_file == self.rows_per_file:
+                        if output is not None:
+                            output.close()
+                        paths.append(os.path.join(directory, f"part-{len(paths):05d}.csv"))
+                        output = open(paths[-1], "w", newline="", encoding="utf-8")
+                        writer = csv.writer(output)
+                        writer.writerow(COLUMNS)
+                        rows_in_file = 0
+                    room = self.rows_per_file - rows_in_file
+                    writer.writerows(chunk[:room])
+                    rows_in_file += min(room, len(chunk))
+                    chunk = chunk[room:]
+        finally:
+            if output is not None:
+                output.close()
+        return paths
@@ -0,0 +1,19 @@
+from typing import Dict, List
+from ...domain.entities.game import Game
+from ...application.interfaces.iasync_game_repository import IAsyncGameRepository
+
+class AsyncInMemoryGameRepository(IAsyncGameRepository):
+    def __init__(self):
+        self._games: Dict[str, Game] = {}
+
+    async def save(self, game: Game):
+        self._games[game.id] = game
+
+    async def get(self, game_id: str) -> Game:
+        return self._games.get(game_id)
+
+    async def delete(self, game_id: str):
+        self._games.pop(game_id, None)
+
+    async def list_all(self) -> List[Game]:
+        return list(self._games.values())
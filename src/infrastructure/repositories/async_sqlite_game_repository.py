@@ -0,0 +1,47 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from ...application.interfaces.iasync_game_repository import IAsyncGameRepository
+from ...domain.entities.game import Game
+from .sqlite_game_repository import SQLiteGameRepository
+
+class AsyncSQLiteGameRepository(IAsyncGameRepository):
+    """
+    Non-blocking adapter over SQLiteGameRepository.
+
+    Every call runs on a dedicated thread pool sized to the connection pool,
+    so the event loop never waits on SQLite I/O.
+    """
+
+    def __init__(self, database: str, pool_size: int = 4, **options):
+        """
+        Initialize the repository.
+
+        Args:
+            database (str): Path of the SQLite database file.
+            pool_size (int, optional): Number of pooled connections and worker threads. Defaults to 4.
+            **options: Extra keyword arguments forwarded to SQLiteGameRepository (e.g. write_behind).
+        """
+        self._repository = SQLiteGameRepository(database, pool_size=pool_size, **options)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="sqlite-repository")
+
+    async def save(self, game: Game):
+        await self._run(self._repository.save, game)
+
+    async def get(self, game_id: str) -> Game:
+        return await self._run(self._repository.get, game_id)
+
+    async def delete(self, game_id: str):
+        await self._run(self._repository.delete, game_id)
+
+    async def list_all(self) -> List[Game]:
+        return await self._run(self._repository.list_all)
+
+    async def close(self) -> None:
+        """Flush pending writes, close the database and stop the worker threads."""
+        await self._run(self._repository.close)
+        self._executor.shutdown()
+
+    def _run(self, function, *args):
+        return asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
@@ -0,0 +1,275 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ...application.interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game
+
+_NEVER_SAVED = -1
+
+
+class _Entry:
+    """A cached game and the version last written to the backing store."""
+
+    __slots__ = ("game", "saved_version", "expires_at")
+
+    def __init__(self, game: Game, saved_version: int, expires_at: float):
+        self.game = game
+        self.saved_version = saved_version
+        self.expires_at = expires_at
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a CachingGameRepository since it was created."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    writes: int  # Saves forwarded to the backing store
+    skipped_writes: int  # Saves of unchanged games that were not forwarded
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachingGameRepository(IGameRepository):
+    """
+    Bounded cache in front of any game repository.
+
+    Up to `capacity` games are kept, least recently used first out, and with
+    a `ttl` an entry also expires that many seconds after its last access.
+    `get` serves cached games without touching the backing store; a miss loads
+    the game and caches it.
+
+    Writes are write-through by default: `save` forwards the game at once.
+    With `write_back`, `save` only marks the entry dirty, and the game is
+    written when it is evicted or expires, or on `flush` and `close`. Either
+    way a save is skipped when the game's version has not moved since it was
+    last written, so games that did not change are never re-saved.
+
+    The cache holds one lock around every operation, including the calls to
+    the backing store, so a game is never read back from the store while a
+    newer version of it is waiting to be written.
+    """
+
+    def __init__(
+        self,
+        repository: IGameRepository,
+        capacity: int = 10000,
+        ttl: Optional[float] = None,
+        write_back: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Wrap a repository.
+
+        Args:
+            repository (IGameRepository): The backing store.
+            capacity (int, optional): Maximum number of cached games. Defaults to 10000.
+            ttl (Optional[float]): Seconds an entry is kept after its last access. Defaults to no expiry.
+            write_back (bool, optional): Defer writes until eviction or flush. Defaults to False.
+            clock (Callable[[], float], optional): Time source, in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive.")
+        self.repository = repository
+        self.capacity = capacity
+        self.ttl = ttl
+        self.write_back = write_back
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._writes = 0
+        self._skipped_writes = 0
+
+    def save(self, game: Game):
+        with self._lock:
+            entry = self._entries.get(game.id)
+            if entry is None or entry.game is not game:
+                entry = _Entry(game, _NEVER_SAVED, 0.0)
+                self._entries[game.id] = entry
+            else:
+                self._entries.move_to_end(game.id)
+            entry.expires_at = self._expiry()
+            if not self.write_back:
+                self._write(entry)
+            self._evict_overflow()
+
+    def get(self, game_id: str) -> Optional[Game]:
+        with self._lock:
+            entry = self._entries.get(game_id)
+            if entry is not None:
+                if self.ttl is None or entry.expires_at > self._clock():
+                    self._hits += 1
+                    self._entries.move_to_end(game_id)
+                    entry.expires_at = self._expiry()
+                    return entry.game
+                self._drop(game_id, entry)
+                self._expirations += 1
+            self._misses += 1
+            game = self.repository.get(game_id)
+            if game is not None:
+                self._entries[game_id] = _Entry(game, game.version, self._expiry())
+                self._evict_overflow()
+            return game
+
+    def save_many(self, games: Iterable[Game]):
+        """Cache several games; in write-through mode the changed ones are written with one bulk save."""
+        with self._lock:
+            expires_at = self._expiry()
+            entries: List[_Entry] = []
+            for game in games:
+                entry = self._entries.get(game.id)
+                if entry is None or entry.game is not game:
+                    entry = _Entry(game, _NEVER_SAVED, expires_at)
+                    self._entries[game.id] = entry
+                else:
+                    self._entries.move_to_end(game.id)
+                    entry.expires_at = expires_at
+                entries.append(entry)
+            if not self.write_back:
+                dirty = [(entry, entry.game.version) for entry in entries if entry.game.version != entry.saved_version]
+                self._skipped_writes += len(entries) - len(dirty)
+                if dirty:
+                    self.repository.save_many([entry.game for entry, _ in dirty])
+                    for entry, version in dirty:
+                        entry.saved_version = version
+                    self._writes += len(dirty)
+            self._evict_overflow()
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        """Serve cached games and load all the others with one bulk read."""
+        with self._lock:
+            found: Dict[str, Game] = {}
+            missing: List[str] = []
+            now = self._clock()
+            expires_at = self._expiry()
+            for game_id in dict.fromkeys(game_ids):
+                entry = self._entries.get(game_id)
+                if entry is not None and (self.ttl is None or entry.expires_at > now):
+                    self._entries.move_to_end(game_id)
+                    entry.expires_at = expires_at
+                    found[game_id] = entry.game
+                    continue
+                if entry is not None:
+                    self._drop(game_id, entry)
+                    self._expirations += 1
+                missing.append(game_id)
+            self._hits += len(found)
+            self._misses += len(missing)
+            if missing:
+                loaded = self.repository.get_many(missing)
+                for game_id, game in loaded.items():
+                    self._entries[game_id] = _Entry(game, game.version, expires_at)
+                found.update(loaded)
+                self._evict_overflow()
+            return found
+
+    def delete(self, game_id: str):
+        with self._lock:
+            self._entries.pop(game_id, None)
+            self.repository.delete(game_id)
+
+    def list_all(self) -> Iterable[Game]:
+        """List all games of the backing store, after writing any dirty entries."""
+        with self._lock:
+            self._flush()
+        return self.repository.list_all()
+
+    def iter_games(self) -> Iterator[Game]:
+        """Iterate over all games of the backing store, after writing any dirty entries."""
+        with self._lock:
+            self._flush()
+        return self.repository.iter_games()
+
+    def flush(self) -> int:
+        """
+        Write every dirty entry to the backing store.
+
+        Returns:
+            int: The number of games written.
+        """
+        with self._lock:
+            return self._flush()
+
+    def evict_expired(self) -> int:
+        """Drop every expired entry, writing it first if dirty. Returns the number dropped."""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            now = self._clock()
+            expired = [(game_id, entry) for game_id, entry in self._entries.items() if entry.expires_at <= now]
+            for game_id, entry in expired:
+                self._drop(game_id, entry)
+            self._expirations += len(expired)
+            return len(expired)
+
+    def close(self) -> None:
+        """Flush dirty entries, then close the backing store if it can be closed."""
+        self.flush()
+        close = getattr(self.repository, "close", None)
+        if close is not None:
+            close()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss, eviction and write counts."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                writes=self._writes,
+                skipped_writes=self._skipped_writes,
+                size=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expiry(self) -> float:
+        return 0.0 if self.ttl is None else self._clock() + self.ttl
+
+    def _write(self, entry: _Entry) -> bool:
+        """Forward an entry to the backing store if its game changed; caller holds the lock."""
+        version = entry.game.version
+        if version == entry.saved_version:
+            self._skipped_writes += 1
+            return False
+        self.repository.save(entry.game)
+        entry.saved_version = version
+        self._writes += 1
+        return True
+
+    def _drop(self, game_id: str, entry: _Entry) -> None:
+        """Remove an entry, writing it first if dirty; caller holds the lock."""
+        if entry.game.version != entry.saved_version:
+            self._write(entry)
+        del self._entries[game_id]
+
+    def _evict_overflow(self) -> None:
+        """Drop least recently used entries above capacity; caller holds the lock."""
+        while len(self._entries) > self.capacity:
+            game_id, entry = next(iter(self._entries.items()))
+            self._drop(game_id, entry)
+            self._evictions += 1
+
+    def _flush(self) -> int:
+        dirty: List[_Entry] = [entry for entry in self._entries.values() if entry.game.version != entry.saved_version]
+        for entry in dirty:
+            self._write(entry)
+        return len(dirty)
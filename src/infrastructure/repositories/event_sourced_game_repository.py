@@ -0,0 +1,429 @@
+import os
+import struct
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...application.interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.events.game_events import GameEvent, MovePlayed, RoundCompleted
+from ...domain.strategies.strategy import RANDOM
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+from ..serialization.strategy_codec import decode_strategy, encode_strategy
+
+# Every record starts with a 1-byte type and a 2-byte payload length.
+_HEADER = struct.Struct("<BH")
+_STARTED, _MOVE, _ROUND, _SNAPSHOT, _DELETED, _RNG, _STRATEGY = range(7)
+
+_STARTED_FIXED = struct.Struct("<IB")           # game index, computer flags
+_STRING_LENGTH = struct.Struct("<H")
+_MOVE_PAYLOAD = struct.Struct("<IBB")           # game index, seat, move code
+_ROUND_PAYLOAD = struct.Struct("<IIb")          # game index, round number, winner seat (-1 for a tie)
+_SNAPSHOT_PAYLOAD = struct.Struct("<IBIIIBBbBB")  # see _encode_snapshot
+_DELETED_PAYLOAD = struct.Struct("<I")
+# _RNG: game index, then the stream's string form; appended after saves that drew from it
+_STRATEGY_FIXED = struct.Struct("<IB")          # game index, seat; then the strategy_codec JSON of the computer
+_MAX_PAYLOAD = 0xFFFF
+_StrategyTexts = Tuple[Optional[bytes], Optional[bytes]]  # Per seat; None for a human
+_GAME_INDEX = struct.Struct("<I")                # leading field of every per-game record
+
+_NONE = 0xFF
+_STATUSES = list(GameStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+
+
+class _GameLog:
+    """Location of everything needed to rebuild one game from the log."""
+
+    __slots__ = ("index", "started_offset", "snapshot_offset", "move_offsets", "rng", "strategies")
+
+    def __init__(self, index: int, started_offset: int):
+        self.index = index
+        self.started_offset = started_offset
+        self.snapshot_offset: Optional[int] = None
+        self.move_offsets: List[int] = []
+        self.rng: Optional[str] = None  # Latest logged position of the game's RngStream
+        # Per seat, (offset, hash of the payload) of the latest strategy record, if any
+        self.strategies: List[Optional[Tuple[int, int]]] = [None, None]
+
+
+class EventSourcedGameRepository(IGameRepository):
+    """
+    Game repository backed by a binary append-only event log.
+
+    Instead of rewriting the whole game on every save, only the events the game
+    recorded since the previous save are appended (9 bytes per move, 12 per
+    round), so the durable cost of a move does not depend on how long the match
+    has been running. Every `snapshot_interval` moves a fixed-size snapshot of
+    the game is appended as well, and `get` rebuilds the game from its latest
+    snapshot plus the moves that followed. The position of a game's
+    RngStream is appended whenever a save finds that it moved, and kept in
+    the index, so rebuilt games go on drawing where they stopped. Likewise,
+    the strategy of a computer seat, learned model included, is appended
+    whenever it changed; only the built-in strategies can be stored, and
+    saving a game whose computer uses another strategy raises ValueError.
+
+    The log is the source of truth: reopening the file rebuilds the in-memory
+    offset index, and `iter_events` replays the full history for audits.
+    """
+
+    def __init__(self, path: str, snapshot_interval: int = 64, durable: bool = False):
+        """
+        Open (or create) the event log.
+
+        Args:
+            path (str): Path of the log file.
+            snapshot_interval (int, optional): Number of moves between snapshots of a game. Defaults to 64.
+            durable (bool, optional): fsync the log after every save. Defaults to False.
+        """
+        self._path = path
+        self._snapshot_interval = snapshot_interval
+        self._durable = durable
+        self._lock = threading.Lock()
+        self._games: Dict[str, _GameLog] = {}
+        self._ids: List[Optional[str]] = []  # game index -> game ID
+        self._fd: Optional[int] = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size = self._load_index()
+
+    def save(self, game: Game):
+        """Append the changes made to a game since it was last saved."""
+        self.save_many((game,))
+
+    def save_many(self, games: Iterable[Game]):
+        """Append the changes made to several games in a single write."""
+        games = list(games)
+        # Encoded up front, so that a strategy that cannot be stored fails the save before the index changes
+        strategies = [self._strategy_texts(game) for game in games]
+        with self._lock:
+            chunks: List[bytes] = []
+            position = self._size
+            for game, texts in zip(games, strategies):
+                for chunk in self._encode_changes(game, position):
+                    chunks.append(chunk)
+                    position += len(chunk)
+                log = self._games[game.id]
+                chunk = self._encode_rng(log, game)
+                if chunk:
+                    chunks.append(chunk)
+                    position += len(chunk)
+                for chunk in self._encode_strategies(log, texts, position):
+                    chunks.append(chunk)
+                    position += len(chunk)
+            if chunks:
+                self._append(chunks)
+
+    def get(self, game_id: str) -> Game:
+        """Rebuild a game from its latest snapshot and the moves appended after it."""
+        with self._lock:
+            log = self._games.get(game_id)
+            if log is None:
+                return None
+            game = self._rebuild(log)
+        game.track_events()
+        return game
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        """Rebuild several games, taking the lock once."""
+        with self._lock:
+            games = {game_id: self._rebuild(self._games[game_id]) for game_id in game_ids if game_id in self._games}
+        for game in games.values():
+            game.track_events()
+        return games
+
+    def delete(self, game_id: str):
+        """Append a tombstone for the game and forget it."""
+        with self._lock:
+            log = self._games.pop(game_id, None)
+            if log is not None:
+                self._append([_HEADER.pack(_DELETED, _DELETED_PAYLOAD.size) + _DELETED_PAYLOAD.pack(log.index)])
+
+    def list_all(self) -> List[Game]:
+        """Rebuild and list all games."""
+        with self._lock:
+            games = [self._rebuild(log) for log in self._games.values()]
+        for game in games:
+            game.track_events()
+        return games
+
+    def iter_events(self, game_id: Optional[str] = None) -> Iterator[GameEvent]:
+        """
+        Replay the log from the beginning, yielding every move and round event.
+
+        Args:
+            game_id (Optional[str]): Only yield events of this game.
+        """
+        seats: Dict[int, tuple] = {}
+        for offset, record_type, payload in self._scan():
+            if record_type == _STARTED:
+                index, _, game_ids = self._decode_started(payload)
+                seats[index] = (game_ids[0], game_ids[1], game_ids[3])
+            elif record_type == _MOVE:
+                index, seat, code = _MOVE_PAYLOAD.unpack(payload)
+                ids = seats[index]
+                if game_id is None or ids[0] == game_id:
+                    yield MovePlayed(ids[0], ids[1 + seat], Move.from_code(code))
+            elif record_type == _ROUND:
+                index, round_number, winner = _ROUND_PAYLOAD.unpack(payload)
+                ids = seats[index]
+                if game_id is None or ids[0] == game_id:
+                    yield RoundCompleted(ids[0], round_number, None if winner < 0 else ids[1 + winner])
+
+    def close(self) -> None:
+        """Close the underlying log file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _encode_changes(self, game: Game, position: int) -> List[bytes]:
+        """
+        Encode the records for a game's changes and update its log entry.
+
+        The caller holds the lock and appends the records at `position`.
+        """
+        log = self._games.get(game.id)
+        chunks = []
+        if log is None:
+            log = _GameLog(len(self._ids), position)
+            self._ids.append(game.id)
+            self._games[game.id] = log
+            chunks.append(self._encode_started(log.index, game))
+            position += len(chunks[0])
+
+        if log.snapshot_offset is None or not game.is_tracking_events:
+            # Unknown state: the game was created or changed outside this repository
+            game.pull_events()
+            chunks.append(self._encode_snapshot(log.index, game))
+            log.snapshot_offset = position
+            log.move_offsets = []
+            game.track_events()
+            return chunks
+
+        offsets = []
+        for event in game.pull_events():
+            chunk = self._encode_event(log.index, game, event)
+            if isinstance(event, MovePlayed):
+                offsets.append(position)
+            chunks.append(chunk)
+            position += len(chunk)
+        if not chunks:
+            return chunks
+
+        if len(log.move_offsets) + len(offsets) >= self._snapshot_interval:
+            chunks.append(self._encode_snapshot(log.index, game))
+            log.snapshot_offset = position
+            log.move_offsets = []
+        else:
+            log.move_offsets.extend(offsets)
+        return chunks
+
+    def _append(self, chunks: List[bytes]) -> None:
+        data = b"".join(chunks)
+        os.write(self._fd, data)  # O_APPEND makes this a single append
+        if self._durable:
+            os.fsync(self._fd)
+        self._size += len(data)
+
+    def _read(self, offset: int) -> tuple:
+        record_type, length = _HEADER.unpack(os.pread(self._fd, _HEADER.size, offset))
+        return record_type, os.pread(self._fd, length, offset + _HEADER.size)
+
+    def _scan(self) -> Iterator[tuple]:
+        """Yield (offset, record type, payload) for every complete record in the log."""
+        offset = 0
+        with open(self._path, "rb") as log_file:
+            while True:
+                header = log_file.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    break
+                record_type, length = _HEADER.unpack(header)
+                payload = log_file.read(length)
+                if len(payload) < length:
+                    break  # Torn write at the tail, e.g. after a crash
+                yield offset, record_type, payload
+                offset += _HEADER.size + length
+
+    def _load_index(self) -> int:
+        end = 0
+        for offset, record_type, payload in self._scan():
+            if record_type == _STARTED:
+                index, _, strings = self._decode_started(payload)
+                while len(self._ids) <= index:
+                    self._ids.append(None)
+                self._ids[index] = strings[0]
+                self._games[strings[0]] = _GameLog(index, offset)
+            elif record_type != _ROUND:
+                (index,) = _GAME_INDEX.unpack_from(payload)
+                log = self._games.get(self._ids[index])
+                if log is not None and record_type == _MOVE:
+                    log.move_offsets.append(offset)
+                elif log is not None and record_type == _SNAPSHOT:
+                    log.snapshot_offset = offset
+                    log.move_offsets = []
+                elif log is not None and record_type == _RNG:
+                    log.rng = payload[_GAME_INDEX.size:].decode("ascii")
+                elif log is not None and record_type == _STRATEGY:
+                    _, seat = _STRATEGY_FIXED.unpack_from(payload)
+                    log.strategies[seat] = (offset, hash(payload))
+                elif log is not None:
+                    del self._games[self._ids[index]]
+            end = offset + _HEADER.size + len(payload)
+
+        if end < os.fstat(self._fd).st_size:
+            os.ftruncate(self._fd, end)
+        return end
+
+    def _rebuild(self, log: _GameLog) -> Game:
+        _, payload = self._read(log.started_offset)
+        _, flags, strings = self._decode_started(payload)
+        game_id, player1_id, player1_name, player2_id, player2_name = strings[:5]
+        end_condition = strings[5] if len(strings) > 5 else ""  # Absent from logs written before end conditions
+        player1 = Player(player1_name, is_computer=bool(flags & 1), player_id=player1_id)
+        player2 = Player(player2_name, is_computer=bool(flags & 2), player_id=player2_id)
+        game = Game(
+            player1, player2, game_id=game_id,
+            end_condition=EndCondition.parse(end_condition) if end_condition else None,
+            rng=RngStream.parse(log.rng) if log.rng else None,
+        )
+
+        _, payload = self._read(log.snapshot_offset)
+        self._restore_snapshot(game, payload)
+
+        players = (player1.id, player2.id)
+        for offset in log.move_offsets:
+            _, payload = self._read(offset)
+            _, seat, code = _MOVE_PAYLOAD.unpack(payload)
+            game.apply_event(MovePlayed(game.id, players[seat], Move.from_code(code)))
+        game.history = None  # Replayed rounds would carry replay-time timestamps; the log is the history
+
+        # Strategies are restored last: their records already include the rounds replayed above
+        for player, entry in zip((player1, player2), log.strategies):
+            if entry is not None:
+                _, payload = self._read(entry[0])
+                text = payload[_STRATEGY_FIXED.size:].decode("ascii")
+                player.strategy = decode_strategy(text or None) or RANDOM
+        return game
+
+    @staticmethod
+    def _encode_started(index: int, game: Game) -> bytes:
+        flags = int(game.player1.is_computer) | int(game.player2.is_computer) << 1
+        parts = [_STARTED_FIXED.pack(index, flags)]
+        end_condition = "" if game.end_condition is None else str(game.end_condition)
+        for text in (game.id, game.player1.id, game.player1.name, game.player2.id, game.player2.name, end_condition):
+            encoded = text.encode("utf-8")
+            parts.append(_STRING_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        payload = b"".join(parts)
+        return _HEADER.pack(_STARTED, len(payload)) + payload
+
+    @staticmethod
+    def _encode_rng(log: _GameLog, game: Game) -> bytes:
+        """Encode the position of the game's stream if it moved since it was logged, and note it in the index."""
+        if not isinstance(game.rng, RngStream):
+            return b""
+        rng = str(game.rng)
+        if rng == log.rng:
+            return b""
+        log.rng = rng
+        payload = _GAME_INDEX.pack(log.index) + rng.encode("ascii")
+        return _HEADER.pack(_RNG, len(payload)) + payload
+
+    @staticmethod
+    def _strategy_texts(game: Game) -> _StrategyTexts:
+        """Encode the strategy of each computer seat; empty for the default strategy, None for humans."""
+        texts = []
+        for player in (game.player1, game.player2):
+            if not player.is_computer:
+                texts.append(None)
+                continue
+            text = (encode_strategy(player.strategy) or "").encode("ascii")
+            if _STRATEGY_FIXED.size + len(text) > _MAX_PAYLOAD:
+                raise ValueError(f"The strategy of {player.name} is too large for the event log.")
+            texts.append(text)
+        return texts[0], texts[1]
+
+    @staticmethod
+    def _encode_strategies(log: _GameLog, texts: _StrategyTexts, position: int) -> List[bytes]:
+        """
+        Encode the strategies that changed since they were logged and note them in the index.
+
+        The records are appended at `position`, after the game's other records of this save.
+        """
+        chunks = []
+        for seat, text in enumerate(texts):
+            if text is None:
+                continue
+            payload = _STRATEGY_FIXED.pack(log.index, seat) + text
+            logged = log.strategies[seat]
+            if (logged is None and not text) or (logged is not None and logged[1] == hash(payload)):
+                continue
+            chunks.append(_HEADER.pack(_STRATEGY, len(payload)) + payload)
+            log.strategies[seat] = (position, hash(payload))
+            position += len(chunks[-1])
+        return chunks
+
+    @staticmethod
+    def _decode_started(payload: bytes) -> tuple:
+        index, flags = _STARTED_FIXED.unpack_from(payload)
+        offset = _STARTED_FIXED.size
+        strings = []
+        while offset < len(payload):
+            (length,) = _STRING_LENGTH.unpack_from(payload, offset)
+            offset += _STRING_LENGTH.size
+            strings.append(payload[offset:offset + length].decode("utf-8"))
+            offset += length
+        return index, flags, strings
+
+    @staticmethod
+    def _encode_event(index: int, game: Game, event: GameEvent) -> bytes:
+        if isinstance(event, MovePlayed):
+            seat = 0 if event.player_id == game.player1.id else 1
+            return _HEADER.pack(_MOVE, _MOVE_PAYLOAD.size) + _MOVE_PAYLOAD.pack(index, seat, event.move.code)
+        if event.winner_id is None:
+            winner = -1
+        else:
+            winner = 0 if event.winner_id == game.player1.id else 1
+        return _HEADER.pack(_ROUND, _ROUND_PAYLOAD.size) + _ROUND_PAYLOAD.pack(index, event.round_number, winner)
+
+    @staticmethod
+    def _encode_snapshot(index: int, game: Game) -> bytes:
+        player1_id, player2_id = game.player1.id, game.player2.id
+
+        def code(move: Optional[Move]) -> int:
+            return _NONE if move is None else move.code
+
+        if game.last_round_winner is None:
+            winner = -1
+        else:
+            winner = 0 if game.last_round_winner == player1_id else 1
+        payload = _SNAPSHOT_PAYLOAD.pack(
+            index,
+            _STATUS_CODES[game.status],
+            game.round_number,
+            game.scores[player1_id],
+            game.scores[player2_id],
+            code(game.last_round_moves.get(player1_id)),
+            code(game.last_round_moves.get(player2_id)),
+            winner,
+            code(game.current_moves[player1_id]),
+            code(game.current_moves[player2_id]),
+        )
+        return _HEADER.pack(_SNAPSHOT, len(payload)) + payload
+
+    @staticmethod
+    def _restore_snapshot(game: Game, payload: bytes) -> None:
+        (
+            _, status, round_number, score1, score2, last1, last2, winner, current1, current2
+        ) = _SNAPSHOT_PAYLOAD.unpack(payload)
+        players = (game.player1.id, game.player2.id)
+        game.status = _STATUSES[status]
+        game.round_number = round_number
+        game.scores = {players[0]: score1, players[1]: score2}
+        if last1 != _NONE:
+            game.last_round_moves = {players[0]: Move.from_code(last1), players[1]: Move.from_code(last2)}
+        game.last_round_winner = None if winner < 0 else players[winner]
+        game.current_moves = {
+            players[0]: None if current1 == _NONE else Move.from_code(current1),
+            players[1]: None if current2 == _NONE else Move.from_code(current2),
+        }
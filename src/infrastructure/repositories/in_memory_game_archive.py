@@ -0,0 +1,82 @@
+import threading
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+from ...application.interfaces.igame_archive import IGameArchive
+from ...domain.entities.game_summary import GameSummary
+
+
+class InMemoryGameArchive(IGameArchive):
+    """
+    Compact in-memory archive of finished games.
+
+    Summaries are not kept as objects: each field lives in its own typed array
+    (player names are stored once and referenced by number), so an archived
+    game costs about 30 bytes plus its ID and an index entry, a small fraction
+    of a live Game. Summaries are rebuilt on read.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._positions: Dict[str, int] = {}
+        self._game_ids: List[str] = []
+        self._name_codes: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._players = array("I")  # player1 name code, player2 name code
+        self._scores = array("I")   # player1 score, player2 score
+        self._rounds = array("I")
+        self._completed_at = array("d")
+
+    def add(self, summary: GameSummary):
+        """Archive a summary. Archiving the same game again replaces its summary."""
+        with self._lock:
+            position = self._positions.get(summary.game_id)
+            players = (self._name_code(summary.player1_name), self._name_code(summary.player2_name))
+            if position is None:
+                self._positions[summary.game_id] = len(self._game_ids)
+                self._game_ids.append(summary.game_id)
+                self._players.extend(players)
+                self._scores.extend((summary.player1_score, summary.player2_score))
+                self._rounds.append(summary.rounds_played)
+                self._completed_at.append(summary.completed_at)
+            else:
+                self._players[2 * position:2 * position + 2] = array("I", players)
+                self._scores[2 * position:2 * position + 2] = array(
+                    "I", (summary.player1_score, summary.player2_score)
+                )
+                self._rounds[position] = summary.rounds_played
+                self._completed_at[position] = summary.completed_at
+
+    def get(self, game_id: str) -> Optional[GameSummary]:
+        """Rebuild the summary of an archived game."""
+        with self._lock:
+            position = self._positions.get(game_id)
+            return None if position is None else self._summary(position)
+
+    def list_all(self) -> Iterator[GameSummary]:
+        """Lazily rebuild every archived summary, in archival order."""
+        with self._lock:
+            count = len(self._game_ids)
+        for position in range(count):
+            yield self._summary(position)
+
+    def __len__(self) -> int:
+        return len(self._game_ids)
+
+    def _name_code(self, name: str) -> int:
+        code = self._name_codes.get(name)
+        if code is None:
+            code = self._name_codes[name] = len(self._names)
+            self._names.append(name)
+        return code
+
+    def _summary(self, position: int) -> GameSummary:
+        return GameSummary(
+            self._game_ids[position],
+            self._names[self._players[2 * position]],
+            self._names[self._players[2 * position + 1]],
+            self._scores[2 * position],
+            self._scores[2 * position + 1],
+            self._rounds[position],
+            self._completed_at[position],
+        )
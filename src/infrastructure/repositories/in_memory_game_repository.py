@@ -1,19 +1,166 @@
-from typing import Dict, List
+import itertools
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from ...domain.entities.game import Game
 from ...application.interfaces.igame_repository import IGameRepository
+from ..serialization.game_codec import decode_game, decode_game_id, encode_game
+from ..serialization.game_snapshot import GameSnapshot, game_id_hash, write_snapshot
 
 class InMemoryGameRepository(IGameRepository):
-    def __init__(self):
+    """
+    Dict-backed game repository.
+
+    With a `snapshot_path`, the repository survives restarts: `save_snapshot`
+    writes every game to a memory-mapped snapshot file (also every
+    `snapshot_interval` seconds in a background thread, and on `close`), and
+    a repository created over an existing snapshot attaches to it without
+    reading it. Snapshot games are decoded on their first `get`, so startup
+    time does not depend on the number of games.
+
+    Snapshots hold what game_codec encodes, i.e. the live state of each
+    game and the position of its RngStream: round history and computer
+    strategies are dropped, and computer seats play with the default
+    strategy after a restart.
+    """
+
+    def __init__(self, snapshot_path: Optional[str] = None, snapshot_interval: Optional[float] = None):
+        """
+        Initialize the repository.
+
+        Args:
+            snapshot_path (Optional[str]): Snapshot file to attach to if it exists, and to write snapshots to.
+            snapshot_interval (Optional[float]): Write a snapshot periodically, in seconds.
+        """
         self._games: Dict[str, Game] = {}
+        self._snapshot_path = snapshot_path
+        self._snapshot: Optional[GameSnapshot] = None
+        self._dropped: Set[str] = set()  # Snapshot games deleted since attaching
+        self._snapshot_lock = threading.Lock()  # Guards attaching, detaching and reading the snapshot
+        self._write_lock = threading.Lock()  # Serializes snapshot writes; the attached snapshot stays mapped meanwhile
+        self._encoded: Dict[str, Tuple[Game, int, bytes]] = {}  # game ID -> (game, version, record) last written
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            self._snapshot = GameSnapshot(snapshot_path)
+
+        self._stop_snapshots = threading.Event()
+        self._snapshotter: Optional[threading.Thread] = None
+        if snapshot_path is not None and snapshot_interval:
+            self._snapshotter = threading.Thread(
+                target=self._snapshot_periodically, args=(snapshot_interval,), daemon=True
+            )
+            self._snapshotter.start()
 
     def save(self, game: Game):
         self._games[game.id] = game
 
     def get(self, game_id: str) -> Game:
-        return self._games.get(game_id)
+        game = self._games.get(game_id)
+        if game is None and self._snapshot is not None:
+            game = self._load(game_id)
+        return game
 
     def delete(self, game_id: str):
         self._games.pop(game_id, None)
+        if self._snapshot is not None:
+            self._dropped.add(game_id)
 
     def list_all(self) -> List[Game]:
+        if self._snapshot is not None:
+            self._load_all()
         return list(self._games.values())
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        if self._snapshot is not None:
+            return super().get_many(game_ids)
+        games = self._games
+        return {game_id: games[game_id] for game_id in game_ids if game_id in games}
+
+    def save_many(self, games: Iterable[Game]):
+        self._games.update((game.id, game) for game in games)
+
+    def save_snapshot(self, path: Optional[str] = None) -> int:
+        """
+        Write every game to a snapshot file.
+
+        Games still sitting undecoded in the attached snapshot are copied over
+        as raw records, and games whose version has not changed since the
+        previous snapshot reuse their record instead of being encoded again.
+        Only the list of games is taken under the repository's lock, so `get`
+        is not held up while the file is written. A game that is being
+        changed by another thread meanwhile may be captured in either state.
+        Round history and computer strategies are not written.
+
+        Args:
+            path (Optional[str]): Where to write. Defaults to the repository's snapshot path.
+
+        Returns:
+            int: The number of games written.
+        """
+        path = path or self._snapshot_path
+        if path is None:
+            raise ValueError("No snapshot path configured.")
+        with self._write_lock:
+            with self._snapshot_lock:
+                games = list(self._games.values())
+                snapshot = self._snapshot
+                skip = set(self._games).union(self._dropped) if snapshot is not None else None
+
+            previous, encoded = self._encoded, {}
+            for game in games:
+                version = game.version  # Read first, so a concurrent change is encoded again next time
+                cached = previous.get(game.id)
+                if cached is not None and cached[0] is game and cached[1] == version:
+                    record = cached[2]
+                else:
+                    record = encode_game(game)
+                encoded[game.id] = (game, version, record)
+            self._encoded = encoded
+
+            records = ((game_id_hash(game_id), record) for game_id, (_, _, record) in encoded.items())
+            if snapshot is not None:
+                # Safe to read unlocked: detaching waits for the write lock before unmapping
+                carried = (
+                    (hash_value, record) for hash_value, record in snapshot.records()
+                    if decode_game_id(record) not in skip
+                )
+                records = itertools.chain(records, carried)
+            return write_snapshot(path, (), records)
+
+    def close(self) -> None:
+        """Stop periodic snapshots, write a final one if configured, and unmap the attached snapshot."""
+        self._stop_snapshots.set()
+        if self._snapshotter is not None:
+            self._snapshotter.join()
+        if self._snapshot_path is not None:
+            self.save_snapshot()
+        with self._write_lock, self._snapshot_lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+                self._snapshot = None
+
+    def _load(self, game_id: str) -> Optional[Game]:
+        with self._snapshot_lock:
+            if self._snapshot is None or game_id in self._dropped:
+                return self._games.get(game_id)
+            game = self._snapshot.get(game_id)
+            if game is not None:
+                game = self._games.setdefault(game_id, game)
+            return game
+
+    def _load_all(self) -> None:
+        """Decode every remaining snapshot game and detach from the snapshot."""
+        with self._write_lock, self._snapshot_lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                return
+            for _, record in snapshot.records():
+                game_id = decode_game_id(record)
+                if game_id not in self._games and game_id not in self._dropped:
+                    self._games[game_id] = decode_game(record)
+            self._snapshot = None
+            self._dropped.clear()
+            snapshot.close()
+
+    def _snapshot_periodically(self, interval: float) -> None:
+        while not self._stop_snapshots.wait(interval):
+            self.save_snapshot()
@@ -0,0 +1,196 @@
+import itertools
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...application.interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game, GameStatus
+
+
+class _Shard:
+    """A slice of the games, guarded by its own lock."""
+
+    __slots__ = ("lock", "games", "touched")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.games: Dict[str, Game] = {}
+        self.touched: Dict[str, float] = {}  # game ID -> last save/get time
+
+
+class ShardedInMemoryGameRepository(IGameRepository):
+    """
+    Thread-safe in-memory game repository.
+
+    Games are spread over `shard_count` shards by the hash of their ID, each
+    with its own lock, so threads working on different games rarely contend.
+    Games can expire: completed games after `completed_ttl` seconds and any
+    game after `idle_ttl` seconds without a save or get. Expired games are
+    removed by `evict_expired`, which also runs every `sweep_interval` seconds
+    in a background thread when configured.
+
+    `list_all` is a lazy iterator that copies one shard at a time, and `scan`
+    pages through the games with a cursor.
+    """
+
+    def __init__(
+        self,
+        shard_count: int = 64,
+        completed_ttl: Optional[float] = None,
+        idle_ttl: Optional[float] = None,
+        sweep_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the repository.
+
+        Args:
+            shard_count (int, optional): Number of shards, rounded up to a power of two. Defaults to 64.
+            completed_ttl (Optional[float]): Seconds a completed game is kept after its last access.
+            idle_ttl (Optional[float]): Seconds any game is kept after its last access.
+            sweep_interval (Optional[float]): Run `evict_expired` periodically in a background thread.
+            clock (Callable[[], float], optional): Time source, in seconds. Defaults to time.monotonic.
+        """
+        size = 1
+        while size < shard_count:
+            size <<= 1
+        self._shards = [_Shard() for _ in range(size)]
+        self._mask = size - 1
+        self._completed_ttl = completed_ttl
+        self._idle_ttl = idle_ttl
+        self._clock = clock
+
+        self._stop_sweeping = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        if sweep_interval:
+            self._sweeper = threading.Thread(target=self._sweep_periodically, args=(sweep_interval,), daemon=True)
+            self._sweeper.start()
+
+    def save(self, game: Game):
+        shard = self._shard(game.id)
+        now = self._clock()
+        with shard.lock:
+            shard.games[game.id] = game
+            shard.touched[game.id] = now
+
+    def get(self, game_id: str) -> Game:
+        shard = self._shard(game_id)
+        now = self._clock()
+        with shard.lock:
+            game = shard.games.get(game_id)
+            if game is not None:
+                shard.touched[game_id] = now
+            return game
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        """Retrieve several games, taking each shard lock once."""
+        by_shard: Dict[int, List[str]] = {}
+        for game_id in game_ids:
+            by_shard.setdefault(hash(game_id) & self._mask, []).append(game_id)
+        now = self._clock()
+        found: Dict[str, Game] = {}
+        for index, shard_ids in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                for game_id in shard_ids:
+                    game = shard.games.get(game_id)
+                    if game is not None:
+                        shard.touched[game_id] = now
+                        found[game_id] = game
+        return found
+
+    def save_many(self, games: Iterable[Game]):
+        """Save several games, taking each shard lock once."""
+        by_shard: Dict[int, List[Game]] = {}
+        for game in games:
+            by_shard.setdefault(hash(game.id) & self._mask, []).append(game)
+        now = self._clock()
+        for index, shard_games in by_shard.items():
+            shard = self._shards[index]
+            with shard.lock:
+                for game in shard_games:
+                    shard.games[game.id] = game
+                    shard.touched[game.id] = now
+
+    def delete(self, game_id: str):
+        shard = self._shard(game_id)
+        with shard.lock:
+            shard.games.pop(game_id, None)
+            shard.touched.pop(game_id, None)
+
+    def list_all(self) -> Iterator[Game]:
+        """Lazily iterate over all games, holding at most one shard lock at a time."""
+        for shard in self._shards:
+            with shard.lock:
+                games = list(shard.games.values())
+            yield from games
+
+    def scan(self, cursor: int = 0, count: int = 100) -> Tuple[int, List[Game]]:
+        """
+        Return up to `count` games starting at `cursor`, and the cursor of the next page.
+
+        Start with cursor 0 and stop when the returned cursor is 0 again. As with
+        any cursor over live data, games saved or deleted during a scan may be
+        missed or returned twice.
+        """
+        shard_index, offset = cursor >> 32, cursor & 0xFFFFFFFF
+        page: List[Game] = []
+        while shard_index < len(self._shards) and len(page) < count:
+            shard = self._shards[shard_index]
+            with shard.lock:
+                taken = list(itertools.islice(shard.games.values(), offset, offset + count - len(page)))
+                remaining = len(shard.games) - offset - len(taken)
+            page.extend(taken)
+            if remaining > 0:
+                # The page is full in the middle of this shard
+                return (shard_index << 32) | (offset + len(taken)), page
+            shard_index, offset = shard_index + 1, 0
+        return (shard_index << 32) if shard_index < len(self._shards) else 0, page
+
+    def __len__(self) -> int:
+        return sum(len(shard.games) for shard in self._shards)
+
+    def evict_expired(self) -> int:
+        """
+        Remove completed and idle games whose TTL has elapsed.
+
+        Returns:
+            int: The number of games removed.
+        """
+        if self._completed_ttl is None and self._idle_ttl is None:
+            return 0
+        now = self._clock()
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                expired = [
+                    game_id for game_id, touched in shard.touched.items()
+                    if self._is_expired(shard.games[game_id], now - touched)
+                ]
+                for game_id in expired:
+                    del shard.games[game_id]
+                    del shard.touched[game_id]
+            evicted += len(expired)
+        return evicted
+
+    def close(self) -> None:
+        """Stop the background sweeper, if any."""
+        self._stop_sweeping.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+
+    def _shard(self, game_id: str) -> _Shard:
+        return self._shards[hash(game_id) & self._mask]
+
+    def _is_expired(self, game: Game, idle_for: float) -> bool:
+        if self._idle_ttl is not None and idle_for >= self._idle_ttl:
+            return True
+        return (
+            self._completed_ttl is not None
+            and game.status == GameStatus.COMPLETED
+            and idle_for >= self._completed_ttl
+        )
+
+    def _sweep_periodically(self, interval: float) -> None:
+        while not self._stop_sweeping.wait(interval):
+            self.evict_expired()
@@ -1,23 +1,512 @@
 # infrastructure/repositories/sqlite_game_repository.py
 
-from application.interfaces.igame_repository import IGameRepository
-from domain.entities.game import Game
-from typing import List
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ...application.interfaces.igame_repository import IGameRepository
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.entities.round_history import RoundHistory
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+from ..serialization.strategy_codec import decode_strategy, encode_strategy
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    is_computer INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS games (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    round_number INTEGER NOT NULL,
+    last_round_winner_id TEXT REFERENCES players(id),
+    end_condition TEXT,
+    rng TEXT
+);
+CREATE TABLE IF NOT EXISTS game_players (
+    game_id TEXT NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    seat INTEGER NOT NULL,
+    player_id TEXT NOT NULL REFERENCES players(id),
+    score INTEGER NOT NULL,
+    current_move TEXT,
+    strategy TEXT,
+    PRIMARY KEY (game_id, seat)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS game_players_by_player ON game_players (player_id);
+CREATE TABLE IF NOT EXISTS rounds (
+    game_id TEXT NOT NULL REFERENCES games(id) ON DELETE CASCADE,
+    round_number INTEGER NOT NULL,
+    player1_move TEXT NOT NULL,
+    player2_move TEXT NOT NULL,
+    winner_id TEXT,
+    played_at REAL NOT NULL,
+    PRIMARY KEY (game_id, round_number)
+) WITHOUT ROWID;
+"""
+# Columns added after the first release, created on databases that predate them
+_ADDED_COLUMNS = (
+    ("games", "rng", "ALTER TABLE games ADD COLUMN rng TEXT"),
+    ("game_players", "strategy", "ALTER TABLE game_players ADD COLUMN strategy TEXT"),
+)
+
+# The statements below are module-level constants on purpose: sqlite3 keeps a
+# per-connection cache of compiled statements keyed by SQL text, so reusing the
+# exact same strings means every pooled connection prepares each one only once.
+_UPSERT_PLAYER = "INSERT OR IGNORE INTO players (id, name, is_computer) VALUES (?, ?, ?)"
+_UPSERT_GAME = (
+    "INSERT INTO games (id, status, round_number, last_round_winner_id, end_condition, rng) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (id) DO UPDATE SET status = excluded.status, round_number = excluded.round_number, "
+    "last_round_winner_id = excluded.last_round_winner_id, end_condition = excluded.end_condition, rng = excluded.rng"
+)
+_UPSERT_SEAT = (
+    "INSERT INTO game_players (game_id, seat, player_id, score, current_move, strategy) VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (game_id, seat) DO UPDATE SET score = excluded.score, current_move = excluded.current_move, "
+    "strategy = excluded.strategy"
+)
+_INSERT_ROUND = (
+    "INSERT OR IGNORE INTO rounds (game_id, round_number, player1_move, player2_move, winner_id, played_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SELECT_GAME_PLAYER_IDS = "SELECT player_id FROM game_players WHERE game_id = ?"
+_DELETE_ORPHAN_PLAYER = (
+    "DELETE FROM players WHERE id = ? AND NOT EXISTS (SELECT 1 FROM game_players WHERE player_id = players.id)"
+)
+_DELETE_GAME = "DELETE FROM games WHERE id = ?"
+_SELECT_GAMES = "SELECT g.id, g.status, g.round_number, g.last_round_winner_id, g.end_condition, g.rng FROM games g"
+_SELECT_SEATS = (
+    "SELECT g.id, gp.seat, p.id, p.name, p.is_computer, gp.score, gp.current_move, gp.strategy FROM games g "
+    "JOIN game_players gp ON gp.game_id = g.id JOIN players p ON p.id = gp.player_id"
+)
+_SELECT_LAST_ROUNDS = (
+    "SELECT g.id, r.player1_move, r.player2_move FROM games g "
+    "JOIN rounds r ON r.game_id = g.id AND r.round_number = g.round_number"
+)
+_SELECT_ROUNDS = (
+    "SELECT g.id, r.round_number, r.player1_move, r.player2_move, r.winner_id, r.played_at FROM games g "
+    "JOIN rounds r ON r.game_id = g.id"
+)
+_ROUNDS_ORDER = " ORDER BY g.id, r.round_number"
+_SELECT_GAME_PAGE = "SELECT id FROM games WHERE id > ? ORDER BY id LIMIT ?"
+_BY_ID = " WHERE g.id = ?"
+_BY_IDS = " WHERE g.id IN ({})"
+_MAX_IDS_PER_QUERY = 500  # Stays below the bound-parameter limit of older SQLite builds
+_MAX_TRACKED_GAMES = 65_536  # Games whose last written round is remembered between saves
+
+_GameRow = Tuple[str, str, int, Optional[str], Optional[str], Optional[str]]
+_RoundRow = Tuple[str, int, str, str, Optional[str], float]
+
+
+class _ConnectionPool:
+    """
+    A fixed-size, thread-safe pool of SQLite connections.
+
+    Connections are opened eagerly and handed out through a blocking queue,
+    so at most `size` threads talk to the database at the same time.
+    """
+
+    def __init__(self, database: str, size: int, timeout: float):
+        self._timeout = timeout
+        self._connections: List[sqlite3.Connection] = []
+        self._idle: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(
+                database,
+                timeout=timeout,
+                isolation_level=None,  # Transactions are managed explicitly
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            self._connections.append(connection)
+            self._idle.put(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for the duration of the with-block."""
+        connection = self._idle.get(timeout=self._timeout)
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self) -> None:
+        """Close every connection owned by the pool."""
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
 
 class SQLiteGameRepository(IGameRepository):
+    """
+    SQLite-backed game repository.
+
+    Games are stored in a normalized schema (players, games, game_players and
+    rounds) using WAL journaling, so readers never block the writer. Reads are
+    served from a pool of connections; writes are serialized in-process to
+    avoid lock contention inside SQLite.
+
+    A game's RngStream is stored with it, at its current position, and so is
+    the strategy of each computer seat, learned model included, so a game
+    read back draws the same computer moves it would have drawn in memory.
+    Only the built-in strategies can be stored; saving a game whose computer
+    uses another strategy raises ValueError.
+
+    Every round a game records in its history is written once to the rounds
+    table. `get` returns the live state of a game with an empty history window,
+    while `iter_games` pages through all games in ID order and also loads their
+    complete round history, one page at a time. To skip rounds it has already
+    written, the repository remembers the last round written for the most
+    recently saved games; for any other game it writes the rows of its whole
+    history window again, which the rounds table ignores as duplicates.
+
+    In write-behind mode, `save` only buffers the game and the rounds it just
+    completed. Buffered games are written in a single transaction once
+    `batch_size` games are pending, every `flush_interval` seconds, or when
+    `flush`/`close` is called. This collapses the per-move saves issued by
+    `GameService.make_move` into a handful of transactions.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        pool_size: int = 4,
+        timeout: float = 30.0,
+        write_behind: bool = False,
+        batch_size: int = 256,
+        flush_interval: Optional[float] = None,
+    ):
+        """
+        Initialize the repository and create the schema if needed.
+
+        Args:
+            database (str): Path of the SQLite database file.
+            pool_size (int, optional): Number of pooled connections. Defaults to 4.
+            timeout (float, optional): Seconds to wait for a connection or a database lock. Defaults to 30.
+            write_behind (bool, optional): Buffer saves and write them in batches. Defaults to False.
+            batch_size (int, optional): Number of buffered games that triggers a flush. Defaults to 256.
+            flush_interval (Optional[float], optional): Flush buffered games periodically, in seconds.
+        """
+        self._pool = _ConnectionPool(database, pool_size, timeout)
+        self._write_lock = threading.Lock()
+        self._write_behind = write_behind
+        self._batch_size = batch_size
+        self._pending_lock = threading.Lock()
+        self._pending_games: Dict[str, Game] = {}
+        self._flushing_games: Dict[str, Game] = {}
+        self._flush_lock = threading.Lock()
+        self._pending_rounds: List[_RoundRow] = []
+        # game ID -> last round number committed, least recently saved first
+        self._written_rounds: "OrderedDict[str, int]" = OrderedDict()
+        # game ID -> last round number in the pending and the flushing batch
+        self._pending_round_marks: Dict[str, int] = {}
+        self._flushing_round_marks: Dict[str, int] = {}
+
+        with self._pool.connection() as connection:
+            connection.executescript(_SCHEMA)
+            for table, column, statement in _ADDED_COLUMNS:
+                if column not in {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}:
+                    connection.execute(statement)
+
+        self._stop_flushing = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if write_behind and flush_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, args=(flush_interval,), daemon=True)
+            self._flusher.start()
 
     def save(self, game: Game):
         """Save or update a game."""
-        pass
+        with self._pending_lock:
+            round_rows = self._new_round_rows(game)
+            if self._write_behind:
+                self._pending_games[game.id] = game
+                self._pending_rounds.extend(round_rows)
+        if not self._write_behind:
+            self._write([game], round_rows)
+            with self._pending_lock:
+                self._mark_written(round_rows)
+            return
+
+        with self._pending_lock:
+            should_flush = len(self._pending_games) >= self._batch_size
+        if should_flush:
+            self.flush()
 
     def get(self, game_id: str) -> Game:
         """Retrieve a game by its ID."""
-        pass
+        with self._pending_lock:
+            game = self._pending_games.get(game_id) or self._flushing_games.get(game_id)
+        if game is not None:
+            return game
+
+        games = self._read(_BY_ID, (game_id,))
+        return games[0] if games else None
+
+    def save_many(self, games: Iterable[Game]):
+        """Save or update several games in a single transaction."""
+        games = list(games)
+        with self._pending_lock:
+            round_rows = [row for game in games for row in self._new_round_rows(game)]
+            if self._write_behind:
+                self._pending_games.update((game.id, game) for game in games)
+                self._pending_rounds.extend(round_rows)
+        if not self._write_behind:
+            if games:
+                self._write(games, round_rows)
+                with self._pending_lock:
+                    self._mark_written(round_rows)
+            return
+
+        with self._pending_lock:
+            should_flush = len(self._pending_games) >= self._batch_size
+        if should_flush:
+            self.flush()
+
+    def get_many(self, game_ids: Iterable[str]) -> Dict[str, Game]:
+        """Retrieve several games, reading those not buffered in one query per 500 IDs."""
+        found: Dict[str, Game] = {}
+        missing: List[str] = []
+        with self._pending_lock:
+            for game_id in dict.fromkeys(game_ids):
+                game = self._pending_games.get(game_id) or self._flushing_games.get(game_id)
+                if game is None:
+                    missing.append(game_id)
+                else:
+                    found[game_id] = game
+
+        loaded: List[Game] = []
+        for start in range(0, len(missing), _MAX_IDS_PER_QUERY):
+            chunk = missing[start:start + _MAX_IDS_PER_QUERY]
+            loaded.extend(self._read(_BY_IDS.format(", ".join("?" * len(chunk))), tuple(chunk)))
+        found.update((game.id, game) for game in loaded)
+        return found
 
     def delete(self, game_id: str):
         """Delete a game by its ID."""
-        pass
+        with self._flush_lock:
+            with self._pending_lock:
+                self._pending_games.pop(game_id, None)
+                self._pending_rounds = [row for row in self._pending_rounds if row[0] != game_id]
+                self._written_rounds.pop(game_id, None)
+                self._pending_round_marks.pop(game_id, None)
+            self._delete(game_id)
+
+    def _delete(self, game_id: str) -> None:
+        with self._write_lock, self._pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                player_ids = connection.execute(_SELECT_GAME_PLAYER_IDS, (game_id,)).fetchall()
+                connection.execute(_DELETE_GAME, (game_id,))  # Cascades to its seats and rounds
+                # Players may sit in other games too; only drop those left without one
+                connection.executemany(_DELETE_ORPHAN_PLAYER, player_ids)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
 
     def list_all(self) -> List[Game]:
-        """List all games."""
-        pass
+        """List all games, including their complete round history."""
+        return list(self.iter_games())
+
+    def iter_games(self, page_size: int = _MAX_IDS_PER_QUERY) -> Iterator[Game]:
+        """
+        Lazily iterate over all games in ID order, including their complete round history.
+
+        Games are read `page_size` at a time, each page with its rounds in one
+        read transaction, so memory use is bounded by the largest page rather
+        than by the whole database. Games saved or deleted during the iteration
+        may or may not be seen.
+
+        Args:
+            page_size (int, optional): Number of games read per query. Defaults to 500.
+        """
+        self.flush()
+        after = ""
+        while True:
+            with self._pool.connection() as connection:
+                page = [row[0] for row in connection.execute(_SELECT_GAME_PAGE, (after, page_size))]
+            if not page:
+                return
+            games = self._read(_BY_IDS.format(", ".join("?" * len(page))), tuple(page), with_history=True)
+            games.sort(key=lambda game: game.id)
+            yield from games
+            after = page[-1]
+
+    def flush(self) -> None:
+        """Write all buffered games in a single transaction."""
+        with self._flush_lock:
+            with self._pending_lock:
+                # Keep the batch visible to `get` until it has been committed
+                self._flushing_games, self._pending_games = self._pending_games, {}
+                rounds, self._pending_rounds = self._pending_rounds, []
+                self._flushing_round_marks, self._pending_round_marks = self._pending_round_marks, {}
+            committed = False
+            try:
+                if self._flushing_games:
+                    self._write(list(self._flushing_games.values()), rounds)
+                committed = True
+            finally:
+                with self._pending_lock:
+                    if committed:
+                        self._mark_written(rounds)
+                    else:
+                        # Put the batch back so that the next flush retries it; newer saves win
+                        self._pending_games = {**self._flushing_games, **self._pending_games}
+                        self._pending_rounds = rounds + self._pending_rounds
+                        self._pending_round_marks = {**self._flushing_round_marks, **self._pending_round_marks}
+                    self._flushing_games = {}
+                    self._flushing_round_marks = {}
+
+    def close(self) -> None:
+        """Flush buffered games and release all connections."""
+        self._stop_flushing.set()
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+        self._pool.close()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+    def _write(self, games: List[Game], rounds: List[_RoundRow]) -> None:
+        players = []
+        game_rows = []
+        seat_rows = []
+        for game in games:
+            end_condition = None if game.end_condition is None else str(game.end_condition)
+            rng = str(game.rng) if isinstance(game.rng, RngStream) else None
+            game_rows.append(
+                (game.id, game.status.value, game.round_number, game.last_round_winner, end_condition, rng)
+            )
+            for seat, player in enumerate((game.player1, game.player2)):
+                current_move = game.current_moves[player.id]
+                players.append((player.id, player.name, int(player.is_computer)))
+                seat_rows.append((
+                    game.id,
+                    seat,
+                    player.id,
+                    game.scores[player.id],
+                    current_move.value if current_move else None,
+                    encode_strategy(player.strategy) if player.is_computer else None,
+                ))
+
+        with self._write_lock, self._pool.connection() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(_UPSERT_PLAYER, players)
+                connection.executemany(_UPSERT_GAME, game_rows)
+                connection.executemany(_UPSERT_SEAT, seat_rows)
+                connection.executemany(_INSERT_ROUND, rounds)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _read(self, game_filter: str, params: tuple, with_history: bool = False) -> List[Game]:
+        with self._pool.connection() as connection:
+            # Run the three queries in one read transaction so they see the same snapshot
+            connection.execute("BEGIN")
+            try:
+                game_rows = connection.execute(_SELECT_GAMES + game_filter, params).fetchall()
+                seat_rows = connection.execute(_SELECT_SEATS + game_filter, params).fetchall()
+                round_rows = connection.execute(_SELECT_LAST_ROUNDS + game_filter, params).fetchall()
+                if with_history:
+                    history_rows = connection.execute(_SELECT_ROUNDS + game_filter + _ROUNDS_ORDER, params).fetchall()
+                else:
+                    history_rows = []
+            finally:
+                connection.execute("COMMIT")
+
+        seats: Dict[str, Dict[int, tuple]] = {}
+        for game_id, seat, *rest in seat_rows:
+            seats.setdefault(game_id, {})[seat] = tuple(rest)
+        last_rounds = {game_id: (move1, move2) for game_id, move1, move2 in round_rows}
+
+        games = [self._restore(row, seats[row[0]], last_rounds.get(row[0])) for row in game_rows]
+        if with_history:
+            self._restore_histories(games, history_rows)
+        return games
+
+    @staticmethod
+    def _restore(game_row: _GameRow, seats: Dict[int, tuple], last_round: Optional[Tuple[str, str]]) -> Game:
+        game_id, status, round_number, last_round_winner, end_condition, rng = game_row
+        players = []
+        scores = {}
+        current_moves = {}
+        for seat in (0, 1):
+            player_id, name, is_computer, score, current_move, strategy = seats[seat]
+            players.append(
+                Player(name, is_computer=bool(is_computer), player_id=player_id, strategy=decode_strategy(strategy))
+            )
+            scores[player_id] = score
+            current_moves[player_id] = Move(current_move) if current_move else None
+
+        game = Game(
+            players[0], players[1], game_id=game_id,
+            end_condition=EndCondition.parse(end_condition) if end_condition else None,
+            rng=RngStream.parse(rng) if rng else None,
+        )
+        game.status = GameStatus(status)
+        game.round_number = round_number
+        game.scores = scores
+        game.current_moves = current_moves
+        game.last_round_winner = last_round_winner
+        if last_round:
+            game.last_round_moves = {
+                players[0].id: Move(last_round[0]),
+                players[1].id: Move(last_round[1]),
+            }
+        return game
+
+    @staticmethod
+    def _restore_histories(games: List[Game], history_rows: List[tuple]) -> None:
+        by_id = {game.id: game for game in games}
+        for game_id, round_number, move1, move2, winner_id, played_at in history_rows:
+            game = by_id.get(game_id)
+            if game is None:
+                continue
+            if game.history.first_round + len(game.history) != round_number:
+                game.history = RoundHistory(first_round=round_number)  # Rounds not recorded individually
+            winner = None if winner_id is None else (0 if winner_id == game.player1.id else 1)
+            game.history.append(Move(move1), Move(move2), winner, played_at)
+
+    def _new_round_rows(self, game: Game) -> List[_RoundRow]:
+        """Rows for the rounds not yet written or buffered; caller holds the pending lock."""
+        saved = self._pending_round_marks.get(game.id)
+        if saved is None:
+            saved = self._flushing_round_marks.get(game.id)
+        if saved is None:
+            # Unknown games write their whole history window; rows already in the table are ignored
+            saved = self._written_rounds.get(game.id, game.history.first_round - 1)
+        player_ids = (game.player1.id, game.player2.id)
+        rows = [
+            (
+                game.id,
+                record.round_number,
+                record.player1_move.value,
+                record.player2_move.value,
+                None if record.winner_seat is None else player_ids[record.winner_seat],
+                record.timestamp,
+            )
+            for record in game.history.since(saved + 1)
+        ]
+        if rows and self._write_behind:
+            self._pending_round_marks[game.id] = rows[-1][1]
+        return rows
+
+    def _mark_written(self, rounds: List[_RoundRow]) -> None:
+        """Remember the last round committed per game; caller holds the pending lock."""
+        for game_id, round_number, *_ in rounds:
+            if round_number > self._written_rounds.get(game_id, 0):
+                self._written_rounds[game_id] = round_number
+            self._written_rounds.move_to_end(game_id)
+        while len(self._written_rounds) > _MAX_TRACKED_GAMES:
+            self._written_rounds.popitem(last=False)  # Least recently saved first
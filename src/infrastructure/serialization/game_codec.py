@@ -0,0 +1,294 @@
+import struct
+import sys
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from ...domain.entities.game import Game, GameStatus
+from ...domain.entities.player import Player
+from ...domain.value_objects.end_condition import EndCondition
+from ...domain.value_objects.move import Move
+from ...domain.value_objects.rng_stream import RngStream
+
+FORMAT_VERSION = 1
+
+_BATCH_MAGIC = b"RPSG"
+
+# version, flags, packed move codes (current and last round moves, 2 bits each)
+_FIXED = struct.Struct("<BBB")
+
+# Flag bits
+_COMPLETED = 0x01
+_PLAYER1_COMPUTER = 0x02
+_PLAYER2_COMPUTER = 0x04
+_HAS_END_CONDITION = 0x08
+_WINNER_SHIFT = 4  # 2 bits: 0 for a tie or no round yet, 1 for player1, 2 for player2
+_HAS_RNG = 0x40
+
+_NO_MOVE = 3  # Move codes are 0-2, so 3 marks an empty slot
+
+# String tags, written as the leading varint of every ID or text field
+_UUID_TAG = 0  # 16 raw bytes of a canonical, lowercase UUID string
+_INTEGER_TAG = 1  # varint of a canonical decimal string, e.g. a Snowflake ID
+_TEXT_TAG_BASE = 2  # utf-8 text of length (tag - 2)
+
+_Buffer = Union[bytes, bytearray, memoryview]
+
+
+def encode_game(game: Game) -> bytes:
+    """
+    Encode a game as a self-contained binary record.
+
+    The record keeps the live state of the game: players, status, round
+    number, scores, current and last round moves, the last round's winner,
+    the end condition and the position of the game's RngStream, if it has
+    one. Round history and computer strategies are not included; decoded
+    computers play with the default strategy.
+    """
+    out = bytearray()
+    _write_game(out, game)
+    return bytes(out)
+
+
+def decode_game(buffer: _Buffer) -> Game:
+    """
+    Decode a record produced by encode_game.
+
+    Raises:
+        ValueError: If the record has an unknown version or is truncated.
+    """
+    game, _ = _read_game(memoryview(buffer), 0)
+    return game
+
+
+def decode_game_id(buffer: _Buffer) -> str:
+    """Read only the game ID of a record produced by encode_game."""
+    view = memoryview(buffer)
+    if len(view) < _FIXED.size or view[0] != FORMAT_VERSION:
+        raise ValueError("Unsupported or truncated game record.")
+    game_id, _ = _read_string(view, _FIXED.size)
+    return game_id
+
+
+def encode_player(player: Player) -> bytes:
+    """Encode a player's ID, name and computer flag."""
+    out = bytearray([int(player.is_computer)])
+    _write_string(out, player.id)
+    _write_string(out, player.name)
+    return bytes(out)
+
+
+def decode_player(buffer: _Buffer) -> Player:
+    """Decode a record produced by encode_player."""
+    view = memoryview(buffer)
+    player_id, offset = _read_string(view, 1)
+    name, _ = _read_string(view, offset)
+    return Player(sys.intern(name), is_computer=bool(view[0]), player_id=player_id)
+
+
+def encode_games(games: Iterable[Game]) -> bytes:
+    """
+    Encode many games into one buffer.
+
+    The buffer starts with a magic number and the format version, followed
+    by the number of games and one length-prefixed record per game, so
+    readers can skip records without decoding them.
+    """
+    records = bytearray()
+    count = 0
+    record = bytearray()
+    for game in games:
+        record.clear()
+        _write_game(record, game)
+        _write_varint(records, len(record))
+        records += record
+        count += 1
+    out = bytearray(_BATCH_MAGIC)
+    out.append(FORMAT_VERSION)
+    _write_varint(out, count)
+    out += records
+    return bytes(out)
+
+
+def decode_games(buffer: _Buffer) -> List[Game]:
+    """Decode every game of a buffer produced by encode_games."""
+    return list(iter_games(buffer))
+
+
+def iter_games(buffer: _Buffer) -> Iterator[Game]:
+    """
+    Lazily decode the games of a buffer produced by encode_games.
+
+    The buffer is read through a memoryview, so records are never copied out
+    of it before decoding; only the decoded strings are allocated.
+
+    Raises:
+        ValueError: If the buffer is not a game batch or has an unknown version.
+    """
+    view = memoryview(buffer)
+    if bytes(view[:4]) != _BATCH_MAGIC:
+        raise ValueError("Not an encoded game batch.")
+    if len(view) < 5 or view[4] != FORMAT_VERSION:
+        raise ValueError("Unsupported game batch version.")
+    count, offset = _read_varint(view, 5)
+    for _ in range(count):
+        length, offset = _read_varint(view, offset)
+        game, end = _read_game(view, offset)
+        if end != offset + length:
+            raise ValueError("Corrupt game record.")
+        offset = end
+        yield game
+
+
+def _write_game(out: bytearray, game: Game) -> None:
+    player1, player2 = game.player1, game.player2
+    current_moves = game.current_moves
+    last_moves = game.last_round_moves
+    if game.last_round_winner is None:
+        winner = 0
+    else:
+        winner = 1 if game.last_round_winner == player1.id else 2
+    flags = (
+        (_COMPLETED if game.status == GameStatus.COMPLETED else 0)
+        | (_PLAYER1_COMPUTER if player1.is_computer else 0)
+        | (_PLAYER2_COMPUTER if player2.is_computer else 0)
+        | (_HAS_END_CONDITION if game.end_condition is not None else 0)
+        | winner << _WINNER_SHIFT
+        | (_HAS_RNG if isinstance(game.rng, RngStream) else 0)
+    )
+    packed_moves = (
+        _code(current_moves[player1.id])
+        | _code(current_moves[player2.id]) << 2
+        | _code(last_moves.get(player1.id)) << 4
+        | _code(last_moves.get(player2.id)) << 6
+    )
+    out += _FIXED.pack(FORMAT_VERSION, flags, packed_moves)
+    _write_string(out, game.id)
+    _write_string(out, player1.id)
+    _write_string(out, player1.name)
+    _write_string(out, player2.id)
+    _write_string(out, player2.name)
+    _write_varint(out, game.round_number)
+    scores = game.scores
+    _write_varint(out, scores[player1.id])
+    _write_varint(out, scores[player2.id])
+    if game.end_condition is not None:
+        _write_string(out, str(game.end_condition))
+    if isinstance(game.rng, RngStream):
+        _write_string(out, str(game.rng))
+
+
+def _read_game(view: memoryview, offset: int) -> Tuple[Game, int]:
+    if len(view) - offset < _FIXED.size:
+        raise ValueError("Truncated game record.")
+    version, flags, packed_moves = _FIXED.unpack_from(view, offset)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported game record version {version}.")
+    offset += _FIXED.size
+    game_id, offset = _read_string(view, offset)
+    player1_id, offset = _read_string(view, offset)
+    player1_name, offset = _read_string(view, offset)
+    player2_id, offset = _read_string(view, offset)
+    player2_name, offset = _read_string(view, offset)
+    round_number, offset = _read_varint(view, offset)
+    score1, offset = _read_varint(view, offset)
+    score2, offset = _read_varint(view, offset)
+    end_condition = None
+    if flags & _HAS_END_CONDITION:
+        spec, offset = _read_string(view, offset)
+        end_condition = EndCondition.parse(spec)
+    rng = None
+    if flags & _HAS_RNG:
+        spec, offset = _read_string(view, offset)
+        rng = RngStream.parse(spec)
+
+    # Names repeat across many games, so share one string object per name
+    player1 = Player(sys.intern(player1_name), is_computer=bool(flags & _PLAYER1_COMPUTER), player_id=player1_id)
+    player2 = Player(sys.intern(player2_name), is_computer=bool(flags & _PLAYER2_COMPUTER), player_id=player2_id)
+    game = Game(player1, player2, game_id=game_id, end_condition=end_condition, rng=rng)
+    if flags & _COMPLETED:
+        game.status = GameStatus.COMPLETED
+    game.round_number = round_number
+    game.scores = {player1_id: score1, player2_id: score2}
+    current1, current2 = _MOVES_BY_CODE[packed_moves & 3], _MOVES_BY_CODE[packed_moves >> 2 & 3]
+    if current1 is not None or current2 is not None:
+        game.current_moves = {player1_id: current1, player2_id: current2}
+    last1, last2 = _MOVES_BY_CODE[packed_moves >> 4 & 3], _MOVES_BY_CODE[packed_moves >> 6 & 3]
+    if last1 is not None:
+        game.last_round_moves = {player1_id: last1, player2_id: last2}
+    winner = flags >> _WINNER_SHIFT & 3
+    if winner:
+        game.last_round_winner = (player1_id, player2_id)[winner - 1]
+    return game, offset
+
+
+def _code(move: Optional[Move]) -> int:
+    return _NO_MOVE if move is None else move.code
+
+
+# Indexed by code, _NO_MOVE gives None
+_MOVES_BY_CODE: Tuple[Optional[Move], ...] = tuple(Move.from_code(code) for code in range(len(Move))) + (None,)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint: 7 bits per byte, high bit set on all but the last."""
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(view: memoryview, offset: int) -> Tuple[int, int]:
+    try:
+        byte = view[offset]
+        if byte < 0x80:
+            return byte, offset + 1  # Most scores and lengths fit in one byte
+    except IndexError:
+        raise ValueError("Truncated game record.") from None
+    value = 0
+    shift = 0
+    try:
+        while True:
+            byte = view[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+    except IndexError:
+        raise ValueError("Truncated game record.") from None
+
+
+def _write_string(out: bytearray, text: str) -> None:
+    if len(text) == 36 and text[8] == "-" and text[13] == "-" and text[18] == "-" and text[23] == "-":
+        digits = text.replace("-", "")
+        try:
+            raw = bytes.fromhex(digits)
+        except ValueError:
+            raw = None
+        if raw is not None and raw.hex() == digits:
+            out.append(_UUID_TAG)
+            out += raw
+            return
+    if text.isdigit() and text.isascii() and (text == "0" or text[0] != "0"):
+        out.append(_INTEGER_TAG)
+        _write_varint(out, int(text))
+        return
+    encoded = text.encode("utf-8")
+    _write_varint(out, len(encoded) + _TEXT_TAG_BASE)
+    out += encoded
+
+
+def _read_string(view: memoryview, offset: int) -> Tuple[str, int]:
+    tag, offset = _read_varint(view, offset)
+    if tag == _UUID_TAG:
+        end = offset + 16
+        if end > len(view):
+            raise ValueError("Truncated game record.")
+        digits = view[offset:end].hex()
+        return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}", end
+    if tag == _INTEGER_TAG:
+        value, offset = _read_varint(view, offset)
+        return str(value), offset
+    end = offset + tag - _TEXT_TAG_BASE
+    if end > len(view):
+        raise ValueError("Truncated game record.")
+    return str(view[offset:end], "utf-8"), end
@@ -0,0 +1,158 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from hashlib import blake2b
+from typing import Iterable, Iterator, Optional, Tuple
+
+from ...domain.entities.game import Game
+from .game_codec import decode_game, encode_game
+
+SNAPSHOT_VERSION = 1
+
+_MAGIC = b"RPSS"
+# magic, version, game count, index offset, index slots (a power of two)
+_HEADER = struct.Struct("<4sB3xQQQ")
+_HASH = struct.Struct("<Q")  # also used for record offsets
+_LENGTH = struct.Struct("<I")
+
+
+def game_id_hash(game_id: str) -> int:
+    """Stable 64-bit hash of a game ID; never 0, which marks an empty index slot."""
+    return int.from_bytes(blake2b(game_id.encode("utf-8"), digest_size=8).digest(), "little") or 1
+
+
+def write_snapshot(path: str, games: Iterable[Game], records: Iterable[Tuple[int, bytes]] = ()) -> int:
+    """
+    Write games to a snapshot file, replacing any previous file atomically.
+
+    The file holds one game_codec record per game, followed by a fixed-size
+    open-addressing index of (ID hash, offset, length) entries with at least
+    twice as many slots as games, so a lookup reads one or two slots.
+
+    Args:
+        path (str): Path of the snapshot file.
+        games (Iterable[Game]): Games to encode.
+        records (Iterable[Tuple[int, bytes]]): Already encoded (ID hash, record) pairs, e.g. copied
+            from an older snapshot with GameSnapshot.records, written without being decoded.
+
+    Returns:
+        int: The number of games written.
+    """
+    hashes = array("Q")
+    offsets = array("Q")
+    lengths = array("I")
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as snapshot_file:
+        snapshot_file.write(bytes(_HEADER.size))
+        position = _HEADER.size
+
+        def append(hash_value: int, record: bytes) -> None:
+            nonlocal position
+            snapshot_file.write(record)
+            hashes.append(hash_value)
+            offsets.append(position)
+            lengths.append(len(record))
+            position += len(record)
+
+        for game in games:
+            append(game_id_hash(game.id), encode_game(game))
+        for hash_value, record in records:
+            append(hash_value, record)
+
+        slots = 1
+        while slots < 2 * len(hashes):
+            slots <<= 1
+        mask = slots - 1
+        slot_hashes = array("Q", bytes(8 * slots))
+        slot_offsets = array("Q", bytes(8 * slots))
+        slot_lengths = array("I", bytes(4 * slots))
+        for entry, hash_value in enumerate(hashes):
+            slot = hash_value & mask
+            while slot_hashes[slot]:
+                slot = (slot + 1) & mask
+            slot_hashes[slot] = hash_value
+            slot_offsets[slot] = offsets[entry]
+            slot_lengths[slot] = lengths[entry]
+        for column in (slot_hashes, slot_offsets, slot_lengths):
+            if sys.byteorder == "big":
+                column.byteswap()
+            snapshot_file.write(column.tobytes())
+
+        snapshot_file.seek(0)
+        snapshot_file.write(_HEADER.pack(_MAGIC, SNAPSHOT_VERSION, len(hashes), position, slots))
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+    os.replace(temporary, path)
+    return len(hashes)
+
+
+class GameSnapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+
+    Opening a snapshot only maps the file and reads its header, whatever the
+    number of games; a game is decoded when it is looked up. The index is
+    laid out as three columns (hashes, offsets, lengths) so a probe touches
+    a single 8-byte hash until it finds the game.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot or has an unknown version.
+        """
+        with open(path, "rb") as snapshot_file:
+            self._map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, index_offset, slots = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC:
+            self._map.close()
+            raise ValueError("Not a game snapshot file.")
+        if version != SNAPSHOT_VERSION:
+            self._map.close()
+            raise ValueError(f"Unsupported game snapshot version {version}.")
+        self._count = count
+        self._mask = slots - 1
+        self._hashes = index_offset
+        self._offsets = index_offset + 8 * slots
+        self._lengths = index_offset + 16 * slots
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, game_id: str) -> bool:
+        return self.get(game_id) is not None
+
+    def get(self, game_id: str) -> Optional[Game]:
+        """Decode one game, or return None if the snapshot does not hold it."""
+        hash_value = game_id_hash(game_id)
+        slot = hash_value & self._mask
+        unpack_hash = _HASH.unpack_from
+        while True:
+            (stored,) = unpack_hash(self._map, self._hashes + 8 * slot)
+            if stored == 0:
+                return None
+            if stored == hash_value:
+                game = decode_game(self._record(slot))
+                if game.id == game_id:
+                    return game
+            slot = (slot + 1) & self._mask
+
+    def records(self) -> Iterator[Tuple[int, bytes]]:
+        """Yield the (ID hash, encoded record) pair of every game, in index order."""
+        for slot in range(self._mask + 1):
+            (stored,) = _HASH.unpack_from(self._map, self._hashes + 8 * slot)
+            if stored:
+                yield stored, self._record(slot)
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._map.close()
+
+    def _record(self, slot: int) -> bytes:
+        (offset,) = _HASH.unpack_from(self._map, self._offsets + 8 * slot)
+        (length,) = _LENGTH.unpack_from(self._map, self._lengths + 4 * slot)
+        return self._map[offset:offset + length]
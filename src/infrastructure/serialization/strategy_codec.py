@@ -0,0 +1,66 @@
+import json
+from typing import Any, Dict, Optional
+
+from ...domain.strategies.frequency_strategy import FrequencyStrategy
+from ...domain.strategies.markov_strategy import MarkovStrategy
+from ...domain.strategies.mixture_of_experts_strategy import MixtureOfExpertsStrategy
+from ...domain.strategies.strategy import RANDOM, RandomStrategy, Strategy
+
+# Stored kind -> strategy class; only these exact classes can be persisted
+_KINDS = {
+    "random": RandomStrategy,
+    "frequency": FrequencyStrategy,
+    "markov": MarkovStrategy,
+    "mixture": MixtureOfExpertsStrategy,
+}
+_KIND_OF = {strategy_class: kind for kind, strategy_class in _KINDS.items()}
+
+
+def encode_strategy(strategy: Optional[Strategy]) -> Optional[str]:
+    """
+    Encode a computer player's strategy, including its learned model, as compact JSON.
+
+    Returns None for the shared random strategy, which is what players get
+    by default, so that the common case stores nothing.
+
+    Raises:
+        ValueError: If the strategy is not one of the built-in strategies, whose state is known.
+    """
+    if strategy is None or strategy is RANDOM:
+        return None
+    return json.dumps(_state(strategy), separators=(",", ":"))
+
+
+def decode_strategy(text: Optional[str]) -> Optional[Strategy]:
+    """
+    Decode a strategy encoded by encode_strategy; None decodes to None, i.e. the default.
+
+    Raises:
+        ValueError: If the text does not describe a known strategy.
+    """
+    if text is None:
+        return None
+    try:
+        return _restore(json.loads(text))
+    except (KeyError, TypeError, json.JSONDecodeError) as error:
+        raise ValueError(f"Invalid strategy state: {error}") from None
+
+
+def _state(strategy: Strategy) -> Dict[str, Any]:
+    kind = _KIND_OF.get(type(strategy))
+    if kind is None:
+        raise ValueError(f"Cannot persist the state of {type(strategy).__name__}; use a built-in strategy.")
+    state = strategy.get_state()
+    state["kind"] = kind
+    if isinstance(strategy, MixtureOfExpertsStrategy):
+        state["experts"] = [_state(expert) for expert in strategy.experts]
+    return state
+
+
+def _restore(state: Dict[str, Any]) -> Strategy:
+    kind = state.pop("kind")
+    if kind not in _KINDS:
+        raise ValueError(f"Unknown strategy kind: {kind!r}")
+    if kind == "mixture":
+        state["experts"] = [_restore(expert) for expert in state["experts"]]
+    return _KINDS[kind].from_state(state)
@@ -0,0 +1,186 @@
+import argparse
+import asyncio
+import json
+from typing import Dict, Optional, Set
+
+from .application.services.async_game_service import AsyncGameService
+from .domain.entities.game import Game, GameStatus
+from .domain.value_objects.end_condition import EndCondition
+from .domain.value_objects.move import Move
+from .infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from .infrastructure.repositories.async_sqlite_game_repository import AsyncSQLiteGameRepository
+from .infrastructure.repositories.in_memory_game_archive import InMemoryGameArchive
+
+# Pause reading from a slow client once this much output is queued for it
+_HIGH_WATER_MARK = 64 * 1024
+
+
+def game_to_dict(game: Game) -> dict:
+    """
+    Render a game for clients.
+
+    Moves of the round in progress are not revealed; `waiting_for` only tells
+    which players still have to move.
+    """
+    players = (game.player1, game.player2)
+    last_round_moves = game.last_round_moves
+    return {
+        "id": game.id,
+        "status": game.status.value,
+        "round_number": game.round_number,
+        "players": [
+            {"id": player.id, "name": player.name, "is_computer": player.is_computer} for player in players
+        ],
+        "scores": dict(game.scores),
+        "waiting_for": [player_id for player_id, move in game.current_moves.items() if move is None],
+        "last_round_moves": {player_id: move.value for player_id, move in last_round_moves.items()},
+        "last_round_winner": game.last_round_winner,
+    }
+
+
+class _Connection:
+    """One connected client and the games it follows."""
+
+    __slots__ = ("writer", "games")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.games: Set[str] = set()
+
+    def send(self, message: dict) -> None:
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+class GameServer:
+    """
+    Newline-delimited JSON game server.
+
+    Each line a client sends is a request object with an "op" field and an
+    optional "id" that is echoed back in the response:
+
+        {"id": 1, "op": "start_game", "player1_name": "Alice", "player2_name": "Bob", "vs_computer": false,
+         "end_condition": "best_of:5"}
+        {"id": 2, "op": "join", "game_id": "..."}
+        {"id": 3, "op": "make_move", "game_id": "...", "player_id": "...", "move": "rock"}
+
+    Responses look like {"id": 1, "ok": true, "game": {...}} or
+    {"id": 1, "ok": false, "error": "..."}. Whenever a round completes, every
+    connection that started, joined or moved in that game is pushed
+    {"event": "round_result", "game": {...}}. The optional "end_condition" uses
+    the EndCondition string form; once a game is completed it is archived, its
+    subscriptions are dropped and it can no longer be joined.
+
+    Requests of one connection are handled in order; all connections share a
+    single event loop and one AsyncGameService.
+    """
+
+    def __init__(self, game_service: AsyncGameService):
+        """
+        Initialize the server.
+
+        Args:
+            game_service (AsyncGameService): The service that owns game state.
+        """
+        self.game_service = game_service
+        self._subscribers: Dict[str, Set[_Connection]] = {}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client until it disconnects."""
+        connection = _Connection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                connection.send(await self._handle_line(connection, line))
+                if writer.transport.get_write_buffer_size() > _HIGH_WATER_MARK:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for game_id in connection.games:
+                subscribers = self._subscribers.get(game_id)
+                if subscribers is not None:
+                    subscribers.discard(connection)
+                    if not subscribers:
+                        del self._subscribers[game_id]
+            writer.close()
+
+    async def _handle_line(self, connection: _Connection, line: bytes) -> dict:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            op = request["op"]
+            if op == "start_game":
+                end_condition = request.get("end_condition")
+                game = await self.game_service.start_game(
+                    request["player1_name"], request.get("player2_name", "Computer"), bool(request.get("vs_computer")),
+                    end_condition=EndCondition.parse(end_condition) if end_condition else None,
+                )
+                self._subscribe(connection, game.id)
+            elif op == "join":
+                game = await self.game_service.game_repository.get(request["game_id"])
+                if game is None:
+                    raise ValueError("Game not found.")
+                self._subscribe(connection, game.id)
+            elif op == "make_move":
+                move = Move(request["move"])
+                game = await self.game_service.make_move(request["game_id"], request["player_id"], move)
+                if game.status == GameStatus.ONGOING:
+                    self._subscribe(connection, game.id)
+                if not any(game.current_moves.values()):
+                    self._publish(game)  # This move completed the round
+                if game.status != GameStatus.ONGOING:
+                    self._unsubscribe_all(game.id)
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except Exception as error:
+            return {"id": request_id, "ok": False, "error": str(error) or type(error).__name__}
+        return {"id": request_id, "ok": True, "game": game_to_dict(game)}
+
+    def _subscribe(self, connection: _Connection, game_id: str) -> None:
+        connection.games.add(game_id)
+        self._subscribers.setdefault(game_id, set()).add(connection)
+
+    def _unsubscribe_all(self, game_id: str) -> None:
+        for connection in self._subscribers.pop(game_id, ()):
+            connection.games.discard(game_id)
+
+    def _publish(self, game: Game) -> None:
+        message = {"event": "round_result", "game": game_to_dict(game)}
+        for connection in self._subscribers.get(game.id, ()):
+            connection.send(message)
+
+
+async def serve(host: str, port: int, database: Optional[str] = None) -> None:
+    """Run the game server until cancelled."""
+    if database:
+        repository = AsyncSQLiteGameRepository(database, write_behind=True, flush_interval=1.0)
+    else:
+        repository = AsyncInMemoryGameRepository()
+    game_server = GameServer(AsyncGameService(repository, archive=InMemoryGameArchive()))
+    server = await asyncio.start_server(game_server.handle_connection, host, port, backlog=4096)
+    print(f"Rock-Paper-Scissors server listening on {', '.join(str(s.getsockname()) for s in server.sockets)}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if database:
+            await repository.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rock-Paper-Scissors newline-delimited JSON server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--database", help="SQLite database file; games are kept in memory if omitted")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.database))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import asyncio
+from src.application.services.async_game_service import AsyncGameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from src.infrastructure.repositories.async_sqlite_game_repository import AsyncSQLiteGameRepository
+
+class TestAsyncGameService:
+
+    def test_start_game_and_move_in_memory(self):
+        async def scenario():
+            repository = AsyncInMemoryGameRepository()
+            service = AsyncGameService(repository)
+            game = await service.start_game("Alice", "Computer", vs_computer=True)
+            await service.make_move(game.id, game.player1.id, Move.ROCK)
+            return game, await repository.get(game.id)
+
+        game, stored = asyncio.run(scenario())
+        assert stored is game
+        assert game.round_number == 1
+        assert game.player2.is_computer
+
+    def test_concurrent_moves_on_same_game_are_serialized(self, tmp_path):
+        async def scenario():
+            # SQLite returns a fresh copy on every get, so unserialized moves would overwrite each other
+            repository = AsyncSQLiteGameRepository(str(tmp_path / "games.db"))
+            service = AsyncGameService(repository)
+            games = [await service.start_game(f"Alice{index}", f"Bob{index}") for index in range(20)]
+            await asyncio.gather(*(
+                service.make_move(game.id, player.id, Move.ROCK)
+                for game in games
+                for player in (game.player1, game.player2)
+            ))
+            stored = [await repository.get(game.id) for game in games]
+            await repository.close()
+            return stored
+
+        for game in asyncio.run(scenario()):
+            assert game.round_number == 1
+            assert game.last_round_winner is None
+
+    def test_locks_are_released(self):
+        async def scenario():
+            service = AsyncGameService(AsyncInMemoryGameRepository())
+            game = await service.start_game("Alice", "Bob")
+            await service.make_move(game.id, game.player1.id, Move.PAPER)
+            return len(service._locks)
+
+        assert asyncio.run(scenario()) == 0
@@ -0,0 +1,117 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.application.services.batch_match_simulator import BatchMatchSimulator, MOVES, OUTCOMES
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.value_objects.end_condition import AnyOf, EndCondition, FirstTo, RoundCap
+from src.domain.value_objects.move import Move
+
+class EvenRounds(EndCondition):
+    """A condition the simulator has no vectorized form for."""
+
+    def is_met(self, scores, rounds_played):
+        return rounds_played >= 4 and scores[0] == scores[1]
+
+def paper_beats_rock(**options):
+    paper, rock = Move.PAPER.code, Move.ROCK.code
+    return BatchMatchSimulator(
+        seed=1,
+        player1_probabilities=[float(code == paper) for code in range(3)],
+        player2_probabilities=[float(code == rock) for code in range(3)],
+        **options,
+    )
+
+class TestBatchMatchSimulator:
+
+    def test_outcome_table_matches_compare_moves(self):
+        for code1, move1 in enumerate(MOVES):
+            for code2, move2 in enumerate(MOVES):
+                assert OUTCOMES[code1, code2] == Move.compare_moves(move1, move2)
+
+    def test_simulate_is_reproducible_and_consistent(self):
+        result = BatchMatchSimulator(seed=7, max_chunk_size=1000).simulate(100, 50)
+        again = BatchMatchSimulator(seed=7, max_chunk_size=1000).simulate(100, 50)
+
+        assert np.array_equal(result.player1_scores, again.player1_scores)
+        assert np.all(result.player1_scores + result.player2_scores <= 50)
+        assert result.statuses == [GameStatus.ONGOING] * 100
+        for index in range(100):
+            move1, move2 = result.last_round_moves[index]
+            expected = {1: 0, -1: 1, 0: -1}[OUTCOMES[move1, move2]]
+            assert result.last_round_winner[index] == expected
+
+    def test_fixed_strategies(self):
+        paper, rock = Move.PAPER.code, Move.ROCK.code
+        player1 = [float(code == paper) for code in range(3)]
+        player2 = [float(code == rock) for code in range(3)]
+        simulator = BatchMatchSimulator(seed=1, player1_probabilities=player1, player2_probabilities=player2)
+        result = simulator.simulate(10, 20)
+
+        assert result.player1_scores.tolist() == [20] * 10
+        assert result.player2_scores.tolist() == [0] * 10
+
+    def test_simulate_games_updates_games(self):
+        games = [Game(Player("A", is_computer=True), Player("B", is_computer=True)) for _ in range(5)]
+
+        result = BatchMatchSimulator(seed=3).simulate_games(games, 10)
+
+        for index, game in enumerate(games):
+            assert game.scores[game.player1.id] == result.player1_scores[index]
+            assert game.scores[game.player2.id] == result.player2_scores[index]
+            assert game.round_number == 10
+            assert set(game.last_round_moves) == {game.player1.id, game.player2.id}
+
+    def test_games_stop_at_their_end_condition(self):
+        result = paper_beats_rock().simulate(4, 20, FirstTo(3))
+
+        assert result.rounds_played.tolist() == [3] * 4
+        assert result.player1_scores.tolist() == [3] * 4
+        assert result.statuses == [GameStatus.COMPLETED] * 4
+
+    def test_end_conditions_across_chunks(self):
+        condition = AnyOf((FirstTo(5), RoundCap(12)))
+        result = BatchMatchSimulator(seed=5, max_chunk_size=700).simulate(200, 50, condition)
+
+        for score1, score2, played in zip(
+            result.player1_scores.tolist(), result.player2_scores.tolist(), result.rounds_played.tolist()
+        ):
+            assert score1 + score2 <= played <= 12
+            assert max(score1, score2) == 5 or played == 12
+            assert max(score1, score2) <= 5
+        assert all(result.completed)
+
+    def test_conditions_without_a_vectorized_form(self):
+        result = BatchMatchSimulator(seed=2).simulate(50, 30, EvenRounds())
+
+        for score1, score2, played, done in zip(
+            result.player1_scores.tolist(), result.player2_scores.tolist(),
+            result.rounds_played.tolist(), result.completed.tolist(),
+        ):
+            assert not done or (played >= 4 and score1 == score2)
+
+    def test_simulate_games_continues_from_the_games_state(self):
+        games = [
+            Game(Player("A", is_computer=True), Player("B", is_computer=True), end_condition=FirstTo(3))
+            for _ in range(3)
+        ]
+        games[0].scores = {games[0].player1.id: 2, games[0].player2.id: 0}
+        games[1].end_condition = None
+
+        result = paper_beats_rock().simulate_games(games, 10)
+
+        assert result.rounds_played.tolist() == [1, 10, 3]
+        assert [game.status for game in games] == [GameStatus.COMPLETED, GameStatus.ONGOING, GameStatus.COMPLETED]
+        assert [game.scores[game.player1.id] for game in games] == [3, 10, 3]
+        assert [game.round_number for game in games] == [1, 10, 3]
+        with pytest.raises(ValueError):
+            BatchMatchSimulator().simulate_games(games, 1)
+
+    def test_simulate_games_rejects_adaptive_computers(self):
+        game = Game(Player("A", is_computer=True, strategy=FrequencyStrategy()), Player("B", is_computer=True))
+
+        with pytest.raises(ValueError, match="random strategy"):
+            BatchMatchSimulator().simulate_games([game], 1)
+        assert game.round_number == 0
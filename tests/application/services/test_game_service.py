@@ -3,8 +3,12 @@ from unittest.mock import Mock, patch
 from src.application.services.game_service import GameService
 from src.domain.entities.game import Game, GameStatus
 from src.domain.entities.player import Player
+from src.domain.strategies.markov_strategy import MarkovStrategy
 from src.domain.value_objects.move import Move
 from src.application.interfaces.igame_repository import IGameRepository
+from src.domain.value_objects.end_condition import FirstTo
+from src.infrastructure.repositories.in_memory_game_archive import InMemoryGameArchive
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
 
 class TestGameService:
 
@@ -94,4 +98,71 @@ class TestGameService:
         
         result = game_service.make_move("game_id", "player_id", Move.ROCK)
         
-        assert result == mock_game
\ No newline at end of file
+        assert result == mock_game
+
+    def test_start_games_saves_in_one_bulk_write(self, game_service, mock_repository):
+        games = game_service.start_games([("Alice", "Bob"), ("Carol", "Dave")])
+
+        assert [(game.player1.name, game.player2.name) for game in games] == [("Alice", "Bob"), ("Carol", "Dave")]
+        mock_repository.save_many.assert_called_once_with(games)
+        mock_repository.save.assert_not_called()
+
+    def test_start_games_gives_every_computer_its_own_strategy(self, game_service):
+        games = game_service.start_games(
+            [("Alice", "Computer"), ("Bob", "Computer")], vs_computer=True, computer_strategy_factory=MarkovStrategy,
+        )
+
+        assert all(isinstance(game.player2.strategy, MarkovStrategy) for game in games)
+        assert games[0].player2.strategy is not games[1].player2.strategy
+
+    def test_start_games_reuses_player_ids(self, game_service):
+        games = game_service.start_games([("Alice", "Bob"), ("Carol", "Dave")], player_ids=[("a", "b"), (None, "d")])
+
+        assert [(games[0].player1.id, games[0].player2.id), games[1].player2.id] == [("a", "b"), "d"]
+        with pytest.raises(ValueError):
+            game_service.start_games([("Alice", "Bob")], player_ids=[])
+
+    def test_apply_moves_reports_per_move_results(self):
+        repository = InMemoryGameRepository()
+        game_service = GameService(repository)
+        first, second = game_service.start_games([("Alice", "Bob"), ("Carol", "Dave")])
+
+        results = game_service.apply_moves([
+            (first.id, first.player1.id, Move.ROCK),
+            ("missing", "player", Move.ROCK),
+            (second.id, "stranger", Move.PAPER),
+            (first.id, first.player2.id, Move.SCISSORS),
+        ])
+
+        assert [result.ok for result in results] == [True, False, False, True]
+        assert results[1].game is None
+        assert first.round_number == 1
+        assert first.scores[first.player1.id] == 1
+        assert second.round_number == 0
+
+    def test_apply_moves_reads_and_writes_in_bulk(self, game_service, mock_repository):
+        game = Game(Player("Alice"), Player("Bob"))
+        mock_repository.get_many.return_value = {game.id: game}
+
+        game_service.apply_moves([(game.id, game.player1.id, Move.ROCK), (game.id, game.player2.id, Move.PAPER)])
+
+        mock_repository.get_many.assert_called_once()
+        mock_repository.save_many.assert_called_once_with([game])
+        mock_repository.get.assert_not_called()
+        mock_repository.save.assert_not_called()
+
+    def test_apply_moves_archives_completed_games(self):
+        repository = InMemoryGameRepository()
+        archive = InMemoryGameArchive()
+        game_service = GameService(repository, archive=archive)
+        (game,) = game_service.start_games([("Alice", "Bob")], end_condition=FirstTo(1))
+
+        results = game_service.apply_moves([
+            (game.id, game.player1.id, Move.ROCK),
+            (game.id, game.player2.id, Move.SCISSORS),
+            (game.id, game.player1.id, Move.ROCK),
+        ])
+
+        assert [result.ok for result in results] == [True, True, False]
+        assert repository.get(game.id) is None
+        assert archive.get(game.id).player1_score == 1
@@ -0,0 +1,103 @@
+import asyncio
+import random
+import pytest
+from src.application.services.async_game_service import AsyncGameService
+from src.application.services.game_service import GameService
+from src.application.services.leaderboard_service import LeaderboardService
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+class TestLeaderboardService:
+
+    @pytest.fixture
+    def leaderboard(self):
+        return LeaderboardService()
+
+    def test_counts_and_ratings(self, leaderboard):
+        leaderboard.record_result("Alice", "Bob", "Alice")
+        leaderboard.record_result("Alice", "Bob", None)
+
+        alice = leaderboard.standing("Alice")
+        bob = leaderboard.standing("Bob")
+        assert (alice.rank, alice.wins, alice.losses, alice.ties) == (1, 1, 0, 1)
+        assert (bob.rank, bob.wins, bob.losses, bob.ties) == (2, 0, 1, 1)
+        assert alice.rating > 1500 > bob.rating
+        assert alice.rating + bob.rating == pytest.approx(3000)
+        assert leaderboard.standing("Carol") is None
+        assert leaderboard.rank_of("Carol") is None
+
+    def test_ranking_matches_a_full_sort(self, leaderboard):
+        rng = random.Random(0)
+        names = [f"player-{index}" for index in range(200)]
+        for _ in range(3000):
+            player1, player2 = rng.sample(names, 2)
+            leaderboard.record_result(player1, player2, rng.choice([player1, player2, None]))
+
+        expected = sorted(names, key=lambda name: (-leaderboard.standing(name).rating, name))
+        assert [standing.name for standing in leaderboard.top(len(names) + 5)] == expected
+        assert [standing.name for standing in leaderboard.top(10)] == expected[:10]
+        assert all(leaderboard.rank_of(name) == rank for rank, name in enumerate(expected, start=1))
+        assert len(leaderboard) == len(names)
+
+    def test_game_service_records_completed_rounds(self, leaderboard):
+        service = GameService(InMemoryGameRepository(), leaderboard)
+        game = service.start_game("Alice", "Bob")
+
+        service.make_move(game.id, game.player1.id, Move.ROCK)
+        assert len(leaderboard) == 0
+
+        service.make_move(game.id, game.player2.id, Move.SCISSORS)
+        assert leaderboard.top(1)[0].name == "Alice"
+        assert leaderboard.top(1)[0].player_id == game.player1.id
+        assert leaderboard.standing(game.player2.id).losses == 1
+
+    def test_record_game_uses_final_scores(self, leaderboard):
+        service = GameService(InMemoryGameRepository())
+        game = service.start_game("Alice", "Bob")
+        for move1, move2 in [(Move.ROCK, Move.PAPER), (Move.PAPER, Move.ROCK), (Move.ROCK, Move.PAPER)]:
+            service.make_move(game.id, game.player1.id, move1)
+            service.make_move(game.id, game.player2.id, move2)
+
+        leaderboard.record_game(game)
+        assert leaderboard.standing(game.player2.id).wins == 1
+        assert leaderboard.rank_of(game.player2.id) == 1
+
+    def test_players_are_keyed_by_id_not_name(self, leaderboard):
+        service = GameService(InMemoryGameRepository(), leaderboard)
+        games = [
+            service.start_game("Alice", "Computer", vs_computer=True),
+            service.start_game("Bob", "Computer", vs_computer=True),
+            service.start_game("Sam", "Sam"),
+        ]
+        for game in games:
+            service.make_move(game.id, game.player1.id, Move.ROCK)
+            if not game.player2.is_computer:
+                service.make_move(game.id, game.player2.id, Move.PAPER)
+
+        assert len(leaderboard) == 6
+        assert sorted(standing.name for standing in leaderboard.top(6)).count("Computer") == 2
+        assert leaderboard.standing(games[2].player2.id).wins == 1
+        assert leaderboard.standing(games[2].player1.id).losses == 1
+
+    def test_ratings_follow_a_player_id_across_games(self, leaderboard):
+        service = GameService(InMemoryGameRepository(), leaderboard)
+        for _ in range(2):
+            game = service.start_game("Alice", "Bob", player1_id="alice")
+            service.make_move(game.id, "alice", Move.ROCK)
+            service.make_move(game.id, game.player2.id, Move.SCISSORS)
+
+        assert leaderboard.standing("alice").wins == 2
+        assert leaderboard.standing("alice").name == "Alice"
+        assert len(leaderboard) == 3
+
+    def test_async_game_service_records_completed_rounds(self, leaderboard):
+        async def play():
+            service = AsyncGameService(AsyncInMemoryGameRepository(), leaderboard=leaderboard)
+            game = await service.start_game("Alice", "Bob")
+            await service.make_move(game.id, game.player1.id, Move.PAPER)
+            await service.make_move(game.id, game.player2.id, Move.ROCK)
+            return game
+
+        game = asyncio.run(play())
+        assert leaderboard.standing(game.player1.id).wins == 1
@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import patch
+from src.application.services.game_service import GameService
+from src.application.services.leaderboard_service import LeaderboardService
+from src.application.services.matchmaking_service import MatchmakingService
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestMatchmakingService:
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def repository(self):
+        return InMemoryGameRepository()
+
+    @pytest.fixture
+    def matchmaking(self, repository, clock):
+        return MatchmakingService(GameService(repository), widen_interval=2.0, max_wait=10.0, clock=clock)
+
+    def names(self, games):
+        return {(game.player1.name, game.player2.name) for game in games}
+
+    def test_pairs_players_of_the_same_bucket_first(self, matchmaking, repository):
+        for name, rating in [("a", 1510), ("b", 1890), ("c", 1550), ("d", 1820)]:
+            matchmaking.join(name, rating)
+
+        games = matchmaking.match()
+
+        assert self.names(games) == {("a", "c"), ("b", "d")}
+        assert all(repository.get(game.id) is game for game in games)
+        assert matchmaking.metrics.queue_depth == 0
+
+    def test_a_pass_starts_its_games_with_one_bulk_write(self, matchmaking, repository):
+        for name in "abcdef":
+            matchmaking.join(name, 1500)
+
+        with patch.object(repository, "save_many", wraps=repository.save_many) as save_many, \
+                patch.object(repository, "save", wraps=repository.save) as save:
+            games = matchmaking.match()
+
+        assert len(games) == 3
+        save_many.assert_called_once()
+        save.assert_not_called()
+        assert all(game.player1.id == game.player1.name for game in games)
+
+    def test_waiting_widens_the_rating_range(self, matchmaking, clock):
+        matchmaking.join("a", 1500)
+        matchmaking.join("b", 1720)
+        assert matchmaking.match() == []
+
+        clock.now = 3.0  # One bucket away is not enough
+        assert matchmaking.match() == []
+
+        clock.now = 4.0
+        assert self.names(matchmaking.match()) == {("a", "b")}
+        metrics = matchmaking.metrics
+        assert (metrics.players_matched, metrics.games_created) == (2, 1)
+        assert metrics.mean_time_to_match == 4.0
+
+    def test_max_wait_ignores_rating(self, matchmaking, clock):
+        matchmaking.join("a", 100)
+        clock.now = 9.0
+        matchmaking.join("b", 2900)
+        assert matchmaking.match() == []
+
+        clock.now = 10.0
+        assert self.names(matchmaking.match()) == {("a", "b")}
+        assert matchmaking.metrics.max_time_to_match == 10.0
+
+    def test_join_leave_and_ratings_from_leaderboard(self, repository, clock):
+        leaderboard = LeaderboardService()
+        leaderboard.record_result("a", "b", "a")
+        matchmaking = MatchmakingService(GameService(repository), leaderboard, bucket_width=10.0, clock=clock)
+        for name in ("a", "b", "c"):
+            matchmaking.join(name)
+
+        with pytest.raises(ValueError):
+            matchmaking.join("a")
+        assert matchmaking.leave("c")
+        assert not matchmaking.leave("c")
+        assert matchmaking.match() == []  # a and b are 32 points apart
+        assert matchmaking.metrics.queue_depth == 2
@@ -0,0 +1,53 @@
+import pytest
+from src.application.services.game_service import GameService
+from src.application.services.metrics_registry import Histogram, MetricsRegistry
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+class TestMetricsRegistry:
+
+    def test_histogram_buckets_and_quantiles(self):
+        histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+            histogram.observe(value)
+        assert histogram.counts == [1, 2, 1, 1]
+        assert (histogram.count, histogram.sum) == (5, 16.5)
+        assert histogram.quantile(0.5) == 2.0
+        assert histogram.quantile(1.0) == float("inf")
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.counter("lookups_total", "Lookups.", {"result": "hit"}).increment(3)
+        registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0)).observe(0.5)
+
+        text = registry.to_prometheus()
+        assert "# TYPE rps_lookups_total counter\n" in text
+        assert 'rps_lookups_total{result="hit"} 3\n' in text
+        assert 'rps_latency_seconds_bucket{le="0.1"} 0\n' in text
+        assert 'rps_latency_seconds_bucket{le="1.0"} 1\n' in text
+        assert 'rps_latency_seconds_bucket{le="+Inf"} 1\n' in text
+        assert "rps_latency_seconds_count 1\n" in text
+        with pytest.raises(ValueError):
+            registry.histogram("lookups_total", "Lookups.")
+
+    def test_game_service_instrumentation(self):
+        registry = MetricsRegistry()
+        repository = InMemoryGameRepository()
+        game_service = GameService(repository, metrics=registry)
+        game = game_service.start_game("Alice", "Bob", end_condition=FirstTo(2))
+        for _ in range(2):
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+            game_service.make_move(game.id, game.player2.id, Move.SCISSORS)
+        with pytest.raises(AttributeError):
+            game_service.make_move("missing", game.player1.id, Move.ROCK)
+
+        dump = registry.dump()
+        assert dump["rps_games_started_total"] == 1
+        assert dump["rps_games_completed_total"] == 1
+        assert dump["rps_rounds_played_total"] == 2
+        assert dump['rps_repository_lookups_total{result="hit"}'] == 4
+        assert dump['rps_repository_lookups_total{result="miss"}'] == 1
+        assert dump["rps_make_move_seconds"]["count"] == 4
+        assert dump["rps_game_make_move_seconds"]["count"] == 4
+        assert dump['rps_repository_operation_seconds{operation="save"}']["count"] == 5
@@ -0,0 +1,84 @@
+import pytest
+from src.application.services.parallel_match_runner import ParallelMatchRunner, owner_of
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.domain.strategies.strategy import Strategy
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+
+class AlwaysRock(Strategy):
+
+    def choose(self, rng):
+        return Move.ROCK
+
+def new_games(count):
+    return [Game(Player(f"Bot{index}", is_computer=True), Player("Computer", is_computer=True)) for index in range(count)]
+
+class TestParallelMatchRunner:
+
+    def test_games_are_played_and_merged(self):
+        games = new_games(40)
+        with ParallelMatchRunner(workers=2) as runner:
+            runner.run(games, rounds=25, seed=1)
+            runner.run(games, rounds=5, seed=2)
+
+        for game in games:
+            player1_score = game.scores[game.player1.id]
+            player2_score = game.scores[game.player2.id]
+            assert game.round_number == 30
+            assert player1_score + player2_score <= 30
+            assert set(game.last_round_moves) == {game.player1.id, game.player2.id}
+        assert sum(game.scores[game.player1.id] for game in games) > 0
+
+    def test_seeded_runs_are_reproducible(self):
+        games = new_games(10)
+        copies = [Game(game.player1, game.player2, game_id=game.id) for game in games]
+        with ParallelMatchRunner(workers=3) as runner:
+            runner.run(games, rounds=10, seed=42)
+            runner.run(copies, rounds=10, seed=42)
+
+        assert [dict(game.scores) for game in games] == [dict(game.scores) for game in copies]
+
+    def test_seeded_results_do_not_depend_on_the_number_of_workers(self):
+        games = new_games(10)
+        copies = [Game(game.player1, game.player2, game_id=game.id) for game in games]
+        with ParallelMatchRunner(workers=1) as runner:
+            runner.run(games, rounds=10, seed=42)
+        with ParallelMatchRunner(workers=3) as runner:
+            runner.run(copies, rounds=10, seed=42)
+
+        assert [dict(game.scores) for game in games] == [dict(game.scores) for game in copies]
+
+    def test_partitioning_is_stable(self):
+        assert owner_of("game-1", 4) == owner_of("game-1", 4)
+        assert {owner_of(f"game-{index}", 4) for index in range(100)} == {0, 1, 2, 3}
+
+    def test_games_stop_when_they_complete(self):
+        games = [
+            Game(Player("Bot", is_computer=True), Player("Computer", is_computer=True), end_condition=FirstTo(2))
+            for _ in range(10)
+        ]
+        with ParallelMatchRunner(workers=2) as runner:
+            runner.run(games, rounds=200, seed=3)
+            with pytest.raises(ValueError):
+                runner.run(games, rounds=1)
+
+        for game in games:
+            assert game.status == GameStatus.COMPLETED
+            assert max(game.scores.values()) == 2
+            assert game.round_number < 200
+
+    def test_games_continue_from_their_state_with_their_strategies(self):
+        rock = Player("Rock", is_computer=True, strategy=AlwaysRock())
+        game = Game(rock, Player("Alice"))
+        game.scores = {rock.id: 0, game.player2.id: 5}
+        pending = Game(Player("Alice"), Player("Bob"))
+        pending.make_move(pending.player1.id, Move.PAPER)
+
+        with ParallelMatchRunner(workers=1) as runner:
+            runner.run([game, pending], rounds=1, seed=1)
+
+        assert game.last_round_moves[rock.id] == Move.ROCK
+        assert game.scores[game.player2.id] >= 5 and game.round_number == 1
+        assert pending.last_round_moves[pending.player1.id] == Move.PAPER
+        assert pending.current_moves == {pending.player1.id: None, pending.player2.id: None}
@@ -0,0 +1,98 @@
+import pytest
+from src.application.services.game_service import GameService
+from src.application.services.replay_service import MatchRecord, record_match, replay_match
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+from src.domain.value_objects.rng_stream import RngStream
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+MOVES = list(Move)
+
+def state(game):
+    return (
+        game.player1.name, game.player2.name, game.status, game.round_number,
+        game.scores[game.player1.id], game.scores[game.player2.id], list(game.history.moves),
+    )
+
+def play_against_computer(game_service, rounds, **options):
+    game = game_service.start_game("Alice", "Computer", vs_computer=True, **options)
+    for round_number in range(rounds):
+        if game.status != GameStatus.ONGOING:
+            break
+        game = game_service.make_move(game.id, game.player1.id, MOVES[round_number % 3])
+    return game
+
+class TestReplayService:
+
+    def test_seeded_services_play_the_same_games(self):
+        first = [play_against_computer(GameService(InMemoryGameRepository(), seed=5), 30) for _ in range(2)]
+        assert state(first[0]) == state(first[1])
+        other = play_against_computer(GameService(InMemoryGameRepository(), seed=6), 30)
+        assert list(other.history.moves) != list(first[0].history.moves)
+
+    def test_replays_a_game_against_the_computer(self):
+        game = play_against_computer(GameService(InMemoryGameRepository(), seed=5), 40, end_condition=FirstTo(10))
+        record = record_match(game)
+
+        assert record.rounds == game.round_number
+        assert record.path == (0,)
+        assert state(replay_match(record)) == state(game)
+
+    def test_replays_a_game_played_through_a_durable_repository(self, tmp_path):
+        repository = SQLiteGameRepository(str(tmp_path / "games.db"))
+        play_against_computer(GameService(repository, seed=5), 40, end_condition=FirstTo(10))
+        stored = repository.list_all()[0]
+        repository.close()
+        in_memory = play_against_computer(GameService(InMemoryGameRepository(), seed=5), 40, end_condition=FirstTo(10))
+
+        assert state(stored) == state(in_memory)
+        assert state(replay_match(record_match(stored))) == state(stored)
+
+    def test_replays_computer_matches_with_their_strategies(self):
+        game = Game(
+            Player("Markov", is_computer=True, strategy=MarkovStrategy()), Player("Random", is_computer=True),
+            rng=RngStream(9, (3,)),
+        )
+        for _ in range(50):
+            game.play_computer_round()
+        record = record_match(game)
+
+        assert state(replay_match(record, [MarkovStrategy])) == state(game)
+
+    def test_replays_games_between_humans(self):
+        game = Game(Player("Alice"), Player("Bob"), rng=RngStream(1))
+        for first, second in [(Move.ROCK, Move.PAPER), (Move.SCISSORS, Move.PAPER), (Move.ROCK, Move.ROCK)]:
+            game.make_move(game.player2.id, second)
+            game.make_move(game.player1.id, first)
+        assert state(replay_match(record_match(game))) == state(game)
+
+    def test_detects_divergence(self):
+        game = play_against_computer(GameService(InMemoryGameRepository(), seed=5), 20)
+        record = record_match(game)
+        tampered = MatchRecord(
+            record.seed + 1, record.path, record.player1, record.player2,
+            record.player1_computer, record.player2_computer, record.moves,
+        )
+        with pytest.raises(ValueError, match="diverged"):
+            replay_match(tampered)
+
+        too_long = MatchRecord(
+            record.seed, record.path, record.player1, record.player2,
+            record.player1_computer, record.player2_computer, record.moves, FirstTo(1),
+        )
+        with pytest.raises(ValueError, match="after the game ended"):
+            replay_match(too_long)
+
+    def test_rejects_games_that_cannot_be_replayed(self):
+        with pytest.raises(ValueError):
+            record_match(Game(Player("Alice"), Player("Computer", is_computer=True)))
+
+        game = Game(Player("Alice"), Player("Computer", is_computer=True), rng=RngStream(1))
+        game.make_move(game.player1.id, Move.ROCK)
+        game.history = None
+        with pytest.raises(ValueError):
+            record_match(game)
@@ -0,0 +1,102 @@
+import pytest
+from src.application.services.tournament_service import Entrant, Knockout, RoundRobin, Swiss, Tournament
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.strategy import RandomStrategy, Strategy
+from src.domain.value_objects.end_condition import FirstTo, RoundCap
+from src.domain.value_objects.move import Move
+
+class AlwaysRock(Strategy):
+
+    def choose(self, rng):
+        return Move.ROCK
+
+def entrants(count):
+    field = [Entrant("markov", MarkovStrategy), Entrant("rock", AlwaysRock)]
+    return field + [Entrant(f"random-{index}", RandomStrategy) for index in range(count - 2)]
+
+def tournament(count, tournament_format, **options):
+    options.setdefault("executor", "thread")
+    return Tournament(entrants(count), tournament_format, RoundCap(50), workers=2, chunk_size=3, **options)
+
+class TestTournament:
+
+    @pytest.mark.parametrize("count", [5, 6])
+    def test_round_robin_plays_every_pairing_once(self, count):
+        event = tournament(count, RoundRobin())
+        results = list(event.run())
+
+        assert len(results) == event.total_matches == event.completed_matches == count * (count - 1) // 2
+        assert len({frozenset((result.player1, result.player2)) for result in results}) == len(results)
+        table = event.crosstable()
+        for row in range(count):
+            assert table[row][row] is None
+            for column in range(count):
+                if row != column:
+                    assert table[row][column] + table[column][row] == 1.0
+        assert table[0][1] == 1.0  # Markov learns to beat the rock bot
+        standings = event.standings()
+        assert [standing.rank for standing in standings] == list(range(1, count + 1))
+        assert all(first.points >= second.points for first, second in zip(standings, standings[1:]))
+        assert sum(standing.points for standing in standings) == len(results)
+
+    def test_swiss_avoids_rematches(self):
+        event = tournament(8, Swiss(rounds=3))
+        results = list(event.run())
+
+        assert len(results) == event.total_matches == 12
+        assert len({frozenset((result.player1, result.player2)) for result in results}) == 12
+        assert {result.round_number for result in results} == {1, 2, 3}
+
+    def test_knockout_with_byes(self):
+        knockout = Knockout()
+        event = tournament(6, knockout)
+        results = list(event.run())
+
+        assert len(results) == event.total_matches == 5
+        final = [result for result in results if result.round_number == 3]
+        assert len(final) == 1
+        assert event.entrants[knockout.champion].name in (final[0].player1, final[0].player2)
+        assert {result.player1 for result in results if result.round_number == 1}.isdisjoint({"markov", "rock"})
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        path = str(tmp_path / "swiss.ndjson")
+        interrupted = tournament(9, Swiss(rounds=3), checkpoint_path=path, checkpoint_every=1)
+        played = []
+        for result in interrupted.run():
+            played.append(result)
+            if len(played) == 6:
+                break  # Simulated crash in round 2
+        with open(path, "ab") as checkpoint:
+            checkpoint.write(b"[99, 2")  # Torn write
+
+        resumed = tournament(9, Swiss(rounds=3), checkpoint_path=path)
+        remaining = list(resumed.run())
+
+        assert len(played) + len(remaining) == resumed.total_matches == resumed.completed_matches == 12
+        assert {result.index for result in remaining}.isdisjoint(result.index for result in played)
+        with pytest.raises(ValueError, match="different tournament"):
+            list(tournament(8, Swiss(rounds=3), checkpoint_path=path).run())
+
+    def test_process_pool(self):
+        event = tournament(4, RoundRobin(cycles=2), executor="process")
+        results = list(event.run())
+        assert len(results) == 12
+        assert all(result.rounds_played == 50 for result in results)
+
+    def test_seeded_tournaments_are_reproducible(self):
+        def scores(event):
+            return sorted((result.index, result.player1_score, result.player2_score) for result in event.run())
+
+        threads = tournament(4, RoundRobin(), seed=3)
+        processes = tournament(4, RoundRobin(), seed=3, executor="process")
+        assert scores(threads) == scores(processes)
+
+    def test_matches_without_a_winner_stop_at_max_rounds_as_draws(self):
+        field = [Entrant("rock-1", AlwaysRock), Entrant("rock-2", AlwaysRock)]
+        event = Tournament(field, RoundRobin(), FirstTo(1), workers=1, executor="thread", max_rounds=20)
+        (result,) = event.run()
+
+        assert (result.rounds_played, result.capped, result.winner) == (20, True, None)
+        assert [standing.draws for standing in event.standings()] == [1, 1]
+        with pytest.raises(ValueError):
+            Tournament(field, RoundRobin(), max_rounds=0)
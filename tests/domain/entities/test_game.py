@@ -4,6 +4,7 @@ import uuid
 
 from src.domain.entities.game import Game, GameStatus
 from src.domain.entities.player import Player
+from src.domain.value_objects.end_condition import FirstTo
 from src.domain.value_objects.move import Move
 
 class TestGame(unittest.TestCase):
@@ -125,5 +126,35 @@ class TestGame(unittest.TestCase):
             self.game.make_move(self.player2.id, Move.SCISSORS)
         self.assertEqual(self.game.status, GameStatus.ONGOING)
 
+    def test_state_views_are_keyed_by_player_id(self):
+        """Test that the seat-indexed state is exposed as dicts keyed by player ID."""
+        self.game.make_move(self.player1.id, Move.PAPER)
+        self.game.scores[self.player2.id] = 4
+
+        self.assertEqual(dict(self.game.current_moves), {self.player1.id: Move.PAPER, self.player2.id: None})
+        self.assertEqual(self.game.scores[self.player2.id], 4)
+        self.assertEqual(list(self.game.scores), [self.player1.id, self.player2.id])
+        with self.assertRaises(KeyError):
+            self.game.scores["invalid_id"]
+
+        self.game.last_round_winner = self.player2.id
+        self.assertEqual(self.game.last_round_winner, self.player2.id)
+
+    def test_game_and_player_have_no_instance_dict(self):
+        """Test that games and players use fixed slots instead of a per-instance __dict__."""
+        self.assertFalse(hasattr(self.game, "__dict__"))
+        self.assertFalse(hasattr(self.player1, "__dict__"))
+
+    def test_end_condition_completes_game(self):
+        """Test that a game with an end condition completes after the deciding round and rejects further moves."""
+        game = Game(self.player1, self.player2, end_condition=FirstTo(2))
+        for move in (Move.SCISSORS, Move.ROCK, Move.SCISSORS):
+            game.make_move(self.player1.id, Move.ROCK)
+            game.make_move(self.player2.id, move)
+        self.assertEqual(game.status, GameStatus.COMPLETED)
+        self.assertEqual(game.round_number, 3)
+        with self.assertRaisesRegex(Exception, "Game has already ended."):
+            game.make_move(self.player1.id, Move.ROCK)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
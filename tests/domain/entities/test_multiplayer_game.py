@@ -0,0 +1,93 @@
+import itertools
+import pytest
+from src.domain.entities.game import GameStatus
+from src.domain.entities.multiplayer_game import MultiplayerGame
+from src.domain.entities.player import Player
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+
+def humans(count):
+    return [Player(f"Player {index}") for index in range(count)]
+
+def play(game, moves):
+    for player, move in zip(game.players, moves):
+        game.make_move(player.id, move)
+
+class TestMultiplayerGame:
+
+    def test_round_waits_for_every_human(self):
+        game = MultiplayerGame(humans(3))
+        game.make_move(game.players[0].id, Move.ROCK)
+        game.make_move(game.players[1].id, Move.ROCK)
+
+        assert game.round_number == 0
+        assert game.move_counts[Move.ROCK] == 2
+        assert game.last_round_moves == {}
+
+        game.make_move(game.players[2].id, Move.SCISSORS)
+
+        assert game.round_number == 1
+        assert game.last_round_winners == [game.players[0].id, game.players[1].id]
+        assert game.scores == {game.players[0].id: 1, game.players[1].id: 1, game.players[2].id: 0}
+        assert game.current_moves == dict.fromkeys(game.scores)
+
+    def test_changing_a_move_before_the_round_ends(self):
+        game = MultiplayerGame(humans(3))
+        game.make_move(game.players[0].id, Move.ROCK)
+        game.make_move(game.players[0].id, Move.PAPER)
+
+        assert game.move_counts == {Move.ROCK: 0, Move.PAPER: 1, Move.SCISSORS: 0}
+
+    @pytest.mark.parametrize("moves", [[Move.ROCK] * 4, [Move.ROCK, Move.PAPER, Move.SCISSORS]])
+    def test_ties(self, moves):
+        game = MultiplayerGame(humans(len(moves)))
+        play(game, moves)
+
+        assert game.last_round_winners == []
+        assert sum(game.scores.values()) == 0
+
+    def test_largest_margin_wins_when_every_move_is_played(self):
+        game = MultiplayerGame(humans(10))
+        # Rock beats 2 and loses to 3, paper beats 5 and loses to 2, scissors beats 3 and loses to 5
+        play(game, [Move.ROCK] * 5 + [Move.PAPER] * 3 + [Move.SCISSORS] * 2)
+
+        assert game.last_round_winners == [player.id for player in game.players[5:8]]
+
+    def test_two_seats_match_the_classic_rules(self):
+        for move1, move2 in itertools.product(Move, repeat=2):
+            game = MultiplayerGame(humans(2))
+            play(game, [move1, move2])
+            result = Move.compare_moves(move1, move2)
+            expected = {1: [game.players[0].id], -1: [game.players[1].id], 0: []}[result]
+            assert game.last_round_winners == expected
+
+    def test_computers_move_after_the_humans(self):
+        players = humans(1) + [Player(f"Computer {index}", is_computer=True) for index in range(50)]
+        game = MultiplayerGame(players)
+
+        game.make_move(players[0].id, Move.ROCK)
+
+        assert game.round_number == 1
+        assert len(game.last_round_moves) == 51
+        with pytest.raises(ValueError):
+            game.make_move(players[1].id, Move.ROCK)
+
+    def test_computer_only_game_ends(self):
+        players = [Player(f"Computer {index}", is_computer=True) for index in range(1000)]
+        game = MultiplayerGame(players, end_condition=FirstTo(3))
+
+        while game.status == GameStatus.ONGOING:
+            game.play_computer_round()
+
+        assert max(game.scores.values()) == 3
+        with pytest.raises(Exception, match="already ended"):
+            game.play_computer_round()
+
+    def test_rejects_invalid_lobbies(self):
+        player = Player("Alice")
+        with pytest.raises(ValueError):
+            MultiplayerGame([player])
+        with pytest.raises(ValueError):
+            MultiplayerGame([player, player])
+        with pytest.raises(Exception):
+            MultiplayerGame(humans(2)).play_computer_round()
@@ -0,0 +1,68 @@
+import random
+import pytest
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.mixture_of_experts_strategy import MixtureOfExpertsStrategy
+from src.domain.strategies.strategy import RANDOM
+from src.domain.value_objects.move import Move
+
+def win_rate(strategy, opponent_moves, warmup=30):
+    """Play the strategy against a fixed sequence of opponent moves and return its win rate after warmup."""
+    rng = random.Random(0)
+    wins = 0
+    for index, opponent_move in enumerate(opponent_moves):
+        move = strategy.choose(rng)
+        if index >= warmup:
+            wins += Move.compare_moves(move, opponent_move) == 1
+        strategy.observe(move, opponent_move)
+    return wins / (len(opponent_moves) - warmup)
+
+CYCLE = [Move.ROCK, Move.PAPER, Move.SCISSORS] * 100
+
+class TestStrategies:
+
+    def test_frequency_counters_a_biased_opponent(self):
+        opponent = [Move.ROCK] * 200 + [Move.PAPER] * 100
+        assert win_rate(FrequencyStrategy(), opponent) > 0.6
+
+    @pytest.mark.parametrize("order", [1, 2, 3])
+    def test_markov_learns_a_cycle(self, order):
+        assert win_rate(MarkovStrategy(order=order), CYCLE) > 0.9
+
+    def test_mixture_switches_to_the_best_expert(self):
+        opponent = [Move.SCISSORS] * 150 + CYCLE[:300]
+        assert win_rate(MixtureOfExpertsStrategy(), opponent) > 0.7
+
+    def test_invalid_markov_order(self):
+        with pytest.raises(ValueError):
+            MarkovStrategy(order=0)
+
+class TestComputerPlayers:
+
+    def test_computer_players_default_to_shared_random_strategy(self):
+        assert Player("Computer", is_computer=True).strategy is RANDOM
+        assert Player("Alice").strategy is None
+
+    def test_strategies_observe_every_round(self):
+        strategy = MarkovStrategy(order=1)
+        human = Player("Alice")
+        computer = Player("Computer", is_computer=True, strategy=strategy)
+        game = Game(human, computer)
+
+        for move in CYCLE[:60]:
+            game.make_move(human.id, move)
+
+        assert game.round_number == 60
+        assert game.scores[computer.id] > 40
+
+    def test_play_computer_round(self):
+        game = Game(Player("Bot", is_computer=True, strategy=FrequencyStrategy()), Player("Computer", is_computer=True))
+        for _ in range(10):
+            game.play_computer_round()
+        assert game.round_number == 10
+
+        human_game = Game(Player("Alice"), Player("Computer", is_computer=True))
+        with pytest.raises(Exception, match="Both players must be computers."):
+            human_game.play_computer_round()
@@ -0,0 +1,22 @@
+import pytest
+from src.domain.value_objects.end_condition import AnyOf, BestOf, EndCondition, FirstTo, RoundCap
+
+class TestEndCondition:
+
+    def test_conditions(self):
+        assert not FirstTo(3).is_met([2, 2], 10)
+        assert FirstTo(3).is_met([0, 3], 3)
+        assert not BestOf(5).is_met([2, 1], 8)
+        assert BestOf(5).is_met([3, 0], 3)
+        assert not RoundCap(4).is_met([0, 0], 3)
+        assert RoundCap(4).is_met([0, 0], 4)
+        assert AnyOf((BestOf(5), RoundCap(4))).is_met([1, 0], 4)
+
+    @pytest.mark.parametrize("condition", [FirstTo(3), BestOf(7), RoundCap(100), AnyOf((BestOf(5), RoundCap(20)))])
+    def test_string_form_round_trips(self, condition):
+        assert EndCondition.parse(str(condition)) == condition
+
+    @pytest.mark.parametrize("spec", ["", "first_to", "first_to:x", "sudden_death:1", "best_of:0"])
+    def test_parse_rejects_invalid_specs(self, spec):
+        with pytest.raises(ValueError):
+            EndCondition.parse(spec)
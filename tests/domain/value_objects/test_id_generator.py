@@ -0,0 +1,77 @@
+import threading
+import uuid
+import pytest
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.id_generator import (
+    RandomUuidGenerator,
+    SnowflakeIdGenerator,
+    TimeOrderedIdGenerator,
+    set_id_generator,
+)
+
+class TestIdGenerator:
+
+    def test_time_ordered_ids_are_increasing_version_7_uuids(self):
+        generator = TimeOrderedIdGenerator()
+        ids = [generator() for _ in range(10000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        parsed = uuid.UUID(ids[0])
+        assert str(parsed) == ids[0]
+        assert parsed.version == 7
+        assert parsed.variant == uuid.RFC_4122
+
+    def test_time_ordered_ids_are_unique_across_threads(self):
+        generator = TimeOrderedIdGenerator()
+        results = [[] for _ in range(4)]
+
+        def take(index):
+            results[index] = [generator.next_int() for _ in range(5000)]
+
+        threads = [threading.Thread(target=take, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({value for result in results for value in result}) == 20000
+        assert all(result == sorted(result) for result in results)
+
+    def test_reseed_changes_the_node(self):
+        generator = TimeOrderedIdGenerator()
+        node = generator.next_int() & ((1 << 48) - 1)
+        generator.reseed()
+        assert generator.next_int() & ((1 << 48) - 1) != node
+
+    def test_snowflake_ids_carry_the_worker_id(self):
+        generator = SnowflakeIdGenerator(worker_id=5)
+        values = [generator.next_int() for _ in range(10000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        assert all((value >> 12) & 0x3FF == 5 for value in values)
+        assert values[-1] < 1 << 63
+        assert generator().isdigit()
+
+    def test_snowflake_rejects_out_of_range_worker_id(self):
+        with pytest.raises(ValueError):
+            SnowflakeIdGenerator(worker_id=1024)
+
+    def test_entities_use_the_configured_generator(self):
+        previous = set_id_generator(SnowflakeIdGenerator(worker_id=1))
+        try:
+            game = Game(Player("Alice"), Player("Bob"))
+        finally:
+            set_id_generator(previous)
+
+        assert game.id.isdigit()
+        assert game.player1.id.isdigit()
+        assert uuid.UUID(Game(Player("Alice"), Player("Bob")).id)
+
+    def test_random_uuid_generator(self):
+        generator = RandomUuidGenerator()
+        assert uuid.UUID(generator()).version == 4
+        value = generator.next_int()
+        assert uuid.UUID(generator.format(value)).int == value
@@ -0,0 +1,45 @@
+import pytest
+from src.domain.value_objects.move import Move
+from src.domain.value_objects.rule_set import CLASSIC, ROCK_PAPER_SCISSORS_LIZARD_SPOCK, RuleSet
+
+class TestMove:
+
+    def test_codes_are_explicit(self):
+        assert (Move.ROCK.code, Move.PAPER.code, Move.SCISSORS.code) == (0, 1, 2)
+        assert all(Move.from_code(move.code) is move for move in Move)
+        assert all(CLASSIC.names[move.code] == move.value for move in Move)
+        assert Move("paper") is Move.PAPER
+
+    def test_compare_moves(self):
+        assert Move.compare_moves(Move.ROCK, Move.SCISSORS) == 1
+        assert Move.compare_moves(Move.SCISSORS, Move.PAPER) == 1
+        assert Move.compare_moves(Move.PAPER, Move.ROCK) == 1
+        assert Move.compare_moves(Move.ROCK, Move.PAPER) == -1
+        assert Move.compare_moves(Move.SCISSORS, Move.SCISSORS) == 0
+
+class TestRuleSet:
+
+    def test_rock_paper_scissors_lizard_spock(self):
+        rules = ROCK_PAPER_SCISSORS_LIZARD_SPOCK
+        code = {name: index for index, name in enumerate(rules.names)}
+        wins = [
+            ("scissors", "paper"), ("paper", "rock"), ("rock", "lizard"), ("lizard", "spock"),
+            ("spock", "scissors"), ("scissors", "lizard"), ("lizard", "paper"), ("paper", "spock"),
+            ("spock", "rock"), ("rock", "scissors"),
+        ]
+        for winner, loser in wins:
+            assert rules.compare(code[winner], code[loser]) == 1
+            assert rules.compare(code[loser], code[winner]) == -1
+
+    @pytest.mark.parametrize("size", [3, 5, 7, 101])
+    def test_cyclic_games_are_balanced(self, size):
+        rules = RuleSet.cyclic([str(index) for index in range(size)])
+        for code in range(size):
+            assert sum(rules.compare(code, other) == 1 for other in range(size)) == (size - 1) // 2
+            assert len(rules.beaten_by[code]) == (size - 1) // 2
+
+    def test_invalid_rule_sets(self):
+        with pytest.raises(ValueError):
+            RuleSet.cyclic(["a", "b", "c", "d"])
+        with pytest.raises(ValueError):
+            RuleSet(["a", "b"], [[0, 1], [1, 0]])
@@ -0,0 +1,44 @@
+import pickle
+import pytest
+from src.domain.value_objects.rng_stream import RngStream
+
+def draws(rng, count=5):
+    return [rng.random() for _ in range(count)]
+
+class TestRngStream:
+
+    def test_same_seed_and_path_give_the_same_stream(self):
+        assert draws(RngStream(7, (1, 2))) == draws(RngStream(7, (1, 2)))
+        assert draws(RngStream(7)) != draws(RngStream(8))
+
+    def test_children_do_not_depend_on_the_parent_state(self):
+        parent = RngStream(7)
+        first = draws(parent.spawn(3))
+        draws(parent, 100)
+        assert draws(parent.spawn(3)) == first
+        assert parent.spawn(3).path == (3,)
+
+    def test_siblings_differ(self):
+        children = RngStream(7).split(4)
+        assert len({tuple(draws(child)) for child in children}) == 4
+        assert draws(RngStream(7).spawn(0)) != draws(RngStream(7))
+
+    def test_pickles_with_its_position(self):
+        rng = RngStream(7, (1,))
+        draws(rng, 10)
+        copy = pickle.loads(pickle.dumps(rng))
+        assert (copy.root_seed, copy.path) == (7, (1,))
+        assert draws(copy) == draws(rng)
+
+    def test_string_form_restores_the_position(self):
+        rng = RngStream(7, (1, 2))
+        draws(rng, 10)
+        rng.choice(range(100))
+        copy = RngStream.parse(str(rng))
+        assert (copy.root_seed, copy.path, copy.draws) == (7, (1, 2), rng.draws)
+        assert draws(copy) == draws(rng)
+        assert draws(RngStream.parse(str(RngStream(-3)))) == draws(RngStream(-3))
+
+    def test_rejects_malformed_strings(self):
+        with pytest.raises(ValueError):
+            RngStream.parse("7:1.x:0")
@@ -0,0 +1,61 @@
+import csv
+from src.application.services.game_service import GameService
+from src.domain.value_objects.move import Move
+from src.infrastructure.export.round_history_exporter import COLUMNS, RoundHistoryExporter
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+class TestRoundHistoryExporter:
+
+    def test_game_records_every_round(self):
+        game_service = GameService(InMemoryGameRepository())
+        game = game_service.start_game("Alice", "Bob")
+        rounds = [(Move.ROCK, Move.SCISSORS), (Move.PAPER, Move.SCISSORS), (Move.ROCK, Move.ROCK)]
+        for move1, move2 in rounds:
+            game_service.make_move(game.id, game.player1.id, move1)
+            game_service.make_move(game.id, game.player2.id, move2)
+
+        records = list(game.history)
+
+        assert [record.round_number for record in records] == [1, 2, 3]
+        assert [(record.player1_move, record.player2_move) for record in records] == rounds
+        assert [record.winner_seat for record in records] == [0, 1, None]
+        assert len(game.history.moves) == 3 and game.history.moves.itemsize == 1
+
+    def test_export_splits_rows_across_part_files(self, tmp_path):
+        repository = InMemoryGameRepository()
+        game_service = GameService(repository)
+        for _ in range(5):
+            game = game_service.start_game("Alice", "Computer", vs_computer=True)
+            for _ in range(5):
+                game_service.make_move(game.id, game.player1.id, Move.PAPER)
+
+        paths = RoundHistoryExporter(repository, rows_per_file=10, chunk_size=4).export(str(tmp_path))
+
+        assert [path.rsplit("/", 1)[-1] for path in paths] == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+        rows = []
+        for path in paths:
+            with open(path, newline="") as part:
+                reader = csv.reader(part)
+                assert tuple(next(reader)) == COLUMNS
+                rows.extend(reader)
+        assert len(rows) == 25
+        assert {row[4] for row in rows} == {"paper"}
+        assert sorted(int(row[1]) for row in rows) == sorted(list(range(1, 6)) * 5)
+
+    def test_export_pages_through_an_sqlite_repository(self, tmp_path, monkeypatch):
+        repository = SQLiteGameRepository(str(tmp_path / "games.db"))
+        game_service = GameService(repository)
+        for _ in range(3):
+            game = game_service.start_game("Alice", "Computer", vs_computer=True)
+            for _ in range(2):
+                game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        monkeypatch.setattr(repository, "list_all", None)  # The export must not load everything at once
+
+        paths = RoundHistoryExporter(repository).export(str(tmp_path / "export"))
+
+        with open(paths[0], newline="") as part:
+            rows = list(csv.reader(part))[1:]
+        assert len(rows) == 6
+        assert {row[4] for row in rows} == {"rock"}
+        repository.close()
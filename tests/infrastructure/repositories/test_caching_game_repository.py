@@ -0,0 +1,154 @@
+import pytest
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.caching_game_repository import CachingGameRepository
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+def new_game():
+    return Game(Player("Alice"), Player("Bob"))
+
+class CountingRepository(InMemoryGameRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+        self.gets = 0
+
+    def save(self, game):
+        self.saves += 1
+        super().save(game)
+
+    def get(self, game_id):
+        self.gets += 1
+        return super().get(game_id)
+
+class TestCachingGameRepository:
+
+    @pytest.fixture
+    def clock(self):
+        now = [0.0]
+        clock = lambda: now[0]
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    def test_hits_are_served_from_the_cache(self):
+        backing = CountingRepository()
+        game = new_game()
+        backing.save(game)
+        repository = CachingGameRepository(backing)
+
+        assert repository.get(game.id) is game
+        assert repository.get(game.id) is game
+        assert repository.get("missing") is None
+
+        assert backing.gets == 2
+        stats = repository.stats
+        assert (stats.hits, stats.misses) == (1, 2)
+        assert stats.hit_rate == pytest.approx(1 / 3)
+
+    def test_write_through_skips_unchanged_games(self):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing)
+        game = new_game()
+
+        repository.save(game)
+        repository.save(game)
+        game.make_move(game.player1.id, Move.ROCK)
+        repository.save(game)
+
+        assert backing.saves == 2
+        assert repository.stats.skipped_writes == 1
+
+    def test_write_back_defers_writes_until_flush(self):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing, write_back=True)
+        game = new_game()
+
+        repository.save(game)
+        game.make_move(game.player1.id, Move.ROCK)
+        repository.save(game)
+        assert backing.saves == 0
+
+        assert repository.flush() == 1
+        assert repository.flush() == 0
+        assert backing.get(game.id) is game
+        assert backing.saves == 1
+
+    def test_evicting_a_dirty_entry_writes_it(self):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing, capacity=2, write_back=True)
+        games = [new_game() for _ in range(3)]
+        for game in games:
+            repository.save(game)
+
+        assert len(repository) == 2
+        assert backing.get(games[0].id) is games[0]
+        assert backing.get(games[2].id) is None
+        assert repository.stats.evictions == 1
+
+    def test_get_refreshes_recency(self):
+        repository = CachingGameRepository(InMemoryGameRepository(), capacity=2)
+        first, second, third = new_game(), new_game(), new_game()
+        repository.save(first)
+        repository.save(second)
+        repository.get(first.id)
+        repository.save(third)
+
+        hits = repository.stats.hits
+        repository.get(first.id)
+        repository.get(second.id)
+        assert repository.stats.hits == hits + 1
+
+    def test_expired_entries_are_reloaded(self, clock):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing, ttl=10, write_back=True, clock=clock)
+        game = new_game()
+        repository.save(game)
+
+        clock.advance(5)
+        assert repository.get(game.id) is game
+        clock.advance(11)
+        assert repository.get(game.id) is game
+
+        assert backing.saves == 1
+        assert backing.gets == 1
+        assert repository.stats.expirations == 1
+
+    def test_evict_expired_writes_dirty_entries(self, clock):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing, ttl=10, write_back=True, clock=clock)
+        repository.save(new_game())
+        clock.advance(10)
+
+        assert repository.evict_expired() == 1
+        assert len(repository) == 0
+        assert backing.saves == 1
+
+    def test_list_all_and_delete_see_pending_writes(self):
+        backing = InMemoryGameRepository()
+        repository = CachingGameRepository(backing, write_back=True)
+        game = new_game()
+        repository.save(game)
+
+        assert [listed.id for listed in repository.list_all()] == [game.id]
+        repository.delete(game.id)
+        assert repository.get(game.id) is None
+        assert backing.get(game.id) is None
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            CachingGameRepository(InMemoryGameRepository(), capacity=0)
+
+    def test_bulk_operations(self):
+        backing = CountingRepository()
+        repository = CachingGameRepository(backing)
+        cached, stored = new_game(), new_game()
+        repository.save_many([cached])
+        backing.save(stored)
+        saves = backing.saves
+
+        assert repository.get_many([cached.id, stored.id, "missing"]) == {cached.id: cached, stored.id: stored}
+        assert (repository.stats.hits, repository.stats.misses) == (1, 2)
+        repository.save_many([cached, stored])
+        assert backing.saves == saves
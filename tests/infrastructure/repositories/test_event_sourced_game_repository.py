@@ -0,0 +1,146 @@
+import os
+import pytest
+from src.application.services.game_service import GameService
+from src.domain.events.game_events import MovePlayed, RoundCompleted
+from src.domain.entities.game import GameStatus
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.value_objects.end_condition import AnyOf, FirstTo, RoundCap
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.event_sourced_game_repository import EventSourcedGameRepository
+
+class TestEventSourcedGameRepository:
+
+    @pytest.fixture
+    def path(self, tmp_path):
+        return str(tmp_path / "games.log")
+
+    @pytest.fixture
+    def repository(self, path):
+        repository = EventSourcedGameRepository(path, snapshot_interval=4)
+        yield repository
+        repository.close()
+
+    def play(self, game_service, game, rounds):
+        for move1, move2 in rounds:
+            game_service.make_move(game.id, game.player1.id, move1)
+            game_service.make_move(game.id, game.player2.id, move2)
+
+    def test_rebuilds_game_across_snapshots(self, repository):
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Bob")
+        self.play(game_service, game, [(Move.ROCK, Move.SCISSORS)] * 3 + [(Move.ROCK, Move.PAPER)])
+        game_service.make_move(game.id, game.player1.id, Move.PAPER)
+
+        loaded = repository.get(game.id)
+
+        assert loaded.scores == {game.player1.id: 3, game.player2.id: 1}
+        assert loaded.round_number == 4
+        assert loaded.last_round_winner == game.player2.id
+        assert loaded.last_round_moves == {game.player1.id: Move.ROCK, game.player2.id: Move.PAPER}
+        assert loaded.current_moves == {game.player1.id: Move.PAPER, game.player2.id: None}
+
+    def test_rng_stream_survives_reopen(self, repository, path):
+        game_service = GameService(repository, seed=3)
+        game = game_service.start_game("Alice", "Computer", vs_computer=True)
+        for _ in range(6):  # Crosses a snapshot
+            game = game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        repository.close()
+
+        reopened = EventSourcedGameRepository(path, snapshot_interval=4)
+        try:
+            loaded = reopened.get(game.id)
+        finally:
+            reopened.close()
+        assert str(loaded.rng) == str(game.rng)
+        assert loaded.rng.random() == game.rng.random()
+
+    def test_computer_strategy_survives_reopen(self, repository, path):
+        game_service = GameService(repository, seed=3)
+        game = game_service.start_game("Alice", "Computer", vs_computer=True, computer_strategy=FrequencyStrategy())
+        for move in [Move.ROCK, Move.ROCK, Move.PAPER, Move.ROCK, Move.SCISSORS, Move.ROCK]:  # Crosses a snapshot
+            game = game_service.make_move(game.id, game.player1.id, move)
+        repository.close()
+
+        reopened = EventSourcedGameRepository(path, snapshot_interval=4)
+        try:
+            loaded = reopened.get(game.id)
+        finally:
+            reopened.close()
+        assert isinstance(loaded.player2.strategy, FrequencyStrategy)
+        assert loaded.player2.strategy.get_state() == {"counts": [4, 1, 1], "most_frequent": 0}
+
+    def test_end_condition_survives_reopen(self, repository, path):
+        game_service = GameService(repository)
+        end_condition = AnyOf((FirstTo(3), RoundCap(2)))
+        game = game_service.start_game("Alice", "Bob", end_condition=end_condition)
+        self.play(game_service, game, [(Move.ROCK, Move.ROCK)])
+        repository.close()
+
+        reopened = EventSourcedGameRepository(path, snapshot_interval=4)
+        try:
+            loaded = reopened.get(game.id)
+            assert loaded.end_condition == end_condition
+            self.play(GameService(reopened), loaded, [(Move.ROCK, Move.ROCK)])
+            assert reopened.get(game.id).status == GameStatus.COMPLETED
+        finally:
+            reopened.close()
+
+    def test_move_appends_constant_size(self, repository, path):
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Bob")
+        self.play(game_service, game, [(Move.ROCK, Move.ROCK)])
+        size = os.path.getsize(path)
+
+        game_service.make_move(game.id, game.player1.id, Move.ROCK)
+
+        assert os.path.getsize(path) - size == 9
+
+    def test_reopen_and_audit_replay(self, repository, path):
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Computer", vs_computer=True)
+        deleted = game_service.start_game("Carol", "Dave")
+        for _ in range(5):
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        repository.delete(deleted.id)
+        expected = repository.get(game.id)
+        repository.close()
+
+        reopened = EventSourcedGameRepository(path)
+        assert reopened.get(deleted.id) is None
+        assert reopened.get(game.id).scores == expected.scores
+        events = list(reopened.iter_events(game.id))
+        reopened.close()
+
+        assert len([event for event in events if isinstance(event, MovePlayed)]) == 10
+        rounds = [event for event in events if isinstance(event, RoundCompleted)]
+        assert [event.round_number for event in rounds] == [1, 2, 3, 4, 5]
+        assert sum(event.winner_id == game.player1.id for event in rounds) == expected.scores[game.player1.id]
+
+    def test_torn_tail_is_discarded(self, repository, path):
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Bob")
+        repository.close()
+        with open(path, "ab") as log_file:
+            log_file.write(b"\x01\x06")
+
+        reopened = EventSourcedGameRepository(path)
+        assert reopened.get(game.id).scores == {game.player1.id: 0, game.player2.id: 0}
+        reopened.close()
+
+    def test_save_many_matches_single_saves(self, repository, path):
+        game_service = GameService(repository)
+        games = game_service.start_games([("Alice", "Bob"), ("Carol", "Dave")])
+        for _ in range(3):
+            game_service.apply_moves(
+                [(game.id, game.player1.id, Move.ROCK) for game in games]
+                + [(game.id, game.player2.id, Move.SCISSORS) for game in games]
+            )
+        repository.close()
+
+        reopened = EventSourcedGameRepository(path, snapshot_interval=4)
+        try:
+            loaded = reopened.get_many(game.id for game in games)
+            assert [loaded[game.id].scores[game.player1.id] for game in games] == [3, 3]
+            assert [len(list(reopened.iter_events(game.id))) for game in games] == [9, 9]
+        finally:
+            reopened.close()
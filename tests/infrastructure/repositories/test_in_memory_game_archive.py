@@ -0,0 +1,48 @@
+import pytest
+from src.application.services.game_service import GameService
+from src.domain.entities.game_summary import GameSummary
+from src.domain.value_objects.end_condition import FirstTo
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories.in_memory_game_archive import InMemoryGameArchive
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+class TestInMemoryGameArchive:
+
+    @pytest.fixture
+    def archive(self):
+        return InMemoryGameArchive()
+
+    def test_add_and_get(self, archive):
+        first = GameSummary("game-1", "Alice", "Bob", 3, 1, 5, 1000.0)
+        second = GameSummary("game-2", "Bob", "Alice", 2, 2, 4, 2000.0)
+        archive.add(first)
+        archive.add(second)
+        archive.add(second._replace(player1_score=3))
+
+        assert archive.get("game-1") == first
+        assert archive.get("game-2") == second._replace(player1_score=3)
+        assert archive.get("missing") is None
+        assert list(archive.list_all()) == [first, second._replace(player1_score=3)]
+        assert len(archive) == 2
+        assert first.winner_name == "Alice"
+        assert second.winner_name is None
+
+    def test_game_service_moves_completed_games_to_the_archive(self, archive):
+        repository = InMemoryGameRepository()
+        game_service = GameService(repository, archive=archive)
+        game = game_service.start_game("Alice", "Bob", end_condition=FirstTo(2))
+
+        for move in (Move.SCISSORS, Move.ROCK):
+            game_service.make_move(game.id, game.player1.id, Move.ROCK)
+            game_service.make_move(game.id, game.player2.id, move)
+        assert repository.get(game.id) is not None
+        assert len(archive) == 0
+
+        game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        game_service.make_move(game.id, game.player2.id, Move.SCISSORS)
+
+        assert repository.get(game.id) is None
+        summary = archive.get(game.id)
+        assert (summary.player1_name, summary.player1_score, summary.player2_score) == ("Alice", 2, 0)
+        assert summary.rounds_played == 3
+        assert summary.winner_name == "Alice"
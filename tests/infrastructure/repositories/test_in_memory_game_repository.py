@@ -0,0 +1,103 @@
+import threading
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories import in_memory_game_repository
+from src.infrastructure.repositories.in_memory_game_repository import InMemoryGameRepository
+
+def new_game():
+    return Game(Player("Alice"), Player("Bob"))
+
+class TestInMemoryGameRepository:
+
+    def test_save_get_delete(self):
+        repository = InMemoryGameRepository()
+        game = new_game()
+        repository.save(game)
+
+        assert repository.get(game.id) is game
+        repository.delete(game.id)
+        assert repository.get(game.id) is None
+
+    def test_restart_from_snapshot_loads_games_lazily(self, tmp_path):
+        path = str(tmp_path / "games.snapshot")
+        repository = InMemoryGameRepository(snapshot_path=path)
+        games = [new_game() for _ in range(20)]
+        for game in games:
+            repository.save(game)
+        games[0].make_move(games[0].player1.id, Move.PAPER)
+        repository.close()
+
+        restarted = InMemoryGameRepository(snapshot_path=path)
+        try:
+            assert restarted._games == {}
+            loaded = restarted.get(games[0].id)
+            assert loaded.current_moves[games[0].player1.id] == Move.PAPER
+            assert restarted.get(games[0].id) is loaded
+            assert len(restarted._games) == 1
+        finally:
+            restarted.close()
+
+    def test_snapshot_keeps_unloaded_games_and_honours_deletes(self, tmp_path):
+        path = str(tmp_path / "games.snapshot")
+        repository = InMemoryGameRepository(snapshot_path=path)
+        kept, deleted = new_game(), new_game()
+        repository.save(kept)
+        repository.save(deleted)
+        repository.close()
+
+        restarted = InMemoryGameRepository(snapshot_path=path)
+        restarted.delete(deleted.id)
+        added = new_game()
+        restarted.save(added)
+        assert restarted.get(deleted.id) is None
+        restarted.close()
+
+        reopened = InMemoryGameRepository(snapshot_path=path)
+        try:
+            assert {game.id for game in reopened.list_all()} == {kept.id, added.id}
+        finally:
+            reopened.close()
+
+    def test_snapshots_only_encode_changed_games(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "games.snapshot")
+        repository = InMemoryGameRepository(snapshot_path=path)
+        games = [new_game() for _ in range(5)]
+        for game in games:
+            repository.save(game)
+        repository.save_snapshot()
+
+        encoded = []
+        encode_game = in_memory_game_repository.encode_game
+
+        def counting_encode(game):
+            encoded.append(game)
+            return encode_game(game)
+
+        monkeypatch.setattr(in_memory_game_repository, "encode_game", counting_encode)
+        games[2].make_move(games[2].player1.id, Move.ROCK)
+        assert repository.save_snapshot() == 5
+        assert encoded == [games[2]]
+        repository.close()
+
+        reopened = InMemoryGameRepository(snapshot_path=path)
+        try:
+            assert reopened.get(games[2].id).current_moves[games[2].player1.id] == Move.ROCK
+        finally:
+            reopened.close()
+
+    def test_cold_gets_do_not_wait_for_snapshot_writes(self, tmp_path):
+        path = str(tmp_path / "games.snapshot")
+        repository = InMemoryGameRepository(snapshot_path=path)
+        game = new_game()
+        repository.save(game)
+        repository.close()
+
+        restarted = InMemoryGameRepository(snapshot_path=path)
+        loaded = []
+        with restarted._write_lock:  # As if a snapshot were being written
+            reader = threading.Thread(target=lambda: loaded.append(restarted.get(game.id)))
+            reader.start()
+            reader.join(timeout=5)
+            assert loaded and loaded[0].id == game.id
+        restarted.close()
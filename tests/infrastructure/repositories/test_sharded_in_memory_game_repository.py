@@ -0,0 +1,88 @@
+import threading
+import pytest
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.infrastructure.repositories.sharded_in_memory_game_repository import ShardedInMemoryGameRepository
+
+def new_game():
+    return Game(Player("Alice"), Player("Bob"))
+
+class TestShardedInMemoryGameRepository:
+
+    @pytest.fixture
+    def clock(self):
+        now = [0.0]
+        clock = lambda: now[0]
+        clock.advance = lambda seconds: now.__setitem__(0, now[0] + seconds)
+        return clock
+
+    def test_save_get_delete(self):
+        repository = ShardedInMemoryGameRepository(shard_count=4)
+        game = new_game()
+        repository.save(game)
+
+        assert repository.get(game.id) is game
+        repository.delete(game.id)
+        assert repository.get(game.id) is None
+
+    def test_list_all_is_lazy_and_complete(self):
+        repository = ShardedInMemoryGameRepository(shard_count=8)
+        games = [new_game() for _ in range(50)]
+        for game in games:
+            repository.save(game)
+
+        listed = repository.list_all()
+
+        assert not isinstance(listed, list)
+        assert {game.id for game in listed} == {game.id for game in games}
+
+    @pytest.mark.parametrize("count", [1, 7, 50, 100])
+    def test_scan_pages_through_every_game(self, count):
+        repository = ShardedInMemoryGameRepository(shard_count=8)
+        games = [new_game() for _ in range(50)]
+        for game in games:
+            repository.save(game)
+
+        seen = []
+        cursor, page = repository.scan(0, count)
+        seen.extend(page)
+        while cursor:
+            assert len(page) == count
+            cursor, page = repository.scan(cursor, count)
+            seen.extend(page)
+
+        assert sorted(game.id for game in seen) == sorted(game.id for game in games)
+
+    def test_ttl_eviction(self, clock):
+        repository = ShardedInMemoryGameRepository(completed_ttl=10, idle_ttl=100, clock=clock)
+        completed, idle, active = new_game(), new_game(), new_game()
+        completed.status = GameStatus.COMPLETED
+        for game in (completed, idle, active):
+            repository.save(game)
+
+        clock.advance(50)
+        repository.get(active.id)
+        assert repository.evict_expired() == 1
+        assert repository.get(completed.id) is None
+
+        clock.advance(60)
+        assert repository.evict_expired() == 1
+        assert repository.get(idle.id) is None
+        assert repository.get(active.id) is active
+
+    def test_concurrent_access(self):
+        repository = ShardedInMemoryGameRepository(shard_count=16)
+
+        def worker():
+            for _ in range(500):
+                game = new_game()
+                repository.save(game)
+                assert repository.get(game.id) is game
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(repository) == 4000
@@ -0,0 +1,241 @@
+import sqlite3
+import threading
+import pytest
+from src.application.services.game_service import GameService
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.strategy import Strategy
+from src.domain.value_objects.end_condition import BestOf
+from src.domain.value_objects.move import Move
+from src.infrastructure.repositories import sqlite_game_repository
+from src.infrastructure.repositories.sqlite_game_repository import SQLiteGameRepository
+
+class TestSQLiteGameRepository:
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        repository = SQLiteGameRepository(str(tmp_path / "games.db"))
+        yield repository
+        repository.close()
+
+    @pytest.fixture
+    def game_service(self, repository):
+        return GameService(repository)
+
+    def test_save_and_get_round_trip(self, game_service, repository):
+        game = game_service.start_game("Alice", "Bob")
+        game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        game_service.make_move(game.id, game.player2.id, Move.SCISSORS)
+        game_service.make_move(game.id, game.player1.id, Move.PAPER)
+
+        loaded = repository.get(game.id)
+
+        assert loaded is not game
+        assert loaded.id == game.id
+        assert loaded.player1.id == game.player1.id
+        assert loaded.player2.name == "Bob"
+        assert loaded.scores == {game.player1.id: 1, game.player2.id: 0}
+        assert loaded.current_moves == {game.player1.id: Move.PAPER, game.player2.id: None}
+        assert loaded.last_round_moves == {game.player1.id: Move.ROCK, game.player2.id: Move.SCISSORS}
+        assert loaded.last_round_winner == game.player1.id
+        assert loaded.round_number == 1
+        assert loaded.status == GameStatus.ONGOING
+
+    def test_end_condition_round_trip(self, game_service, repository):
+        game = game_service.start_game("Alice", "Bob", end_condition=BestOf(3))
+        game_service.make_move(game.id, game.player1.id, Move.ROCK)
+        game_service.make_move(game.id, game.player2.id, Move.SCISSORS)
+
+        loaded = repository.get(game.id)
+        assert loaded.end_condition == BestOf(3)
+        loaded.make_move(game.player1.id, Move.ROCK)
+        loaded.make_move(game.player2.id, Move.SCISSORS)
+        repository.save(loaded)
+
+        assert repository.get(game.id).status == GameStatus.COMPLETED
+        assert repository.get(game_service.start_game("Carol", "Dan").id).end_condition is None
+
+    def test_adds_the_rng_column_to_older_databases(self, tmp_path):
+        path = str(tmp_path / "games.db")
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE games (id TEXT PRIMARY KEY, status TEXT NOT NULL, round_number INTEGER NOT NULL, "
+                "last_round_winner_id TEXT, end_condition TEXT)"
+            )
+        connection.close()
+        repository = SQLiteGameRepository(path)
+        game = GameService(repository, seed=1).start_game("Alice", "Computer", vs_computer=True)
+
+        assert str(repository.get(game.id).rng) == str(game.rng)
+        repository.close()
+
+    def test_computer_strategy_survives_reload(self, repository):
+        game_service = GameService(repository, seed=1)
+        game = game_service.start_game("Alice", "Computer", vs_computer=True, computer_strategy=MarkovStrategy(1))
+        for move in [Move.ROCK, Move.PAPER] * 5:
+            game = game_service.make_move(game.id, game.player1.id, move)
+
+        loaded = repository.get(game.id)
+
+        assert isinstance(loaded.player2.strategy, MarkovStrategy)
+        assert loaded.player2.strategy.get_state() == game.player2.strategy.get_state()
+        assert loaded.player1.strategy is None
+
+    def test_rejects_strategies_it_cannot_store(self, repository):
+        class AlwaysRock(Strategy):
+            def choose(self, rng):
+                return Move.ROCK
+
+        with pytest.raises(ValueError):
+            GameService(repository).start_game("Alice", "Computer", vs_computer=True, computer_strategy=AlwaysRock())
+
+    def test_get_missing_game_returns_none(self, repository):
+        assert repository.get("missing") is None
+
+    def test_delete_and_list_all(self, game_service, repository):
+        game1 = game_service.start_game("Alice", "Bob")
+        game2 = game_service.start_game("Carol", "Computer", vs_computer=True)
+
+        repository.delete(game1.id)
+
+        assert repository.get(game1.id) is None
+        assert [game.id for game in repository.list_all()] == [game2.id]
+        assert repository.list_all()[0].player2.is_computer
+
+    def test_delete_keeps_players_of_other_games(self, repository):
+        alice, bob = Player("Alice"), Player("Bob")
+        first, second = Game(alice, bob), Game(alice, Player("Carol"))
+        repository.save_many([first, second])
+
+        repository.delete(first.id)
+
+        assert repository.get(first.id) is None
+        assert repository.get(second.id).player1.id == alice.id
+        repository.delete(second.id)
+        assert repository.list_all() == []
+
+    def test_write_behind_buffers_until_flush(self, tmp_path):
+        path = str(tmp_path / "games.db")
+        repository = SQLiteGameRepository(path, write_behind=True, batch_size=100)
+        game_service = GameService(repository)
+        game = game_service.start_game("Alice", "Bob")
+        for _ in range(3):
+            game_service.make_move(game.id, game.player1.id, Move.PAPER)
+            game_service.make_move(game.id, game.player2.id, Move.ROCK)
+
+        reader = SQLiteGameRepository(path)
+        assert reader.get(game.id) is None
+        assert repository.get(game.id) is game
+
+        repository.flush()
+        assert reader.get(game.id).scores[game.player1.id] == 3
+        reader.close()
+        repository.close()
+
+    def test_concurrent_writers(self, repository):
+        game_service = GameService(repository)
+
+        def play():
+            for _ in range(20):
+                game = game_service.start_game("Alice", "Computer", vs_computer=True)
+                game_service.make_move(game.id, game.player1.id, Move.ROCK)
+
+        threads = [threading.Thread(target=play) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        games = repository.list_all()
+        assert len(games) == 80
+        assert all(game.round_number == 1 for game in games)
+
+    def test_round_history_is_persisted_once_per_round(self, game_service, repository):
+        game = game_service.start_game("Alice", "Bob")
+        for move in (Move.ROCK, Move.PAPER, Move.SCISSORS):
+            game_service.make_move(game.id, game.player1.id, move)
+            game_service.make_move(game.id, game.player2.id, Move.ROCK)
+
+        assert len(repository.get(game.id).history) == 0
+        history = repository.list_all()[0].history
+
+        assert [record.round_number for record in history] == [1, 2, 3]
+        assert [record.player1_move for record in history] == [Move.ROCK, Move.PAPER, Move.SCISSORS]
+        assert [record.winner_seat for record in history] == [None, 0, 1]
+
+    def test_iter_games_pages_through_games_in_id_order(self, game_service, repository):
+        games = [game_service.start_game(f"Player{index}", "Computer", vs_computer=True) for index in range(5)]
+        for index, game in enumerate(games):
+            for _ in range(index):
+                game_service.make_move(game.id, game.player1.id, Move.ROCK)
+
+        listed = list(repository.iter_games(page_size=2))
+
+        assert [game.id for game in listed] == sorted(game.id for game in games)
+        rounds = {game.id: [record.round_number for record in game.history] for game in listed}
+        assert rounds == {game.id: list(range(1, index + 1)) for index, game in enumerate(games)}
+
+    def test_rounds_of_a_failed_write_are_written_by_the_next_save(self, game_service, repository, monkeypatch):
+        game = game_service.start_game("Alice", "Computer", vs_computer=True)
+        write = repository._write
+
+        def fail_once(games, rounds):
+            monkeypatch.setattr(repository, "_write", write)
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(repository, "_write", fail_once)
+        game.make_move(game.player1.id, Move.ROCK)
+        with pytest.raises(sqlite3.OperationalError):
+            repository.save(game)
+        game.make_move(game.player1.id, Move.PAPER)
+        repository.save(game)
+
+        assert [record.round_number for record in repository.list_all()[0].history] == [1, 2]
+
+    def test_failed_flush_is_retried(self, tmp_path, monkeypatch):
+        repository = SQLiteGameRepository(str(tmp_path / "games.db"), write_behind=True)
+        game = GameService(repository).start_game("Alice", "Computer", vs_computer=True)
+        game.make_move(game.player1.id, Move.ROCK)
+        repository.save(game)
+        write = repository._write
+
+        def fail(games, rounds):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(repository, "_write", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            repository.flush()
+        monkeypatch.setattr(repository, "_write", write)
+        repository.flush()
+
+        assert [record.round_number for record in repository.list_all()[0].history] == [1]
+        repository.close()
+
+    def test_written_rounds_are_only_tracked_for_recent_games(self, game_service, repository, monkeypatch):
+        monkeypatch.setattr(sqlite_game_repository, "_MAX_TRACKED_GAMES", 2)
+        games = [game_service.start_game(f"Player{index}", "Computer", vs_computer=True) for index in range(3)]
+        for game in games:
+            game.make_move(game.player1.id, Move.ROCK)
+            repository.save(game)
+
+        assert list(repository._written_rounds) == [games[1].id, games[2].id]
+        # The evicted game writes its whole history window again, without duplicating rounds
+        games[0].make_move(games[0].player1.id, Move.PAPER)
+        repository.save(games[0])
+        history = next(game.history for game in repository.list_all() if game.id == games[0].id)
+        assert [record.round_number for record in history] == [1, 2]
+
+    def test_get_many_and_save_many(self, game_service, repository):
+        games = game_service.start_games([("Alice", "Bob"), ("Carol", "Dave"), ("Erin", "Frank")])
+        results = game_service.apply_moves(
+            [(game.id, game.player1.id, Move.ROCK) for game in games]
+            + [(game.id, game.player2.id, Move.SCISSORS) for game in games]
+        )
+        assert all(result.ok for result in results)
+
+        loaded = repository.get_many([games[0].id, "missing", games[2].id])
+
+        assert set(loaded) == {games[0].id, games[2].id}
+        assert all(game.scores[game.player1.id] == 1 for game in loaded.values())
+        assert all(game.round_number == 1 for game in loaded.values())
@@ -0,0 +1,114 @@
+import json
+import pickle
+import pytest
+from src.domain.entities.game import Game, GameStatus
+from src.domain.entities.player import Player
+from src.domain.value_objects.end_condition import AnyOf, FirstTo, RoundCap
+from src.domain.value_objects.move import Move
+from src.domain.value_objects.rng_stream import RngStream
+from src.infrastructure.serialization.game_codec import (
+    decode_game,
+    decode_games,
+    decode_player,
+    encode_game,
+    encode_games,
+    encode_player,
+    iter_games,
+)
+
+def state(game):
+    return (
+        game.id, game.player1.id, game.player1.name, game.player1.is_computer,
+        game.player2.id, game.player2.name, game.player2.is_computer,
+        game.status, game.round_number, dict(game.scores), dict(game.current_moves),
+        dict(game.last_round_moves), game.last_round_winner, game.end_condition,
+    )
+
+def played_game(end_condition=None):
+    game = Game(Player("Alice"), Player("Bob"), end_condition=end_condition)
+    game.make_move(game.player1.id, Move.ROCK)
+    game.make_move(game.player2.id, Move.SCISSORS)
+    game.make_move(game.player2.id, Move.PAPER)
+    return game
+
+class TestGameCodec:
+
+    def test_round_trips_every_field(self):
+        game = played_game(AnyOf((FirstTo(3), RoundCap(10))))
+        assert state(decode_game(encode_game(game))) == state(game)
+
+    def test_round_trips_the_position_of_the_rng_stream(self):
+        game = Game(Player("Alice"), Player("Computer", is_computer=True), rng=RngStream(7, (3,)))
+        for _ in range(5):
+            game.make_move(game.player1.id, Move.ROCK)
+
+        decoded = decode_game(encode_game(game))
+
+        assert str(decoded.rng) == str(game.rng)
+        assert decoded.rng.random() == game.rng.random()
+        assert decode_game(encode_game(played_game())).rng is None
+
+    @pytest.mark.parametrize("move", list(Move))
+    def test_round_trips_every_move_by_its_code(self, move):
+        game = Game(Player("Alice"), Player("Bob"))
+        game.make_move(game.player1.id, move)
+        game.make_move(game.player2.id, move)
+        game.make_move(game.player2.id, move)
+
+        decoded = decode_game(encode_game(game))
+
+        assert decoded.last_round_moves == {game.player1.id: move, game.player2.id: move}
+        assert decoded.current_moves == {game.player1.id: None, game.player2.id: move}
+
+    def test_round_trips_new_and_completed_games(self):
+        fresh = Game(Player("Alice"), Player("Computer", is_computer=True))
+        completed = Game(Player("Alice"), Player("Bob"), end_condition=FirstTo(1))
+        completed.make_move(completed.player1.id, Move.ROCK)
+        completed.make_move(completed.player2.id, Move.SCISSORS)
+        assert completed.status == GameStatus.COMPLETED
+
+        for game in (fresh, completed):
+            assert state(decode_game(encode_game(game))) == state(game)
+
+    def test_non_uuid_ids(self):
+        game = Game(
+            Player("Ünïcode", player_id="42"), Player("Bob", player_id="player-two"), game_id="0123",
+        )
+        decoded = decode_game(encode_game(game))
+        assert state(decoded) == state(game)
+
+    def test_uuid_ids_are_stored_as_16_bytes(self):
+        game = Game(Player("A"), Player("B"))
+        assert len(encode_game(game)) < 3 * 17 + 20
+
+    def test_player_round_trip(self):
+        player = Player("Computer", is_computer=True)
+        decoded = decode_player(encode_player(player))
+        assert (decoded.id, decoded.name, decoded.is_computer) == (player.id, player.name, True)
+
+    def test_bulk_round_trip_from_memoryview(self):
+        games = [played_game() for _ in range(100)]
+        buffer = bytearray(encode_games(games))
+
+        assert [state(game) for game in decode_games(memoryview(buffer))] == [state(game) for game in games]
+        assert next(iter_games(buffer)).id == games[0].id
+        assert decode_games(encode_games([])) == []
+
+    def test_is_smaller_than_pickle_and_json(self):
+        games = [played_game() for _ in range(50)]
+        as_json = json.dumps([
+            {"id": game.id, "scores": dict(game.scores), "players": [game.player1.name, game.player2.name]}
+            for game in games
+        ]).encode()
+        encoded = encode_games(games)
+        assert len(encoded) < len(pickle.dumps(games))
+        assert len(encoded) < len(as_json)
+
+    def test_rejects_invalid_input(self):
+        record = encode_game(played_game())
+        with pytest.raises(ValueError):
+            decode_game(record[:10])
+        with pytest.raises(ValueError):
+            decode_game(b"\x09" + record[1:])
+        with pytest.raises(ValueError):
+            decode_games(b"nope")
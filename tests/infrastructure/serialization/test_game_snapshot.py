@@ -0,0 +1,63 @@
+import pytest
+from src.domain.entities.game import Game
+from src.domain.entities.player import Player
+from src.domain.value_objects.move import Move
+from src.infrastructure.serialization.game_snapshot import GameSnapshot, write_snapshot
+
+def new_game():
+    game = Game(Player("Alice"), Player("Bob"))
+    game.make_move(game.player1.id, Move.ROCK)
+    game.make_move(game.player2.id, Move.SCISSORS)
+    return game
+
+class TestGameSnapshot:
+
+    def test_lookup_by_id(self, tmp_path):
+        path = str(tmp_path / "games.snapshot")
+        games = [new_game() for _ in range(200)]
+        assert write_snapshot(path, games) == 200
+
+        snapshot = GameSnapshot(path)
+        try:
+            assert len(snapshot) == 200
+            for game in games[::17]:
+                loaded = snapshot.get(game.id)
+                assert loaded is not game
+                assert loaded.scores == dict(game.scores)
+            assert snapshot.get("missing") is None
+        finally:
+            snapshot.close()
+
+    def test_copies_raw_records(self, tmp_path):
+        first, second = str(tmp_path / "first"), str(tmp_path / "second")
+        old, new = new_game(), new_game()
+        write_snapshot(first, [old])
+        snapshot = GameSnapshot(first)
+        try:
+            write_snapshot(second, [new], snapshot.records())
+        finally:
+            snapshot.close()
+
+        copied = GameSnapshot(second)
+        try:
+            assert copied.get(old.id).round_number == 1
+            assert copied.get(new.id).round_number == 1
+        finally:
+            copied.close()
+
+    def test_empty_snapshot(self, tmp_path):
+        path = str(tmp_path / "empty")
+        write_snapshot(path, [])
+        snapshot = GameSnapshot(path)
+        try:
+            assert len(snapshot) == 0
+            assert snapshot.get("anything") is None
+            assert list(snapshot.records()) == []
+        finally:
+            snapshot.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "not-a-snapshot"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            GameSnapshot(str(path))
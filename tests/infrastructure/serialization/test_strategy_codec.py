@@ -0,0 +1,48 @@
+import random
+import pytest
+from src.domain.strategies.frequency_strategy import FrequencyStrategy
+from src.domain.strategies.markov_strategy import MarkovStrategy
+from src.domain.strategies.mixture_of_experts_strategy import MixtureOfExpertsStrategy
+from src.domain.strategies.strategy import RANDOM, Strategy
+from src.domain.value_objects.move import Move
+from src.infrastructure.serialization.strategy_codec import decode_strategy, encode_strategy
+
+def train(strategy, rounds=60):
+    rng = random.Random(1)
+    for index in range(rounds):
+        strategy.observe(strategy.choose(rng), (Move.ROCK, Move.ROCK, Move.PAPER)[index % 3])
+    return strategy
+
+def moves(strategy, rounds=30):
+    rng = random.Random(2)
+    played = []
+    for index in range(rounds):
+        played.append(strategy.choose(rng))
+        strategy.observe(played[-1], (Move.SCISSORS, Move.ROCK)[index % 2])
+    return played
+
+class TestStrategyCodec:
+
+    @pytest.mark.parametrize("factory", [FrequencyStrategy, lambda: MarkovStrategy(3), MixtureOfExpertsStrategy])
+    def test_round_trips_the_learned_model(self, factory):
+        strategy = train(factory())
+        copy = decode_strategy(encode_strategy(strategy))
+
+        assert type(copy) is type(strategy)
+        assert moves(copy) == moves(strategy)
+
+    def test_default_strategy_is_stored_as_nothing(self):
+        assert encode_strategy(RANDOM) is None
+        assert decode_strategy(None) is None
+
+    def test_rejects_unknown_strategies_and_states(self):
+        class AlwaysRock(Strategy):
+            def choose(self, rng):
+                return Move.ROCK
+
+        with pytest.raises(ValueError):
+            encode_strategy(AlwaysRock())
+        with pytest.raises(ValueError):
+            decode_strategy('{"kind": "oracle"}')
+        with pytest.raises(ValueError):
+            decode_strategy('{"kind": "markov", "order": 2, "counts": []}')
@@ -0,0 +1,112 @@
+import asyncio
+import json
+from src.application.services.async_game_service import AsyncGameService
+from src.infrastructure.repositories.async_in_memory_game_repository import AsyncInMemoryGameRepository
+from src.infrastructure.repositories.in_memory_game_archive import InMemoryGameArchive
+from src.server import GameServer
+
+class TestGameServer:
+
+    def run(self, scenario):
+        async def wrapper():
+            game_server = self.game_server = GameServer(
+                AsyncGameService(AsyncInMemoryGameRepository(), archive=InMemoryGameArchive())
+            )
+            server = await asyncio.start_server(game_server.handle_connection, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            try:
+                return await scenario(port)
+            finally:
+                server.close()
+                await server.wait_closed()
+        return asyncio.run(wrapper())
+
+    async def send(self, writer, reader, **request):
+        writer.write(json.dumps(request).encode() + b"\n")
+        return json.loads(await reader.readline())
+
+    def test_round_results_are_pushed_to_both_players(self):
+        async def scenario(port):
+            reader1, writer1 = await asyncio.open_connection("127.0.0.1", port)
+            reader2, writer2 = await asyncio.open_connection("127.0.0.1", port)
+            started = await self.send(writer1, reader1, id=1, op="start_game", player1_name="Alice", player2_name="Bob")
+            game = started["game"]
+            player1, player2 = (player["id"] for player in game["players"])
+            joined = await self.send(writer2, reader2, id=2, op="join", game_id=game["id"])
+
+            first = await self.send(writer1, reader1, id=3, op="make_move", game_id=game["id"], player_id=player1, move="rock")
+            push2 = await self.send(writer2, reader2, id=4, op="make_move", game_id=game["id"], player_id=player2, move="scissors")
+            response2 = json.loads(await reader2.readline())
+            push1 = json.loads(await reader1.readline())
+            for writer in (writer1, writer2):
+                writer.close()
+            return started, joined, first, push1, push2, response2, player1
+
+        started, joined, first, push1, push2, response2, player1 = self.run(scenario)
+
+        assert started["id"] == 1 and started["ok"]
+        assert joined["game"]["id"] == started["game"]["id"]
+        assert first["game"]["waiting_for"] == [started["game"]["players"][1]["id"]]
+        assert first["game"]["last_round_moves"] == {}
+        for message in (push1, push2):
+            assert message["event"] == "round_result"
+            assert message["game"]["last_round_winner"] == player1
+            assert message["game"]["scores"][player1] == 1
+        assert response2["id"] == 4 and response2["ok"]
+
+    def test_errors_are_reported(self):
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            unknown_op = await self.send(writer, reader, id=1, op="dance")
+            unknown_game = await self.send(writer, reader, id=2, op="join", game_id="missing")
+            missing_field = await self.send(writer, reader, id=3, op="start_game")
+            writer.close()
+            return unknown_op, unknown_game, missing_field
+
+        unknown_op, unknown_game, missing_field = self.run(scenario)
+
+        assert unknown_op == {"id": 1, "ok": False, "error": "Unknown op: dance"}
+        assert unknown_game["error"] == "Game not found."
+        assert missing_field["ok"] is False
+
+    def test_moves_on_missing_games_leave_no_subscription(self):
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            response = await self.send(
+                writer, reader, id=1, op="make_move", game_id="missing", player_id="nobody", move="rock",
+            )
+            writer.close()
+            return response
+
+        response = self.run(scenario)
+
+        assert response == {"id": 1, "ok": False, "error": "Game not found."}
+        assert self.game_server._subscribers == {}
+
+    def test_completed_games_drop_their_subscriptions(self):
+        async def scenario(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            started = await self.send(
+                writer, reader, id=1, op="start_game", player1_name="Alice", vs_computer=True,
+                end_condition="first_to:1",
+            )
+            game_id, player_id = started["game"]["id"], started["game"]["players"][0]["id"]
+            subscribed = set(self.game_server._subscribers)
+            moves = 0
+            while True:
+                moves += 1
+                response = await self.send(
+                    writer, reader, id=moves, op="make_move", game_id=game_id, player_id=player_id, move="rock",
+                )
+                if response.get("event") == "round_result":
+                    response = json.loads(await reader.readline())
+                if response["game"]["status"] == "completed":
+                    break
+            subscriptions = dict(self.game_server._subscribers)
+            writer.close()
+            return game_id, subscribed, subscriptions
+
+        game_id, subscribed, subscriptions = self.run(scenario)
+
+        assert subscribed == {game_id}
+        assert subscriptions == {}